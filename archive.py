@@ -0,0 +1,77 @@
+import shelve
+
+
+class CharacterArchive:
+    """Records of deceased characters, kept out of World.characters so stepping never touches them
+    
+    Records live in a dict by default, or in a shelve file on disk when a path is given.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path
+        self._records = shelve.open(path) if path else {}
+    
+    def add(self, person, year=None):
+        """Archive a dead character as a plain record keyed by its id"""
+        # Family comes from the dynasty index, which keeps every link by id; the Person's own tuples
+        # lose relatives as they are archived in turn
+        dynasty = person.population.dynasty
+        record = {
+            "id": person.id,
+            "name": person.name,
+            "gender": person.gender,
+            "occupation": person.occupation,
+            "age": person.age,
+            "wealth": person.wealth,
+            "reputation": person.reputation,
+            "traits": list(person.traits),
+            "spouse": person.spouse.id if person.spouse else None,
+            "parents": list(dynasty.parents.get(person.id, ())),
+            "children": list(dynasty.children.get(person.id, ())),
+            "events": list(person.events),
+            "died": year
+        }
+        self._records[self._key(person.id)] = record
+        return record
+    
+    def load(self, records):
+        """Add records as saved by World.save_state (add()'s format, events included)"""
+        for record in records:
+            self._records[self._key(record["id"])] = record
+    
+    def get(self, char_id, default=None):
+        return self._records.get(self._key(char_id), default)
+    
+    def __contains__(self, char_id):
+        return self._key(char_id) in self._records
+    
+    def __len__(self):
+        return len(self._records)
+    
+    def records(self):
+        """Iterate over every archived record"""
+        return iter(self._records.values())
+    
+    def ancestors(self, char_id):
+        """Archived ancestors of a character, nearest generation first"""
+        found = []
+        frontier = list(self.get(char_id, {}).get("parents", []))
+        seen = set()
+        while frontier:
+            parent_id = frontier.pop(0)
+            if parent_id in seen:
+                continue
+            seen.add(parent_id)
+            record = self.get(parent_id)
+            if record:
+                found.append(record)
+                frontier.extend(record["parents"])
+        return found
+    
+    def close(self):
+        if self.path:
+            self._records.close()
+    
+    def _key(self, char_id):
+        # shelve only accepts string keys
+        return str(char_id) if self.path else char_id
@@ -0,0 +1,109 @@
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections import deque
+from life_events import SEASONS, EventRecord
+from save_catalog import SaveCatalog, save_size, summary
+from save_format import SAVE_EXTENSION
+from save_journal import SaveJournal, clone
+from save_writer import BackgroundSaver
+
+AUTOSAVE_SLOTS = 3
+AUTOSAVE_PREFIX = "autosave_"  # Slot files are autosave_1.sav, autosave_2.sav, ...
+
+
+def is_autosave(path):
+    return os.path.basename(path).startswith(AUTOSAVE_PREFIX)
+
+
+class AutosaveRing:
+    """A fixed ring of autosave slots, each a journaled save, written in turn on the save thread
+    
+    Every save goes to the slot after the last one, so the newest few states survive a bad
+    season or a crash mid-write. A slot that already holds this game only appends what changed
+    since its previous save, and rewrites its snapshot once that journal outgrows half the
+    snapshot (or 64 KB, for small saves), so disk use stays bounded however long the game runs.
+    The calling thread only copies the state's containers; timings keeps what that cost each time.
+    """
+    
+    def __init__(self, directory, saver, slots=AUTOSAVE_SLOTS, **journal_options):
+        self.directory = directory
+        self.saver = saver  # save_writer.BackgroundSaver shared with manual saves
+        paths = [os.path.join(directory, f"{AUTOSAVE_PREFIX}{i + 1}{SAVE_EXTENSION}") for i in range(slots)]
+        # Journals start without a shadow, so each slot's first save here is a fresh snapshot
+        self.journals = [SaveJournal(path, **journal_options) for path in paths]
+        # Carry on from the slot written longest ago, also across sessions
+        ages = [os.path.getmtime(path) if os.path.exists(path) else 0 for path in paths]
+        self.next_slot = ages.index(min(ages))
+        self.timings = deque(maxlen=100)  # Seconds each save() spent on the calling thread
+    
+    def save(self, state, on_done=None):
+        """Queue state for the next slot and return the seconds spent doing so"""
+        start = time.perf_counter()
+        journal = self.journals[self.next_slot]
+        self.next_slot = (self.next_slot + 1) % len(self.journals)
+        snapshot = clone(state)
+        self.saver.submit(lambda: self.write(journal, snapshot), on_done, key=journal.path)
+        cost = time.perf_counter() - start
+        self.timings.append(cost)
+        return cost
+    
+    def write(self, journal, snapshot):
+        # Runs on the save writer thread
+        written = journal.save(snapshot)
+        SaveCatalog(self.directory).record(journal.path, snapshot["summary"])
+        return written
+    
+    def disk_usage(self):
+        """Bytes the slots take on disk, snapshots and journals together"""
+        return sum(save_size(journal.path) for journal in self.journals if os.path.exists(journal.path))
+    
+    def report(self):
+        if not self.timings:
+            return "No autosaves yet"
+        return (f"Autosave: {statistics.mean(self.timings) * 1000:.2f}ms on average, "
+                f"{max(self.timings) * 1000:.2f}ms at most over the last {len(self.timings)} seasons; "
+                f"{self.disk_usage() / 1024:.0f} KB in {len(self.journals)} slots")
+
+
+def game_state(kingdoms, season, events):
+    # Shaped like MedievalSimulator.save_state, with an event log that grows every season
+    year, season_index = divmod(season, 4)
+    return {
+        "player": {"name": "Bench", "occupation": "Merchant", "age": 20 + year, "wealth": 100 + season,
+                   "events": [EventRecord(i % 50, i, ("Crownhaven", i)) for i in range(events)]},
+        "world": {"seed": 0, "kingdoms": kingdoms},
+        "current_year": 1200 + year,
+        "current_season": SEASONS[season_index],
+        "season_index": season_index,
+        "summary": summary("journal", "Bench", "Merchant", 1200 + year, SEASONS[season_index], season)
+    }
+
+
+def main(argv=None):
+    from world_generator import WorldGenerator
+    parser = argparse.ArgumentParser(description="Time autosaves on the season-advance path")
+    parser.add_argument("-k", "--kingdoms", type=int, default=2)
+    parser.add_argument("-s", "--seasons", type=int, default=200)
+    parser.add_argument("--slots", type=int, default=AUTOSAVE_SLOTS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    kingdoms = {name: data for name, data in WorldGenerator(args.seed, args.kingdoms).generate()
+                if data["type"] == "kingdom"}
+    with tempfile.TemporaryDirectory() as directory:
+        saver = BackgroundSaver()
+        ring = AutosaveRing(directory, saver, args.slots)
+        peak = 0
+        for season in range(args.seasons):
+            ring.save(game_state(kingdoms, season, events=2 * season))
+            saver.flush()
+            peak = max(peak, ring.disk_usage())
+        print(ring.report())
+        print(f"peak {peak / 1024:.0f} KB on disk over {args.seasons} seasons")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Characters come of age, and can inherit, at 16
+ADULT_AGE = 16
+
+_MISSING = object()
+
+
+class DynastyIndex:
+    """Parent/child adjacency over character ids with cached succession
+    
+    Succession follows primogeniture: a head's eldest child and that child's line come first,
+    then the next child's line, and so on. Each head's resolved heir is cached together with the
+    eldest minor passed over on the way to it, so a check only redoes work after a birth or
+    death in the line, or once that minor comes of age.
+    """
+    
+    def __init__(self, store):
+        self.store = store  # Ages and alive flags are read from the population columns
+        self.children = {}  # parent id -> child ids, eldest first
+        self.parents = {}   # child id -> parent ids
+        self.members = {}   # id -> Person, for everyone with a recorded parent or child
+        self._succession = {}  # head id -> succession order (list of ids)
+        self._heirs = {}  # head id -> (heir id or None, eldest skipped minor id or None)
+    
+    def add_child(self, parent, child):
+        """Record a birth (or adoption) and invalidate the lines it changes"""
+        self.members[parent.id] = parent
+        self.members[child.id] = child
+        
+        siblings = self.children.setdefault(parent.id, [])
+        ages = self.store.age
+        # Everyone ages together, so ordering by age at insertion stays correct for the living
+        pos = 0
+        while pos < len(siblings) and ages[siblings[pos]] >= ages[child.id]:
+            pos += 1
+        siblings.insert(pos, child.id)
+        self.parents.setdefault(child.id, []).append(parent.id)
+        self.invalidate(parent.id)
+    
+    def retire(self, person_id):
+        """Drop an archived character's Person; its id stays in the tree for succession and genealogy"""
+        self.members.pop(person_id, None)
+    
+    def invalidate(self, person_id):
+        """Forget cached succession for a character and everyone they descend from"""
+        frontier = [person_id]
+        seen = set()
+        while frontier:
+            current = frontier.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            self._succession.pop(current, None)
+            self._heirs.pop(current, None)
+            frontier.extend(self.parents.get(current, ()))
+    
+    def succession_order(self, head):
+        """Every descendant of head, in line of succession"""
+        order = self._succession.get(head)
+        if order is None:
+            order = []
+            stack = list(reversed(self.children.get(head, ())))
+            while stack:
+                current = stack.pop()
+                order.append(current)
+                stack.extend(reversed(self.children.get(current, ())))
+            self._succession[head] = order
+        return order
+    
+    def heir_id(self, head):
+        """Id of the first living adult in head's line of succession, or None"""
+        cached = self._heirs.get(head, _MISSING)
+        if cached is not _MISSING:
+            heir, blocker = cached
+            if blocker is None or self.store.age[blocker] < ADULT_AGE:
+                return heir
+        
+        alive = self.store.alive
+        ages = self.store.age
+        heir = None
+        blocker = None
+        for candidate in self.succession_order(head):
+            if not alive[candidate]:
+                continue
+            if ages[candidate] >= ADULT_AGE:
+                heir = candidate
+                break
+            # Skipped for being too young; the eldest such minor is the first who could overtake
+            if blocker is None or ages[candidate] > ages[blocker]:
+                blocker = candidate
+        self._heirs[head] = (heir, blocker)
+        return heir
+    
+    def heir(self, head):
+        """The nearest living heir of head as a Person, or None"""
+        heir = self.heir_id(head)
+        return self.members[heir] if heir is not None else None
+    
+    def ancestors(self, person_id):
+        """Ancestor ids, nearest generation first"""
+        found = []
+        seen = set()
+        frontier = list(self.parents.get(person_id, ()))
+        while frontier:
+            next_frontier = []
+            for ancestor in frontier:
+                if ancestor not in seen:
+                    seen.add(ancestor)
+                    found.append(ancestor)
+                    next_frontier.extend(self.parents.get(ancestor, ()))
+            frontier = next_frontier
+        return found
+    
+    def descendants(self, person_id):
+        """Descendant ids in line-of-succession order"""
+        return list(self.succession_order(person_id))
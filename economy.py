@@ -0,0 +1,123 @@
+import numpy as np
+from lod import NOT_SETTLEMENT, AGGREGATE
+
+NATURAL_GROWTH = 0.002 / 4  # Seasonal births minus deaths where no cohort model runs (aggregate tier)
+STABILITY_TARGET = 60  # Kingdoms settle back toward this when left alone
+
+
+class SettlementEconomy:
+    """Prosperity, stability and growth for every settlement and kingdom, stepped as whole arrays
+    
+    The arrays here are authoritative, so events go through adjust_prosperity and adjust_stability;
+    location dicts hold rounded copies, refreshed for the player's kingdom each season and for
+    everything on sync(). Head counts live in the LodManager's cohorts.
+    """
+    
+    def __init__(self, world, state=None):
+        self.world = world
+        self.rng = world.random.generator("economy")
+        lod = world.lod
+        self.settlements = np.flatnonzero(lod.tier != NOT_SETTLEMENT)
+        self.kingdoms = np.flatnonzero(lod.tier == NOT_SETTLEMENT)
+        self.kingdom_of = lod.kingdom_of[self.settlements]
+        # Registry id -> row in the settlement arrays
+        self.row = np.full(len(lod.tier), -1, dtype=np.int64)
+        self.row[self.settlements] = np.arange(len(self.settlements))
+        
+        if state is not None:
+            # A loaded save's arrays, copied so they can be stepped in place
+            self.is_village = np.array(state["is_village"])
+            self.prosperity = np.array(state["prosperity"])
+            self.kingdom_prosperity = np.array(state["kingdom_prosperity"])
+            self.stability = np.array(state["stability"])
+            return
+        registry = world.registry
+        self.is_village = np.array([registry.type_of(registry.names[i]) == "village" for i in self.settlements])
+        self.prosperity = np.array([world.locations[registry.names[i]].get("prosperity", 50)
+                                    for i in self.settlements], dtype=float)
+        # Kingdom values are indexed by registry id so settlements can gather them directly
+        self.kingdom_prosperity = np.zeros(len(registry))
+        self.stability = np.zeros(len(registry))
+        self.kingdom_prosperity[self.kingdoms] = [world.locations[registry.names[k]]["prosperity"] for k in self.kingdoms]
+        self.stability[self.kingdoms] = [world.locations[registry.names[k]]["stability"] for k in self.kingdoms]
+    
+    def state(self):
+        # For World.save_state
+        return {"prosperity": self.prosperity, "stability": self.stability,
+                "kingdom_prosperity": self.kingdom_prosperity, "is_village": self.is_village}
+    
+    def adjust_prosperity(self, settlements, delta):
+        """Shift named settlements' prosperity, e.g. from a trade boom"""
+        rows = self.row[[self.world.registry.ids[name] for name in settlements]]
+        self.prosperity[rows] = np.clip(self.prosperity[rows] + delta, 0, 100)
+    
+    def adjust_stability(self, kingdom, delta):
+        """Shift a kingdom's stability, e.g. from a festival"""
+        k = self.world.registry.ids[kingdom]
+        self.stability[k] = min(max(self.stability[k] + delta, 0), 100)
+        self.world.locations[kingdom]["stability"] = int(np.rint(self.stability[k]))
+    
+    def event_pressure(self):
+        # Per-kingdom war intensity and famine flags from the (few) active events
+        ids = self.world.registry.ids
+        war = np.zeros(len(self.stability))
+        famine = np.zeros(len(self.stability), dtype=bool)
+        for event in self.world.current_events:
+            if event["type"] == "war":
+                for kingdom in event["participants"]:
+                    war[ids[kingdom]] += event["intensity"]
+            elif event["type"] == "famine":
+                famine[ids[event["participants"][0]]] = True
+        return war, famine
+    
+    def step(self):
+        """One season of economy for every settlement and kingdom at once"""
+        world = self.world
+        war, famine = self.event_pressure()
+        
+        # Kingdom stability: wars and famine erode it, peace slowly restores it
+        self.stability += (STABILITY_TARGET - self.stability) * 0.05 - war * 0.3 - famine * 2.0
+        np.clip(self.stability, 0, 100, out=self.stability)
+        
+        # Settlement prosperity drifts toward what its kingdom's stability supports
+        stability = self.stability[self.kingdom_of]
+        target = 30 + stability * 0.6
+        self.prosperity += (target - self.prosperity) * 0.05 + self.rng.normal(0, 1, len(self.prosperity))
+        self.prosperity -= war[self.kingdom_of] * 0.2 + (famine[self.kingdom_of] & self.is_village) * 2.0
+        np.clip(self.prosperity, 0, 100, out=self.prosperity)
+        
+        # Population: prosperity attracts people, famine drives them off; distant settlements, which
+        # have no cohort model running, also get the natural growth rate
+        growth = (self.prosperity - 50) / 20000 - (famine[self.kingdom_of] & self.is_village) * 0.01
+        growth += np.where(world.lod.tier[self.settlements] == AGGREGATE, NATURAL_GROWTH, 0.0)
+        world.lod.cohorts[self.settlements] *= (1 + growth)[:, None]
+        
+        # Kingdom prosperity follows its settlements, weighted by head count
+        population = world.lod.cohorts[self.settlements].sum(axis=1)
+        weighted = np.bincount(self.kingdom_of, weights=self.prosperity * population, minlength=len(self.stability))
+        totals = np.bincount(self.kingdom_of, weights=population, minlength=len(self.stability))
+        mean = np.divide(weighted, totals, out=self.kingdom_prosperity.copy(), where=totals > 0)
+        self.kingdom_prosperity += (mean - self.kingdom_prosperity) * 0.25
+        
+        self.write_kingdoms()
+        self.write_back(world.lod.near)
+    
+    def write_kingdoms(self):
+        locations = self.world.locations
+        names = self.world.registry.names
+        for k, prosperity, stability in zip(self.kingdoms.tolist(),
+                                            np.rint(self.kingdom_prosperity[self.kingdoms]).tolist(),
+                                            np.rint(self.stability[self.kingdoms]).tolist()):
+            locations[names[k]]["prosperity"] = int(prosperity)
+            locations[names[k]]["stability"] = int(stability)
+    
+    def write_back(self, ids):
+        # Publish prosperity of the given settlement ids to their location dicts
+        locations = self.world.locations
+        names = self.world.registry.names
+        for location_id, prosperity in zip(ids.tolist(), np.rint(self.prosperity[self.row[ids]]).tolist()):
+            locations[names[location_id]]["prosperity"] = int(prosperity)
+    
+    def sync(self):
+        """Write every settlement's prosperity back, e.g. before saving"""
+        self.write_back(self.settlements)
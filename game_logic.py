@@ -1,45 +1,154 @@
 import random
 import json
 import os
+import time
 from datetime import datetime
+import numpy as np
+from population import (PopulationStore, SkillsView, TRAITS, column_property, decode_traits,
+                        default_population, encode_traits)
+from world_rng import RandomStreams
+from archive import CharacterArchive
+from life_events import EVENT_TEMPLATES, SEASONS, EventRecord, timestamp
+from relationships import RelationsView, RelationshipGraph
+from timeline import Timeline
+from world_events import WorldEventEngine
+from locations import LocationRegistry, SavedLocations, location_section
+from spatial import SpatialIndex, layout
+from lod import LodManager
+from economy import SettlementEconomy
+from routes import RouteNetwork
+from save_format import SAVE_EXTENSION, SaveFile, without_gc, write_save
+from save_writer import atomic_write
+from save_catalog import SUMMARY_SECTION, SaveCatalog, format_play_time, format_size, summary
+
+# Every relationship fades this much toward neutral each season unless renewed
+RELATIONSHIP_DECAY = 0.99
 
 class Person:
-    def __init__(self, name, age, gender, occupation, traits=None, skills=None, relations=None):
+    # No per-instance __dict__: a million residents should cost bytes, not kilobytes, each
+    __slots__ = ("_store", "id", "name", "gender", "occupation", "spouse",
+                 "children", "parents", "events")
+    
+    # Numeric state lives in a PopulationStore row; these read and write it directly
+    age = column_property("age")
+    health = column_property("health")
+    wealth = column_property("wealth")
+    reputation = column_property("reputation")
+    location = column_property("location")  # Home settlement's registry id, -1 if none
+    
+    def __init__(self, name, age, gender, occupation, traits=None, skills=None, relations=None, population=None,
+                 rng=None):
+        rng = rng or random  # Worlds pass their own character stream; standalone use falls back to random
+        self._store = population if population is not None else default_population
+        self.id = self._store.allocate()
         self.name = name
         self.age = age
         self.gender = gender
         self.occupation = occupation  # King, Knight, Farmer, etc.
-        self.traits = traits or self.generate_traits()
-        self.skills = skills or self.generate_skills()
+        self.traits = traits or self.generate_traits(rng)
+        self.skills = skills or self.generate_skills(rng)
         self.health = 100
-        self.wealth = self.starting_wealth()
-        self.relations = relations or {}  # key: person_id, value: relationship score (-100 to 100)
+        self.wealth = self.starting_wealth(rng)
+        if relations:
+            self.relations = relations  # key: person_id, value: relationship score (-100 to 100)
         self.spouse = None
-        self.children = []
-        self.parents = []
+        # Family and history start as shared empty tuples; most NPCs never get any, so no list per person
+        self.children = ()
+        self.parents = ()
         self.reputation = 50  # 0-100 scale
         self.alive = True
-        self.events = []  # History of life events
+        self.events = ()  # History of life events
+    
+    @classmethod
+    def restore(cls, population, person_id, name, gender, occupation, events=()):
+        """Rebuild a saved character around its existing row in population; no row is allocated"""
+        person = cls.__new__(cls)
+        person._store = population
+        person.id = person_id
+        person.name = name
+        person.gender = gender
+        person.occupation = occupation
+        person.spouse = None
+        person.children = ()
+        person.parents = ()
+        person.events = events or ()
+        return person
+    
+    @property
+    def skills(self):
+        return SkillsView(self._store, self.id)
+    
+    @skills.setter
+    def skills(self, values):
+        for skill, value in values.items():
+            self.skills[skill] = value
+    
+    @property
+    def relations(self):
+        # Scores live in the world-wide RelationshipGraph, not in a dict per person
+        return RelationsView(self._store.relationships, self.id)
+    
+    @relations.setter
+    def relations(self, values):
+        for person_id, score in values.items():
+            self._store.relationships.set(self.id, person_id, score)
+    
+    @property
+    def traits(self):
+        return decode_traits(self._store.traits[self.id])
+    
+    @traits.setter
+    def traits(self, traits):
+        self._store.traits[self.id] = encode_traits(traits)
+    
+    @property
+    def alive(self):
+        return bool(self._store.alive[self.id])
+    
+    @alive.setter
+    def alive(self, value):
+        # Routed through the store so its living index stays current
+        self._store.set_alive(self.id, value)
+    
+    @property
+    def population(self):
+        return self._store
+    
+    def add_child(self, child):
+        # Link parent and child both ways and record the birth in the dynasty index
+        self.children = self.children + (child,)
+        child.parents = child.parents + (self,)
+        self._store.dynasty.add_child(self, child)
+    
+    def log_event(self, template, *args, timestamp=None):
+        # Events are compact (template id, timestamp, args) records, rendered only when displayed
+        record = EVENT_TEMPLATES.record(template, timestamp, *args)
+        if self.events:
+            self.events.append(record)
+        else:
+            self.events = [record]
+    
+    def move_to(self, population):
+        # Re-home this character's row in another store (e.g. when a World adopts it)
+        self.id = self._store.copy_row(self.id, population)
+        self._store = population
         
-    def generate_traits(self):
+    def generate_traits(self, rng=random):
         # Personality traits influence dialogue options and event outcomes
-        all_traits = ["brave", "cowardly", "ambitious", "content", "honest", "deceitful", 
-                      "loyal", "treacherous", "kind", "cruel", "pious", "cynical"]
-        
         # Each person has 2-4 traits
-        num_traits = random.randint(2, 4)
-        return random.sample(all_traits, num_traits)
+        num_traits = rng.randint(2, 4)
+        return rng.sample(TRAITS, num_traits)
     
-    def generate_skills(self):
+    def generate_skills(self, rng=random):
         # Different skills for different occupations
         base_skills = {
-            "combat": random.randint(1, 10),
-            "diplomacy": random.randint(1, 10),
-            "stewardship": random.randint(1, 10),
-            "farming": random.randint(1, 10),
-            "crafting": random.randint(1, 10),
-            "medicine": random.randint(1, 10),
-            "trading": random.randint(1, 10)
+            "combat": rng.randint(1, 10),
+            "diplomacy": rng.randint(1, 10),
+            "stewardship": rng.randint(1, 10),
+            "farming": rng.randint(1, 10),
+            "crafting": rng.randint(1, 10),
+            "medicine": rng.randint(1, 10),
+            "trading": rng.randint(1, 10)
         }
         
         # Boost skills related to occupation
@@ -55,21 +164,21 @@ class Person:
         
         return base_skills
     
-    def starting_wealth(self):
+    def starting_wealth(self, rng=random):
         # Starting wealth based on occupation
         wealth_map = {
-            "King": random.randint(800, 1000),
-            "Noble": random.randint(400, 700),
-            "Knight": random.randint(200, 400),
-            "Merchant": random.randint(150, 300),
-            "Craftsman": random.randint(80, 200),
-            "Tavern Owner": random.randint(100, 250),
-            "Farmer": random.randint(30, 120),
-            "Beggar": random.randint(0, 20)
+            "King": rng.randint(800, 1000),
+            "Noble": rng.randint(400, 700),
+            "Knight": rng.randint(200, 400),
+            "Merchant": rng.randint(150, 300),
+            "Craftsman": rng.randint(80, 200),
+            "Tavern Owner": rng.randint(100, 250),
+            "Farmer": rng.randint(30, 120),
+            "Beggar": rng.randint(0, 20)
         }
         return wealth_map.get(self.occupation, 50)
     
-    def age_up(self):
+    def age_up(self, rng=random):
         self.age += 1
         # Check for natural death chance based on age
         if self.age > 40:  # Medieval life expectancy was low
@@ -77,35 +186,132 @@ class Person:
             if self.health < 50:
                 death_chance += 10  # Poor health increases death chance
             
-            if random.randint(1, 100) <= death_chance:
+            if rng.randint(1, 100) <= death_chance:
                 self.die(cause="Natural causes")
                 return False
         return True
     
-    def die(self, cause="Unknown"):
+    def die(self, cause="Unknown", timestamp=None):
         self.alive = False
-        self.events.append(f"Died at age {self.age} due to {cause}")
+        self.log_event("Died at age {} due to {}", self.age, cause, timestamp=timestamp)
         return self.get_heir()
     
     def get_heir(self):
-        # Return eldest child who can continue the lineage
-        if not self.children:
+        # Return the nearest living adult in the line of succession: the eldest child and their
+        # line first, then younger children. Cached in the dynasty index until the line changes.
+        if not self._store.dynasty.children.get(self.id):
             return None
-        
-        # Sort by age, oldest first
-        eligible_children = [child for child in self.children if child.age >= 16 and child.alive]
-        if eligible_children:
-            return eligible_children[0]
-        return None
+        return self._store.dynasty.heir(self.id)
+
+MALE_NAMES = ["William", "Robert", "John", "Richard", "Thomas", "Henry", "Edward", "Walter",
+              "Hugh", "Simon", "Geoffrey", "Adam", "Stephen", "Peter", "Nicholas", "Roger"]
+FEMALE_NAMES = ["Alice", "Agnes", "Matilda", "Margaret", "Joan", "Isabella", "Emma", "Cecilia",
+                "Eleanor", "Beatrice", "Juliana", "Katherine", "Margery", "Edith", "Mabel", "Constance"]
+OCCUPATIONS = ["King", "Noble", "Knight", "Merchant", "Farmer", "Craftsman", "Tavern Owner", "Beggar"]
+
+
+def character_row(person, living):
+    # A Person as a save record; family members go by id
+    return {
+        "id": person.id,
+        "name": person.name,
+        "gender": person.gender,
+        "occupation": person.occupation,
+        "living": living,
+        "spouse": person.spouse.id if person.spouse else -1,
+        "parents": [parent.id for parent in person.parents],
+        "children": [child.id for child in person.children]
+    }
+
+
+def events_by_owner(rows, templates=None):
+    # Saved (owner, template, timestamp, args) rows -> {owner: [EventRecord]}, template ids remapped
+    events = {}
+    for owner, template, stamp, args in rows:
+        record = EventRecord(template if templates is None else templates[template], stamp, args)
+        events.setdefault(owner, []).append(record)
+    return events
+
 
 class World:
-    def __init__(self):
+    def __init__(self, seed=None, announce=print, archive_path=None, generator=None, save=None):
+        # Given save (a save_format.SaveFile written from save_state), the world is restored rather
+        # than generated; see restore() for what is decoded up front
+        header = save.read("world") if save is not None else None
+        # Every subsystem draws from its own stream of this world's RNG, never the random module
+        self.random = RandomStreams(seed if header is None else header["seed"])
+        self.character_rng = self.random.stream("characters")
+        self.location_rng = self.random.stream("locations")
+        self.event_rng = self.random.stream("events")
+        self.personal_event_rng = self.random.stream("personal_events")
+        self.mortality_rng = self.random.generator("mortality")  # Drives batched death rolls
+        
         self.year = 1200
-        self.characters = {}  # All characters in the world
+        self.season = 0  # Seasons elapsed since the world began
+        if save is None:
+            self.population = PopulationStore()  # Columnar numeric state, indexed by character id
+        else:
+            graph = RelationshipGraph.from_arrays(**save.read("relationships"))
+            self.population = PopulationStore.from_columns(save.read("population"), graph)
+        self.relationships = self.population.relationships  # Sparse graph of every relationship score
+        self._characters = {}  # Living characters; the dead move to self.archive
+        self._archive = CharacterArchive(archive_path)  # Deceased characters, kept for genealogy and history
         self.player = None
-        self.locations = self.generate_locations()
+        self.announce = announce  # Where player-facing messages go (print for the console game)
+        self.unloaded = {}  # Save sections a loaded world has yet to decode: attribute -> loader
+        if save is None:
+            # The built-in two-kingdom map, or a world_generator.WorldGenerator's stream for larger worlds,
+            # registered entry by entry as it is generated. The registry gives O(1) type/kingdom/settlement lookups.
+            if generator is None:
+                self.locations = self.generate_locations()
+                self._registry = LocationRegistry.from_locations(self.locations)
+            else:
+                self.locations = {}
+                self._registry = LocationRegistry.from_stream(generator.generate(), self.locations)
+        else:
+            # Each kingdom's locations stay in the save until something looks one up
+            self.locations = SavedLocations(save, lambda: self.registry)
+            self.unloaded["registry"] = lambda: self.load_registry(save)
+        self.residents = None  # residents.SettlementResidents, created on first use
+        self.routes = None  # routes.RouteNetwork, built on first use
+        self.spatial = None  # spatial.SpatialIndex over settlement positions, built on first use
+        self.player_location = None  # Settlement the player is in; drives level-of-detail tiers
+        # Full, cohort or aggregate simulation per settlement
+        self.lod = LodManager(self, None if save is None else save.read("lod"))
+        # Prosperity, stability and growth as arrays
+        self.economy = SettlementEconomy(self, None if save is None else save.read("economy"))
         self.current_events = []  # Current active events
-        self.history = []  # Historical events
+        self.timeline = Timeline()  # Scheduled event starts, ticks and expiries, keyed by season
+        self.event_engine = WorldEventEngine()  # War, plague, festival, ... handlers
+        self._history = []  # Historical events, as life_events records
+        if save is not None:
+            self.restore(save, header)
+    
+    @property
+    def registry(self):
+        self.load_section("registry")
+        return self._registry
+    
+    @property
+    def characters(self):
+        self.load_section("characters")
+        return self._characters
+    
+    @property
+    def archive(self):
+        self.load_section("archive")
+        return self._archive
+    
+    @property
+    def history(self):
+        self.load_section("history")
+        return self._history
+    
+    def load_section(self, attribute):
+        # Decode a loaded world's saved section the first time its attribute is used
+        loader = self.unloaded.pop(attribute, None)
+        if loader is not None:
+            without_gc(loader)
         
     def generate_locations(self):
         # Generate kingdom, cities, villages, etc.
@@ -128,6 +334,9 @@ class World:
             }
         }
         
+        # Place the settlements on the map
+        positions = layout(locations, self.random.seed)
+        
         # Expand with details for each location
         all_locations = {}
         for kingdom, k_data in locations.items():
@@ -139,8 +348,9 @@ class World:
                     "type": "city",
                     "kingdom": kingdom,
                     "buildings": ["Castle", "Market", "Cathedral", "Blacksmith"],
-                    "population": random.randint(2000, 8000),
-                    "prosperity": random.randint(50, 90)
+                    "population": self.location_rng.randint(2000, 8000),
+                    "prosperity": self.location_rng.randint(50, 90),
+                    "position": positions[city]
                 }
             
             # Add villages
@@ -149,65 +359,295 @@ class World:
                     "type": "village",
                     "kingdom": kingdom,
                     "buildings": ["Tavern", "Mill", "Church", "Farms"],
-                    "population": random.randint(100, 1000),
-                    "prosperity": random.randint(30, 70)
+                    "population": self.location_rng.randint(100, 1000),
+                    "prosperity": self.location_rng.randint(30, 70),
+                    "position": positions[village]
                 }
         
         return all_locations
     
+    def add_character(self, person, home=None):
+        # Register a character, optionally at home in a settlement (by registry id); its id is its row
+        # in this world's population store
+        if person.population is not self.population:
+            person.move_to(self.population)
+        if home is not None:
+            person.location = home
+        self.characters[person.id] = person
+        self.lod.register(person)
+        return person
+    
+    def set_player_location(self, location):
+        # Moving the player re-tiers the simulation: residents here become Persons, far kingdoms aggregate
+        self.player_location = location
+        self.lod.focus(location)
+    
+    def sync_locations(self):
+        # Bring every location dict up to date with the array-based simulation (e.g. before saving)
+        self.lod.sync()
+        self.economy.sync()
+    
+    def save_state(self):
+        """The whole world as named save sections for save_format.write_save
+        
+        Numeric state goes out as arrays and characters and locations as tables of uniform records.
+        The sections follow what World(save=...) needs first: the header, arrays and the player's
+        own record stand alone, while the other characters, the archive, history and each
+        kingdom's locations are separate sections that a loaded world decodes on first use.
+        """
+        self.sync_locations()
+        self.relationships.compact()
+        store = self.population
+        dynasty = store.dynasty
+        # Every living character and living relative; the dead are in the archive
+        people = {}
+        frontier = [*self.characters.values(), *dynasty.members.values()]
+        while frontier:
+            person = frontier.pop()
+            if person.id not in people:
+                people[person.id] = person
+                frontier.extend(person.parents)
+                frontier.extend(person.children)
+                if person.spouse:
+                    frontier.append(person.spouse)
+        characters = [character_row(person, person.id in self._characters) for person in people.values()]
+        life_events = [(person.id, *record) for person in people.values() for record in person.events]
+        archive, archive_events = [], []
+        for record in self.archive.records():
+            archive.append({key: value for key, value in record.items() if key != "events"})
+            archive_events.extend((record["id"], *event) for event in record["events"])
+        edges = [(parent, child) for parent, children in dynasty.children.items() for child in children]
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        
+        sections = {
+            "world": {"seed": self.random.seed, "year": self.year, "season": self.season,
+                      "player": self.player.id if self.player else -1, "player_location": self.player_location,
+                      "random": self.random.state()},
+            "event_templates": EVENT_TEMPLATES.table(),  # Resolves every record's template id
+            "registry": self.registry.columns(),
+            "population": {name: store.column(name) for name in [*store.COLUMNS, "skills"]},
+            "relationships": {"indptr": self.relationships.indptr, "indices": self.relationships.indices,
+                              "weights": self.relationships.weights},
+            "lod": self.lod.state(),
+            "economy": self.economy.state(),
+            "player": self.player_record() if self.player else None,
+            "current_events": self.current_events,
+            "characters": characters,
+            "life_events": life_events,
+            "dynasty": {"parents": edges[:, 0], "children": edges[:, 1]},
+            "archive": archive,
+            "archive_events": archive_events,
+            "history": self.history
+        }
+        for name, data in self.locations.items():
+            sections.setdefault(location_section(self.registry, name), []).append({"name": name, **data})
+        return sections
+    
+    def player_record(self):
+        # The player and their immediate family, enough for the first frame after loading
+        family = {person.id: person for person in [self.player.spouse, *self.player.parents, *self.player.children]
+                  if person is not None and person is not self.player}
+        return {"player": {**character_row(self.player, True), "events": list(self.player.events)},
+                "family": [{**character_row(person, person.id in self._characters), "events": list(person.events)}
+                           for person in family.values()]}
+    
+    def restore(self, save, header):
+        """Resume a saved world: what the first frame needs now, everything else when first used
+        
+        The header, population and location arrays, active events and the player with their
+        immediate family are decoded here. The other characters, the archive, history and each
+        kingdom's locations stay in the memory-mapped file until something asks for them, so
+        opening a save costs about the same however large the world is.
+        """
+        self.year, self.season = header["year"], header["season"]
+        self.player_location = header["player_location"]
+        self.random.restore(header["random"])
+        templates = EVENT_TEMPLATES.adopt(save.read("event_templates"))
+        people = {}  # Persons restored so far, by id
+        if header["player"] >= 0:
+            record = save.read("player")
+            rows = [record["player"], *record["family"]]
+            for row in rows:
+                events = EVENT_TEMPLATES.remap(row["events"], templates)
+                person = people[row["id"]] = Person.restore(self.population, row["id"], row["name"], row["gender"],
+                                                            row["occupation"], events)
+                if row["living"]:
+                    self._characters[person.id] = person
+            self.link_family(people, ((row["id"], row["spouse"], row["parents"], row["children"]) for row in rows))
+            self.player = people[header["player"]]
+        for event in save.read("current_events"):
+            self.current_events.append(event)
+            self.event_engine.resume(self, event)
+        
+        self.unloaded["characters"] = lambda: self.load_characters(save, people, templates)
+        self.unloaded["archive"] = lambda: self.load_archive(save, templates)
+        self.unloaded["history"] = lambda: self._history.extend(EVENT_TEMPLATES.remap(save.read("history"), templates))
+    
+    def load_characters(self, save, people, templates):
+        # Every other saved character, their family links and events, and the dynasty index. The
+        # table is decoded as columns, so no dict is built per character.
+        columns = save.read("characters", columnar=True)
+        ids = columns["id"]
+        events = events_by_owner(save.read("life_events"), templates)
+        for person_id, name, gender, occupation, living in zip(ids, columns["name"], columns["gender"],
+                                                               columns["occupation"], columns["living"]):
+            if person_id not in people:
+                person = people[person_id] = Person.restore(self.population, person_id, name, gender, occupation,
+                                                            events.get(person_id))
+                if living:
+                    self._characters[person_id] = person
+        self.link_family(people, zip(ids, columns["spouse"], columns["parents"], columns["children"]))
+        
+        dynasty = self.population.dynasty
+        edges = save.read("dynasty")
+        for parent, child in zip(edges["parents"].tolist(), edges["children"].tolist()):
+            dynasty.children.setdefault(parent, []).append(child)  # Saved in line-of-succession order
+            dynasty.parents.setdefault(child, []).append(parent)
+            for member in (parent, child):
+                if member in people:  # Archived members are known by id alone
+                    dynasty.members[member] = people[member]
+    
+    def load_registry(self, save):
+        self._registry = LocationRegistry.from_columns(**save.read("registry"), source=self.locations)
+    
+    def load_archive(self, save, templates):
+        events = events_by_owner(save.read("archive_events"), templates)
+        self._archive.load({**record, "events": events.get(record["id"], [])} for record in save.read("archive"))
+    
+    @staticmethod
+    def link_family(people, rows):
+        # Point restored Persons at each other, given (id, spouse, parents, children) rows; ids not
+        # restored yet are left for a later pass
+        for person_id, spouse, parents, children in rows:
+            person = people[person_id]
+            person.spouse = people.get(spouse)
+            person.parents = tuple(filter(None, map(people.get, parents))) if parents else ()
+            person.children = tuple(filter(None, map(people.get, children))) if children else ()
+    
+    def get_residents(self):
+        # Settlement residents are generated on demand from the world seed
+        if self.residents is None:
+            from residents import SettlementResidents
+            self.residents = SettlementResidents(self.random.seed, self.registry, self.locations)
+        return self.residents
+    
+    def get_routes(self):
+        # The road network (travel times between settlements) is built on first use
+        if self.routes is None:
+            self.routes = RouteNetwork.from_locations(self.registry, self.locations, self.random.seed)
+        return self.routes
+    
+    def get_spatial(self):
+        # Nearest-neighbour and radius queries over settlement positions
+        if self.spatial is None:
+            self.spatial = SpatialIndex.from_locations(self.locations)
+        return self.spatial
+    
+    def timestamp(self):
+        # Current date as a life_events timestamp
+        return timestamp(self.year, self.season % 4)
+    
+    def get_character(self, char_id):
+        # Living character object, or the archived record of a dead one
+        character = self.characters.get(char_id)
+        if character is None:
+            return self.archive.get(char_id)
+        return character
+    
+    def random_character(self, age, home=None):
+        # Create and register a random commoner or noble of the given age
+        rng = self.character_rng
+        gender = rng.choice(["male", "female"])
+        name = rng.choice(MALE_NAMES if gender == "male" else FEMALE_NAMES)
+        return self.add_character(Person(name, age, gender, rng.choice(OCCUPATIONS),
+                                         population=self.population, rng=rng), home)
+    
+    def populate(self, count):
+        # Seed the world with households: a parent and up to four children each, living in a settlement
+        # picked by head count
+        settlements = np.flatnonzero(self.lod.kingdom_of >= 0)
+        weights = np.cumsum(self.lod.cohorts[settlements].sum(axis=1)).tolist()
+        settlements = settlements.tolist()
+        while count > 0:
+            home = self.character_rng.choices(settlements, cum_weights=weights)[0]
+            parent = self.random_character(self.character_rng.randint(16, 60), home)
+            count -= 1
+            for _ in range(min(count, self.character_rng.randint(0, 4))):
+                child = self.random_character(self.character_rng.randint(0, parent.age - 16), home)
+                parent.add_child(child)
+                count -= 1
+    
     def advance_time(self):
         # Simulate one season (3 months)
         # Process random events, character actions, etc.
+        self.timeline.run_due(self.season)
         self.generate_events()
         
-        # Age up all characters
+        self.relationships.decay(RELATIONSHIP_DECAY)
+        
+        self.season += 1
+        self.lod.step()
+        self.economy.step()
+        if self.season % 4 == 0:
+            self.year += 1
+            if not self.age_characters():
+                return False
+            
+        return True
+    
+    def age_characters(self):
+        # Yearly pass: age everyone in the player's kingdom (and anyone without a home) in one batched
+        # step, then let the dead die properly. Other kingdoms catch up when the player arrives.
         to_remove = []
-        for char_id, character in self.characters.items():
-            if character.alive:
-                survived = character.age_up()
-                if not survived and char_id == self.player.id:
-                    heir = character.get_heir()
-                    if heir:
-                        self.player = heir
-                        print(f"You have died. You now continue as your heir, {heir.name}.")
-                    else:
-                        print("You have died without an heir. Game over.")
-                        return False
+        for char_id in self.population.age_up(self.mortality_rng, self.lod.simulated()):
+            character = self.characters.get(char_id)
+            if character is not None:
+                character.die(cause="Natural causes", timestamp=self.timestamp())
+                to_remove.append(char_id)
+        
+        if self.player is not None and not self.player.alive:
+            heir = self.player.get_heir()
+            if heir:
+                self.player = heir
+                self.announce(f"You have died. You now continue as your heir, {heir.name}.")
+            else:
+                self.announce("You have died without an heir. Game over.")
+                return False
             
-        # Clean up dead characters without heirs
+        # Move the dead out of the living set and into the archive
         for char_id in to_remove:
-            del self.characters[char_id]
-            
+            self.archive_character(self.characters.pop(char_id), self.year)
+        self.relationships.remove_nodes(to_remove)
+        
         return True
     
+    def archive_character(self, person, year):
+        # Archive a dead character and drop every reference living characters hold to its Person, so
+        # it can be freed; family links survive by id in the dynasty index and the archive record
+        self.archive.add(person, year)
+        self.population.dynasty.retire(person.id)
+        for parent in person.parents:
+            parent.children = tuple(child for child in parent.children if child is not person)
+        for child in person.children:
+            child.parents = tuple(parent for parent in child.parents if parent is not person)
+        if person.spouse is not None and person.spouse.spouse is person:
+            person.spouse.spouse = None
+    
     def generate_events(self):
-        # Generate random events in the world
-        event_types = ["war", "plague", "festival", "trade_boom", "famine", "religious_event"]
-        
-        # 20% chance for a major event
-        if random.random() < 0.2:
-            event_type = random.choice(event_types)
-            if event_type == "war":
-                kingdoms = list(filter(lambda k: self.locations[k]["type"] == "kingdom", self.locations.keys()))
-                if len(kingdoms) >= 2:
-                    k1, k2 = random.sample(kingdoms, 2)
-                    event = {
-                        "type": "war",
-                        "participants": [k1, k2],
-                        "duration": random.randint(1, 8),  # Seasons
-                        "intensity": random.randint(1, 10),
-                        "started": self.year
-                    }
-                    self.current_events.append(event)
-                    self.history.append(f"War erupted between {k1} and {k2} in {self.year}")
-            
-            # More event types implementation...
+        # Generate random events in the world; each event type is a handler in world_events
+        self.event_engine.step(self)
         
         # Generate personal events for player
         self.generate_personal_events()
     
+    def end_event(self, event):
+        # Expiry callback for scheduled world events
+        self.current_events.remove(event)
+    
     def generate_personal_events(self):
         # These are events specifically for the player
+        if self.player is None:
+            return None
         occupation = self.player.occupation
         
         events = []
@@ -233,8 +673,8 @@ class World:
                 "A traveling merchant offers to buy your harvest upfront"
             ]
         
-        if events and random.random() < 0.3:  # 30% chance for a personal event
-            return random.choice(events)
+        if events and self.personal_event_rng.random() < 0.3:  # 30% chance for a personal event
+            return self.personal_event_rng.choice(events)
         
         return None
 
@@ -244,6 +684,8 @@ class Game:
         self.player = None
         self.turn = 1
         self.save_directory = "saves/"
+        self.play_time = 0.0  # Seconds played in earlier sessions of this game
+        self.session_start = time.monotonic()
         
     def new_game(self):
         print("=== MEDIEVAL LIFE SIMULATOR ===")
@@ -255,7 +697,7 @@ class Game:
         gender_choice = input("Choose gender (m/f): ").lower()
         gender = "male" if gender_choice.startswith("m") else "female"
         
-        age = random.randint(16, 30)  # Start as a young adult
+        age = self.world.character_rng.randint(16, 30)  # Start as a young adult
         
         print("\nChoose your starting occupation:")
         occupations = ["King", "Noble", "Knight", "Merchant", "Farmer", "Craftsman", "Tavern Owner", "Beggar"]
@@ -264,12 +706,14 @@ class Game:
             
         occ_choice = int(input("Enter number (or 0 for random): "))
         if occ_choice == 0:
-            occupation = random.choice(occupations)
+            occupation = self.world.character_rng.choice(occupations)
         else:
             occupation = occupations[occ_choice - 1]
             
         # Create player character
-        self.player = Person(name, age, gender, occupation)
+        self.player = self.world.add_character(Person(name, age, gender, occupation,
+                                                      population=self.world.population,
+                                                      rng=self.world.character_rng))
         self.world.player = self.player
         
         # Start first turn
@@ -463,20 +907,53 @@ class Game:
             os.makedirs(self.save_directory)
             
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.save_directory}save_{self.player.name}_{timestamp}.json"
+        filename = f"{self.save_directory}save_{self.player.name}_{timestamp}{SAVE_EXTENSION}"
         
-        # Create save data (would need proper serialization)
-        save_data = {
-            "player": self.player.__dict__,
-            "world": self.world.__dict__,
-            "turn": self.turn
-        }
+        # Compact binary sections; Person and World objects are flattened by World.save_state
+        entry = summary("world", self.player.name, self.player.occupation, self.world.year,
+                        SEASONS[self.world.season % 4], self.total_play_time())
+        save_data = {"game": {"turn": self.turn, "play_time": entry["play_time"]}, SUMMARY_SECTION: entry,
+                     **self.world.save_state()}
+        atomic_write(filename, lambda f: write_save(f, save_data))
+        SaveCatalog(self.save_directory).record(filename, entry)
         
         print(f"Game saved as: {filename}")
+    
+    def total_play_time(self):
+        return self.play_time + time.monotonic() - self.session_start
         
-    def load_game(self):
-        # Implement game loading
-        print("Loading game (not fully implemented)")
+    def load_game(self, path=None):
+        # Resume a save from save_game; the world decodes most of the file only as play needs it
+        path = path or self.choose_save()
+        if path is None:
+            return
+        try:
+            save = SaveFile(path)
+            world = World(save=save)
+            game = save.read("game")
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Could not load {path}: {error}")
+            return
+        self.world, self.player, self.turn = world, world.player, game["turn"]
+        self.play_time = game.get("play_time", 0)
+        self.session_start = time.monotonic()
+        print(f"Loaded: {path}")
+    
+    def choose_save(self):
+        # Listed from the save catalog, so no save file is opened to build the menu
+        saves = SaveCatalog(self.save_directory).listing("world")
+        if not saves:
+            print("No saved games found.")
+            return None
+        print("\n=== LOAD GAME ===")
+        for i, entry in enumerate(saves, 1):
+            print(f"{i}. {entry['name']} the {entry['occupation']} - {entry['season']}, Year {entry['year']} - "
+                  f"played {format_play_time(entry['play_time'])}, {format_size(entry['size'])}")
+        print("0. Cancel")
+        choice = input("> ")
+        if not choice.isdigit() or not 0 < int(choice) <= len(saves):
+            return None
+        return saves[int(choice) - 1]["path"]
 
 # Game entry point
 if __name__ == "__main__":
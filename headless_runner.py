@@ -0,0 +1,65 @@
+import argparse
+import time
+from game_logic import World
+from world_generator import WorldGenerator
+
+
+def quiet(message):
+    # Swallow player-facing messages; nobody is watching a headless run
+    pass
+
+
+def build_world(population, seed=None, kingdoms=None):
+    """Create a World with a seeded random population and no player
+    
+    With kingdoms set, the map comes from WorldGenerator instead of the built-in two kingdoms.
+    The simulation is focused on the first kingdom's first settlement, as if a player stood
+    there, so every level of detail gets exercised.
+    """
+    generator = WorldGenerator(seed, kingdoms, (10, 30), (2, 6)) if kingdoms else None
+    world = World(seed=seed, announce=quiet, generator=generator)
+    world.populate(population)
+    registry = world.registry
+    world.set_player_location(registry.settlements_of(registry.names_of_type("kingdom")[0])[0])
+    return world
+
+
+def run_seasons(world, seasons):
+    """Step the world as fast as possible and return timing stats"""
+    completed = 0
+    start = time.perf_counter()
+    for _ in range(seasons):
+        if not world.advance_time():
+            break
+        completed += 1
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "seasons": completed,
+        "elapsed": elapsed,
+        "seasons_per_second": completed / elapsed if elapsed > 0 else float("inf"),
+        "year": world.year,
+        "living": len(world.population.living_ids()),
+        "characters": len(world.characters) + len(world.archive)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the medieval world simulation without a UI")
+    parser.add_argument("-s", "--seasons", type=int, default=1000, help="number of seasons to simulate")
+    parser.add_argument("-p", "--population", type=int, default=1000, help="number of characters to seed")
+    parser.add_argument("-k", "--kingdoms", type=int, default=None, help="generate a map with this many kingdoms")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for a reproducible run")
+    args = parser.parse_args(argv)
+    
+    world = build_world(args.population, args.seed, args.kingdoms)
+    stats = run_seasons(world, args.seasons)
+    
+    print(f"Simulated {stats['seasons']} seasons in {stats['elapsed']:.3f}s "
+          f"({stats['seasons_per_second']:.1f} seasons/s)")
+    print(f"Reached year {stats['year']} with {stats['living']} of {stats['characters']} characters alive")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
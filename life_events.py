@@ -0,0 +1,71 @@
+from collections import namedtuple
+
+# Seasons as used by MedievalSimulator.advance_season; timestamps count seasons since year 0
+SEASONS = ["Spring", "Summer", "Fall", "Winter"]
+
+# One life or history event: which template, when, and the values that fill its {} slots
+EventRecord = namedtuple("EventRecord", ["template", "timestamp", "args"])
+
+
+class EventTemplates:
+    """Interned table of event text templates, so each distinct message is stored once"""
+    
+    def __init__(self, templates=()):
+        self.templates = []
+        self.ids = {}
+        for template in templates:
+            self.intern(template)
+    
+    def intern(self, template):
+        """Return the id of a template, adding it to the table on first use"""
+        template_id = self.ids.get(template)
+        if template_id is None:
+            template_id = len(self.templates)
+            self.templates.append(template)
+            self.ids[template] = template_id
+        return template_id
+    
+    def record(self, template, timestamp, *args):
+        """Build a compact record for a template like "You found {} gold." and its arguments"""
+        return EventRecord(self.intern(template), timestamp, args)
+    
+    def text(self, record):
+        """Render a record's message (timestamp not included)"""
+        template, _, args = record
+        return self.templates[template].format(*args)
+    
+    def render(self, record):
+        """Render a record as "Season, Year N: message" for logs and exports"""
+        return f"{format_timestamp(record[1])}: {self.text(record)}"
+    
+    def table(self):
+        # Saved alongside records so their template ids can be resolved on load
+        return list(self.templates)
+    
+    def adopt(self, saved):
+        """Map a saved table() onto this one: None if ids already agree, else old id -> new id"""
+        mapping = [self.intern(template) for template in saved]
+        return None if mapping == list(range(len(mapping))) else mapping
+    
+    @staticmethod
+    def remap(records, mapping):
+        # Point saved records at this table's ids (see adopt)
+        if mapping is None:
+            return records
+        return [EventRecord(mapping[template], stamp, args) for template, stamp, args in records]
+
+
+def timestamp(year, season_index=0):
+    """Pack a year and season into one sortable integer"""
+    return year * 4 + season_index
+
+
+def format_timestamp(stamp):
+    if stamp is None:
+        return "Unknown date"
+    year, season_index = divmod(stamp, 4)
+    return f"{SEASONS[season_index]}, Year {year}"
+
+
+# Shared by every world and the GUI within one process
+EVENT_TEMPLATES = EventTemplates()
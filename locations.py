@@ -0,0 +1,162 @@
+from collections.abc import MutableMapping
+
+
+class LocationRegistry:
+    """Index of every location built once per world: integer ids plus type, kingdom and settlement maps"""
+    
+    def __init__(self, source=None):
+        self.source = source  # The dict the registry was built from, to detect a new world
+        self.names = []  # id -> name
+        self.ids = {}  # name -> id
+        self.types = {}  # name -> type
+        self.kingdoms = {}  # name -> kingdom name
+        self.by_type = {}  # type -> names
+        self.settlements = {}  # kingdom name -> settlement names
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __contains__(self, name):
+        return name in self.ids
+    
+    def add(self, name, location_type, kingdom=None):
+        """Register a location (first registration of a name wins) and return its id"""
+        if name in self.ids:
+            return self.ids[name]
+        location_id = len(self.names)
+        self.names.append(name)
+        self.ids[name] = location_id
+        self.types[name] = location_type
+        self.by_type.setdefault(location_type, []).append(name)
+        if kingdom is not None:
+            self.kingdoms[name] = kingdom
+            if kingdom != name:
+                self.settlements.setdefault(kingdom, []).append(name)
+        return location_id
+    
+    def type_of(self, name, default="Unknown"):
+        return self.types.get(name, default)
+    
+    def kingdom_of(self, name, default="Unknown"):
+        return self.kingdoms.get(name, default)
+    
+    def settlements_of(self, kingdom):
+        return self.settlements.get(kingdom, [])
+    
+    def names_of_type(self, location_type):
+        return self.by_type.get(location_type, [])
+    
+    @classmethod
+    def from_locations(cls, locations):
+        """Build from World.locations, the flat name -> data dict with a "type" on every entry"""
+        registry = cls(locations)
+        for name, data in locations.items():
+            registry.add_location(name, data)
+        return registry
+    
+    @classmethod
+    def from_stream(cls, entries, locations):
+        """Fill locations from (name, data) pairs, e.g. a WorldGenerator's, registering each as it arrives"""
+        registry = cls(locations)
+        for name, data in entries:
+            locations[name] = data
+            registry.add_location(name, data)
+        return registry
+    
+    def add_location(self, name, data):
+        """Register one World.locations entry and return its id"""
+        kingdom = name if data["type"] == "kingdom" else data.get("kingdom")
+        return self.add(name, data["type"], kingdom)
+    
+    @classmethod
+    def from_columns(cls, names, types, kingdoms, by_type, settlements, source=None):
+        """Rebuild from columns() as saved by World.save_state, without a pass in Python per location"""
+        registry = cls(source)
+        registry.names = names
+        registry.ids = dict(zip(names, range(len(names))))
+        registry.types = dict(zip(names, types))
+        registry.kingdoms = {name: kingdom for name, kingdom in zip(names, kingdoms) if kingdom is not None}
+        registry.by_type = by_type
+        registry.settlements = settlements
+        return registry
+    
+    def columns(self):
+        # Parallel name, type and kingdom lists, plus the grouped maps so loading need not regroup them
+        return {"names": self.names, "types": [self.types[name] for name in self.names],
+                "kingdoms": [self.kingdoms.get(name) for name in self.names],
+                "by_type": self.by_type, "settlements": self.settlements}
+    
+    @classmethod
+    def from_kingdoms(cls, kingdoms):
+        """Build from MedievalSimulator's world["kingdoms"], using the GUI's display types"""
+        registry = cls(kingdoms)
+        for kingdom, data in kingdoms.items():
+            registry.add(kingdom, "Kingdom", kingdom)
+            if data.get("capital"):
+                registry.add(data["capital"], "Capital City", kingdom)
+            for city in data["cities"]:
+                registry.add(city, "City", kingdom)
+            for village in data["villages"]:
+                registry.add(village, "Village", kingdom)
+        return registry
+
+
+def location_section(registry, name):
+    """Save section holding a location: "kingdoms", or "locations/<kingdom>" for its kingdom's settlements"""
+    if registry.type_of(name) == "kingdom":
+        return "kingdoms"
+    return f"locations/{registry.kingdom_of(name, '')}"
+
+
+class SavedLocations(MutableMapping):
+    """World.locations for a world loaded from a save, decoding one kingdom's locations on first access
+    
+    Kingdom entries come from the save's "kingdoms" section and each kingdom's settlements from
+    its own "locations/<kingdom>" section; the registry says which section holds a name without
+    decoding anything. Iterating or taking len() decodes whatever is still left.
+    """
+    
+    def __init__(self, save, get_registry):
+        self.save = save  # save_format.SaveFile, dropped once every section is in
+        self.get_registry = get_registry  # The world's registry, which may itself load on first use
+        self.loaded = {}
+        self.pending = {section for section in save.names() if section == "kingdoms" or section.startswith("locations/")}
+    
+    def load(self, section):
+        if section not in self.pending:
+            return
+        self.pending.discard(section)
+        for row in self.save.read(section):
+            # Anything set before its section was loaded is newer than the save
+            self.loaded.setdefault(row.pop("name"), row)
+        if not self.pending:
+            self.save = None
+    
+    def load_all(self):
+        for section in list(self.pending):
+            self.load(section)
+    
+    def __getitem__(self, name):
+        if name not in self.loaded:
+            self.load(location_section(self.get_registry(), name))
+        return self.loaded[name]
+    
+    def __setitem__(self, name, data):
+        self.loaded[name] = data
+    
+    def __delitem__(self, name):
+        self.load(location_section(self.get_registry(), name))
+        del self.loaded[name]
+    
+    def __contains__(self, name):
+        if name in self.loaded:
+            return True
+        return name in self.get_registry() and location_section(self.get_registry(), name) in self.pending
+    
+    def __iter__(self):
+        self.load_all()
+        return iter(self.loaded)
+    
+    def __len__(self):
+        self.load_all()
+        return len(self.loaded)
@@ -0,0 +1,199 @@
+import numpy as np
+from life_events import timestamp
+
+# Simulation tiers, from most to least detailed
+FULL = 0  # The player's settlement: every resident is a Person
+COHORT = 1  # Other settlements of the player's kingdom: age-band head counts per settlement
+AGGREGATE = 2  # Other kingdoms: head counts move only with the economy's growth rates
+NOT_SETTLEMENT = -1  # Registry entries that are kingdoms
+
+# Cohort age bands: 0-15, 16-39, 40-59, 60+
+COHORT_SHARES = np.array([0.35, 0.38, 0.19, 0.08])  # Starting age structure of every settlement
+AGE_OUT = np.array([1 / 64, 1 / 96, 1 / 80, 0.0])  # Share of a band moving up each season
+DEATH_RATE = np.array([0.02, 0.008, 0.02, 0.08]) / 4  # Seasonal deaths per band
+BIRTH_RATE = 0.06 / 4  # Seasonal births per 16-39 year old
+
+
+class LodManager:
+    """Decides how closely each settlement is simulated, based on where the player is"""
+    
+    def __init__(self, world, state=None):
+        self.world = world
+        self.near = np.empty(0, dtype=np.int64)  # FULL and COHORT settlement ids
+        self.focus_kingdom = None
+        self.focus_settlement = None
+        self.resident_rows = []  # Character ids of the FULL settlement's residents
+        self.dormant = {}  # Settlement id -> its residents' rows, kept while the player is elsewhere
+        self.homed = {}  # Kingdom id (-1: no home) -> ids of the characters living there, pruned lazily
+        if state is not None:
+            self.restore(state)
+        else:
+            registry = world.registry
+            self.tier = np.full(len(registry), AGGREGATE, dtype=np.int8)
+            self.cohorts = np.zeros((len(registry), len(COHORT_SHARES)))
+            self.kingdom_of = np.full(len(registry), -1, dtype=np.int64)  # Settlement id -> kingdom id
+            for name, location_id in registry.ids.items():
+                data = world.locations[name]
+                if data["type"] == "kingdom":
+                    self.tier[location_id] = NOT_SETTLEMENT
+                else:
+                    self.kingdom_of[location_id] = registry.ids[data["kingdom"]]
+                    self.cohorts[location_id] = data.get("population", 0) * COHORT_SHARES
+        self.kingdom_ids = np.flatnonzero(self.tier == NOT_SETTLEMENT)
+    
+    def state(self):
+        """Tiers, head counts and resident rows for World.save_state; homed is rebuilt on load"""
+        return {"tier": self.tier, "cohorts": self.cohorts, "kingdom_of": self.kingdom_of, "near": self.near,
+                "focus_kingdom": -1 if self.focus_kingdom is None else int(self.focus_kingdom),
+                "focus_settlement": self.focus_settlement, "resident_rows": self.resident_rows,
+                "dormant": [[location_id, *rows] for location_id, rows in self.dormant.items()]}
+    
+    def restore(self, state):
+        # Inverse of state(), copying the arrays off the save file; no location dict is read
+        self.tier = np.array(state["tier"])
+        self.cohorts = np.array(state["cohorts"])
+        self.kingdom_of = np.array(state["kingdom_of"])
+        self.near = np.array(state["near"])
+        self.focus_kingdom = None if state["focus_kingdom"] < 0 else state["focus_kingdom"]
+        self.focus_settlement = state["focus_settlement"]
+        self.resident_rows = state["resident_rows"]
+        self.dormant = {entry[0]: entry[1:] for entry in state["dormant"]}
+        
+        # Every living, non-dormant row goes back under its home kingdom
+        population = self.world.population
+        ids = population.living_ids()
+        ids = ids[~np.isin(ids, [row for rows in self.dormant.values() for row in rows])]
+        homes = population.location[ids]
+        kingdoms = np.where(homes >= 0, self.kingdom_of[homes], -1)
+        order = np.argsort(kingdoms, kind="stable")
+        keys, starts = np.unique(kingdoms[order], return_index=True)
+        for kingdom, group in zip(keys.tolist(), np.split(ids[order], starts[1:])):
+            self.homed[kingdom] = group.tolist()
+    
+    def register(self, person):
+        """File a new character under its home kingdom; out of focus, it ages only once the player arrives"""
+        kingdom = int(self.kingdom_of[person.location]) if person.location >= 0 else -1
+        self.homed.setdefault(kingdom, []).append(person.id)
+        if kingdom >= 0 and kingdom != self.focus_kingdom:
+            self.world.population.updated[person.id] = self.world.year
+    
+    def homed_in(self, kingdom):
+        """Sorted ids of the living characters at home in a kingdom (-1: those without a home)"""
+        characters = self.world.characters
+        # Drop ids that have died or gone dormant since they were filed
+        ids = sorted({char_id for char_id in self.homed.get(kingdom, ()) if char_id in characters})
+        self.homed[kingdom] = ids
+        return np.array(ids, dtype=np.int64)
+    
+    def simulated(self):
+        """Ids the yearly pass ages: the player's kingdom and everyone without a home"""
+        if self.focus_kingdom is None:
+            return self.homed_in(-1)
+        return np.sort(np.concatenate([self.homed_in(-1), self.homed_in(self.focus_kingdom)]))
+    
+    def catch_up(self, ids):
+        """Age characters by the yearly passes they missed out of focus, archiving any who died meanwhile"""
+        world = self.world
+        dead, years = world.population.catch_up(ids, world.year, world.mortality_rng)
+        for char_id, year in zip(dead.tolist(), years.tolist()):
+            person = world.characters.pop(char_id)
+            person.die(cause="Natural causes", timestamp=timestamp(year))
+            world.archive_character(person, year)
+        world.relationships.remove_nodes(dead.tolist())
+    
+    def focus(self, location):
+        """Re-tier the world around the player's location, promoting and demoting as needed"""
+        registry = self.world.registry
+        if location not in registry or location == self.focus_settlement:
+            return
+        if self.tier[registry.ids[location]] == NOT_SETTLEMENT:
+            return  # Kingdoms have no head count or residents of their own
+        kingdom = registry.ids[registry.kingdom_of(location)]
+        
+        self.demote_residents()
+        if kingdom != self.focus_kingdom:
+            if self.focus_kingdom is not None:
+                self.tier[self.near] = AGGREGATE
+                # Its characters stop ageing here; catch_up picks them up again on the player's return
+                self.world.population.updated[self.homed_in(self.focus_kingdom)] = self.world.year
+            members = np.flatnonzero(self.kingdom_of == kingdom)
+            self.tier[members] = COHORT
+            self.near = members
+            self.focus_kingdom = kingdom
+            self.write_back(members)
+            self.catch_up(self.homed_in(kingdom))
+        else:
+            self.tier[registry.ids[self.focus_settlement]] = COHORT
+        
+        self.tier[registry.ids[location]] = FULL
+        self.focus_settlement = location
+        self.promote_residents(location)
+    
+    def promote_residents(self, settlement):
+        # Turn the settlement's (lazily generated, seed-stable) residents into simulated Persons. A
+        # return visit brings back the same rows, aged by the years the player was away.
+        from game_logic import Person
+        world = self.world
+        location_id = world.registry.ids[settlement]
+        residents = world.get_residents().residents(settlement)
+        rows = self.dormant.pop(location_id, None)
+        if rows is None:
+            rng = world.random.spawn(f"lod/{location_id}")
+            people = [Person(resident["name"], resident["age"], resident["gender"], resident["occupation"],
+                             population=world.population, rng=rng) for resident in residents]
+        else:
+            people = [Person.restore(world.population, row, resident["name"], resident["gender"],
+                                     resident["occupation"]) for resident, row in zip(residents, rows)]
+        self.resident_rows = [person.id for person in people]
+        living = [world.add_character(person, location_id).id for person in people if person.alive]
+        if rows is not None:
+            self.catch_up(living)
+    
+    def demote_residents(self):
+        # Leaving a settlement folds its residents back into head counts. Their rows (and relationships)
+        # stay in place, dormant, until promote_residents brings them back.
+        world = self.world
+        if self.focus_settlement is None:
+            return
+        rows = self.resident_rows
+        for row in rows:
+            world.characters.pop(row, None)
+        world.population.updated[rows] = world.year
+        self.dormant[world.registry.ids[self.focus_settlement]] = rows
+        self.resident_rows = []
+    
+    def step(self):
+        """Advance one season at each settlement's level of detail"""
+        self.step_cohorts(self.near)
+        self.write_back(self.near)
+    
+    def step_cohorts(self, ids):
+        # Every near settlement's bands age, die and give birth in one vectorized update
+        cohorts = self.cohorts[ids]
+        moving = cohorts * AGE_OUT
+        cohorts -= moving
+        cohorts[:, 1:] += moving[:, :-1]
+        cohorts -= cohorts * DEATH_RATE
+        cohorts[:, 0] += cohorts[:, 1] * BIRTH_RATE
+        self.cohorts[ids] = cohorts
+    
+    def scale_settlements(self, settlements, factor):
+        """Multiply settlements' head counts, e.g. for plague or famine losses, at any tier"""
+        ids = np.array([self.world.registry.ids[name] for name in settlements], dtype=np.int64)
+        self.cohorts[ids] *= factor
+        self.write_back(ids)
+    
+    def population_of(self, settlement):
+        """Current head count for any settlement, without writing it back"""
+        return int(self.cohorts[self.world.registry.ids[settlement]].sum())
+    
+    def write_back(self, ids):
+        # Publish cohort totals to the settlements' location dicts
+        names = self.world.registry.names
+        totals = np.rint(self.cohorts[ids].sum(axis=1)).astype(np.int64)
+        for location_id, total in zip(ids.tolist(), totals.tolist()):
+            self.world.locations[names[location_id]]["population"] = total
+    
+    def sync(self):
+        """Write every settlement's current population back, e.g. before saving"""
+        self.write_back(np.flatnonzero(self.tier != NOT_SETTLEMENT))
@@ -1,11 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, font, simpledialog
 from PIL import Image, ImageTk
-import json
 import os
-import random
+import time
 from datetime import datetime
 from game_logic import Person, World, Game  # Import game logic classes
+from world_rng import RandomStreams
+from life_events import EVENT_TEMPLATES, timestamp
+from locations import LocationRegistry
+from residents import SettlementResidents
+from routes import RouteNetwork
+from spatial import SpatialIndex, layout
+from save_journal import SaveJournal, clone
+from save_writer import BackgroundSaver
+from save_format import SAVE_EXTENSION
+from save_catalog import SaveCatalog, format_play_time, format_size, summary
+from autosave import AutosaveRing, is_autosave
+
+NEARBY_MILES = 30  # Settlements this close are offered on the travel screen even without a direct road
+
 
 class MedievalSimulator:
     def __init__(self, root):
@@ -35,6 +48,10 @@ class MedievalSimulator:
         self.season_index = 0
         self.current_day = 1
         self.event_log = []
+        self.play_time = 0  # Seconds played in earlier sessions of the current game
+        self.session_start = time.monotonic()
+        self.autosave = None  # autosave.AutosaveRing, started on the first season change
+        self.random_streams = RandomStreams()  # Replaced by a fresh, recorded seed for each new game
         
         # Create a main container for all screens
         self.main_container = tk.Frame(self.root, bg=self.bg_color)
@@ -68,11 +85,23 @@ class MedievalSimulator:
         save_directory = "saves/"
         if not os.path.exists(save_directory):
             os.makedirs(save_directory)
-            
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{save_directory}save_{self.player['name']}_{timestamp}.json"
         
-        # Create save data
+        save_data = self.save_state()
+        
+        # Later saves of the same game only append what changed to the save's journal
+        journal = getattr(self, "save_journal", None)
+        if journal is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            journal = self.save_journal = SaveJournal(f"{save_directory}save_{self.player['name']}_{timestamp}{SAVE_EXTENSION}")
+        
+        # Copy the containers now (cheap, no serialization); the writer thread does the rest
+        snapshot = clone(save_data)
+        self.get_background_saver().submit(lambda: self.write_save(journal, snapshot),
+                                           on_done=lambda written, error: self.save_finished(journal, error),
+                                           key=journal.path)
+    
+    def save_state(self):
+        """The game as a plain dict, as manual saves and autosaves write it"""
         save_data = {
             "player": self.player,
             "world": self.world,
@@ -80,24 +109,64 @@ class MedievalSimulator:
             "current_season": self.current_season,
             "season_index": self.season_index,
             "current_location": self.current_location,
-            "turn": self.turn if hasattr(self, 'turn') else 1
+            "turn": self.turn if hasattr(self, 'turn') else 1,
+            "play_time": round(self.total_play_time()),
+            "event_templates": EVENT_TEMPLATES.table()  # Resolves the template ids in player["events"]
         }
-        
-        # Save to file
-        with open(filename, 'w') as f:
-            json.dump(save_data, f, indent=4)
-        
-        messagebox.showinfo("Game Saved", f"Game saved as: {filename}")
+        # Repeated in the save catalog, which the load menu reads instead of the saves themselves
+        save_data["summary"] = summary("journal", self.player["name"], self.player["occupation"],
+                                       self.current_year, self.current_season, save_data["play_time"])
+        return save_data
+    
+    def write_save(self, journal, snapshot):
+        # Runs on the save writer thread: the save itself, then its catalog entry
+        written = journal.save(snapshot)
+        SaveCatalog(os.path.dirname(journal.path)).record(journal.path, snapshot["summary"])
+        return written
+    
+    def total_play_time(self):
+        """Seconds played in this game, across every session"""
+        return self.play_time + time.monotonic() - self.session_start
+    
+    def get_background_saver(self):
+        """Return the save writer thread's handle, starting it on first use"""
+        saver = getattr(self, "background_saver", None)
+        if saver is None:
+            saver = self.background_saver = BackgroundSaver(self.root)
+        return saver
+    
+    def get_autosave(self):
+        """Return the current game's autosave ring, starting it on first use"""
+        if self.autosave is None:
+            os.makedirs("saves", exist_ok=True)
+            self.autosave = AutosaveRing("saves", self.get_background_saver())
+        return self.autosave
+    
+    def autosave_finished(self, written, error):
+        # Autosaves finish quietly; only a failure is worth interrupting play for
+        if error is not None:
+            messagebox.showerror("Autosave Failed", f"Could not autosave the game: {error}")
+    
+    def save_finished(self, journal, error):
+        # Called on the Tk thread once the background writer is done
+        if error is not None:
+            messagebox.showerror("Save Failed", f"Could not save the game: {error}")
+        else:
+            messagebox.showinfo("Game Saved", f"Game saved as: {journal.path}")
     
     def confirm_exit_to_menu(self):
         # Ask user to confirm before exiting to main menu
         if messagebox.askyesno("Return to Main Menu", "Are you sure you want to return to the main menu? Unsaved progress will be lost."):
             self.show_main_menu()
     
-    def add_event(self, event_text):
-        # Add an event to the player's event log
-        timestamp = f"{self.current_season}, Year {self.current_year}"
-        event = {"text": event_text, "timestamp": timestamp}
+    def add_event(self, template, *args):
+        """Add an event to the player's log and return its rendered text
+        
+        The template uses {} slots, e.g. add_event("You found {} gold!", amount); the log keeps
+        only a compact (template id, timestamp, args) record and renders text when shown.
+        """
+        stamp = timestamp(self.current_year, self.season_index)
+        event = EVENT_TEMPLATES.record(template, stamp, *args)
         
         # Add to player's events
         self.player["events"].append(event)
@@ -105,6 +174,14 @@ class MedievalSimulator:
         # Update event log if it exists
         if hasattr(self, 'event_log') and self.event_log:
             self.update_event_log()
+        
+        return EVENT_TEMPLATES.text(event)
+    
+    def render_event(self, event):
+        """Render a logged event as "Season, Year N: text" (older saves stored plain dicts)"""
+        if isinstance(event, dict):
+            return f"{event['timestamp']}: {event['text']}"
+        return EVENT_TEMPLATES.render(event)
     
     def update_event_log(self):
         """Update the event log display with all events"""
@@ -117,7 +194,7 @@ class MedievalSimulator:
         
         # Add events in reverse chronological order (newest first)
         for event in reversed(self.player["events"]):
-            self.event_log.insert(tk.END, f"{event['timestamp']}: {event['text']}\n\n")
+            self.event_log.insert(tk.END, f"{self.render_event(event)}\n\n")
     
     def show_main_menu(self):
         # Clear the main container
@@ -169,13 +246,87 @@ class MedievalSimulator:
     
     def load_game(self):
         """Load a saved game"""
-        # For now, just show a message
-        messagebox.showinfo("Load Game", "Load game functionality will be implemented in a future update.")
+        # Listed from the save catalog, so no save file is opened to build the menu
+        saves = SaveCatalog("saves").listing("journal")
+        if not saves:
+            messagebox.showinfo("Load Game", "No saved games found.")
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Load Game")
+        dialog.geometry("600x450")
+        dialog.configure(bg="#f0e6d2")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        title = tk.Label(dialog, text="Choose a saved game", font=self.header_font, bg="#f0e6d2", fg="#5c4425")
+        title.pack(pady=15)
+        
+        list_frame = tk.Frame(dialog, bg="#f0e6d2")
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        save_list = tk.Listbox(list_frame, font=self.text_font, bg="#e6d8bf", fg="#5c4425",
+                               yscrollcommand=scrollbar.set, activestyle="none")
+        save_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=save_list.yview)
+        for entry in saves:
+            autosave = "Autosave: " if is_autosave(entry["path"]) else ""
+            save_list.insert(tk.END, f"{autosave}{entry['name']} the {entry['occupation']} - {entry['season']}, "
+                                     f"Year {entry['year']} - played {format_play_time(entry['play_time'])}, "
+                                     f"{format_size(entry['size'])}")
+        save_list.selection_set(0)
+        
+        def load_selected(event=None):
+            selected = save_list.curselection()
+            if selected:
+                dialog.destroy()
+                self.open_save(saves[selected[0]]["path"])
+        
+        save_list.bind("<Double-Button-1>", load_selected)
+        button_frame = tk.Frame(dialog, bg="#f0e6d2")
+        button_frame.pack(pady=15)
+        load_btn = tk.Button(button_frame, text="Load", command=load_selected, **self.get_button_style("medium"))
+        load_btn.pack(side=tk.LEFT, padx=5)
+        cancel_btn = tk.Button(button_frame, text="Cancel", command=dialog.destroy, **self.get_button_style("medium"))
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+    
+    def open_save(self, path):
+        """Resume the game saved at path; later saves keep appending to its journal"""
+        # A save still being written in the background may be the one being opened
+        saver = getattr(self, "background_saver", None)
+        if saver is not None:
+            saver.flush()
+        try:
+            journal, state = SaveJournal.open(path)
+        except (OSError, ValueError, KeyError) as error:
+            messagebox.showerror("Load Failed", f"Could not load {path}: {error}")
+            return
+        
+        # Template ids in the log refer to the saved table; map them onto this session's
+        templates = EVENT_TEMPLATES.adopt(state["event_templates"])
+        self.player = state["player"]
+        self.player["events"] = EVENT_TEMPLATES.remap(self.player["events"], templates)
+        self.world = state["world"]  # New kingdoms dict, so the registry, road and map caches rebuild
+        self.current_year = state["current_year"]
+        self.current_season = state["current_season"]
+        self.season_index = state["season_index"]
+        self.current_location = state["current_location"]
+        self.turn = state["turn"]
+        self.play_time = state.get("play_time", 0)
+        self.session_start = time.monotonic()
+        self.random_streams = RandomStreams(self.world["seed"])
+        # Manual saves of a game resumed from an autosave get a file of their own, not the slot
+        self.save_journal = None if is_autosave(path) else journal
+        self.autosave = None
+        
+        self.show_game_interface()
     
     def show_options(self):
         """Show game options"""
-        # For now, just show a message
-        messagebox.showinfo("Options", "Options menu will be implemented in a future update.")
+        # For now, just show a message, and what autosaving has cost on season changes
+        report = self.autosave.report() if self.autosave is not None else "No autosaves yet"
+        messagebox.showinfo("Options", f"Options menu will be implemented in a future update.\n\n{report}")
     
     def get_occupation_description(self, occupation):
         """Return a description for the selected occupation"""
@@ -217,12 +368,20 @@ class MedievalSimulator:
             messagebox.showerror("Error", "Please select an occupation for your character.")
             return
         
+        # Each game gets its own seeded RNG; the seed is saved with the world so a run can be replayed
+        self.random_streams = RandomStreams()
+        self.save_journal = None  # A new character starts a new save file
+        self.autosave = None  # and new snapshots in the autosave slots
+        self.play_time = 0
+        self.session_start = time.monotonic()
+        rng = self.random_streams.stream("characters")
+        
         # Create player data
         self.player = {
             "name": name,
             "gender": gender.lower(),
             "occupation": occupation,
-            "age": random.randint(18, 30),
+            "age": rng.randint(18, 30),
             "health": 100,
             "wealth": self.get_starting_wealth(occupation),
             "skills": self.generate_skills(occupation),
@@ -236,6 +395,7 @@ class MedievalSimulator:
         
         # Generate world data
         self.world = {
+            "seed": self.random_streams.seed,
             "kingdoms": self.generate_kingdoms()
         }
         
@@ -249,35 +409,36 @@ class MedievalSimulator:
         self.current_day = 1
         
         # Add initial event
-        initial_message = f"You begin your life as a {occupation} in {self.current_location}."
-        self.add_event(initial_message)
+        self.add_event("You begin your life as a {} in {}.", occupation, self.current_location)
         
         # Show game interface
         self.show_game_interface()
     
     def get_starting_wealth(self, occupation):
+        rng = self.random_streams.stream("characters")
         wealth_map = {
-            "King": random.randint(800, 1000),
-            "Noble": random.randint(400, 700),
-            "Knight": random.randint(200, 400),
-            "Merchant": random.randint(150, 300),
-            "Craftsman": random.randint(80, 200),
-            "Tavern Owner": random.randint(100, 250),
-            "Farmer": random.randint(30, 120),
-            "Beggar": random.randint(0, 20)
+            "King": rng.randint(800, 1000),
+            "Noble": rng.randint(400, 700),
+            "Knight": rng.randint(200, 400),
+            "Merchant": rng.randint(150, 300),
+            "Craftsman": rng.randint(80, 200),
+            "Tavern Owner": rng.randint(100, 250),
+            "Farmer": rng.randint(30, 120),
+            "Beggar": rng.randint(0, 20)
         }
         return wealth_map.get(occupation, 50)
     
     def generate_skills(self, occupation):
+        rng = self.random_streams.stream("characters")
         # Base skills for everyone
         skills = {
-            "combat": random.randint(1, 10),
-            "diplomacy": random.randint(1, 10),
-            "stewardship": random.randint(1, 10),
-            "farming": random.randint(1, 10),
-            "crafting": random.randint(1, 10),
-            "medicine": random.randint(1, 10),
-            "trading": random.randint(1, 10)
+            "combat": rng.randint(1, 10),
+            "diplomacy": rng.randint(1, 10),
+            "stewardship": rng.randint(1, 10),
+            "farming": rng.randint(1, 10),
+            "crafting": rng.randint(1, 10),
+            "medicine": rng.randint(1, 10),
+            "trading": rng.randint(1, 10)
         }
         
         # Boost occupation-specific skills
@@ -307,13 +468,14 @@ class MedievalSimulator:
             
         return skills
     def generate_traits(self):
+        rng = self.random_streams.stream("characters")
         # Personality traits that affect gameplay
         all_traits = ["brave", "cowardly", "ambitious", "content", "honest", "deceitful", 
                      "loyal", "treacherous", "kind", "cruel", "pious", "cynical"]
         
         # Each character gets 2-4 traits
-        num_traits = random.randint(2, 4)
-        return random.sample(all_traits, num_traits)
+        num_traits = rng.randint(2, 4)
+        return rng.sample(all_traits, num_traits)
     
     def generate_kingdoms(self):
         # Create basic kingdom structure
@@ -340,24 +502,25 @@ class MedievalSimulator:
     
     def set_starting_location(self):
         # Set starting location based on occupation
+        rng = self.random_streams.stream("characters")
         if self.player["occupation"] in ["King", "Noble"]:
             # Royalty starts in a capital
-            kingdom = random.choice(list(self.world["kingdoms"].keys()))
+            kingdom = rng.choice(list(self.world["kingdoms"].keys()))
             self.current_location = self.world["kingdoms"][kingdom]["capital"]
         elif self.player["occupation"] in ["Knight", "Merchant", "Tavern Owner"]:
             # These occupations typically start in cities
-            kingdom = random.choice(list(self.world["kingdoms"].keys()))
+            kingdom = rng.choice(list(self.world["kingdoms"].keys()))
             cities = self.world["kingdoms"][kingdom]["cities"]
-            self.current_location = random.choice(cities)
+            self.current_location = rng.choice(cities)
         else:
             # Farmers, craftsmen, beggars typically start in villages
-            kingdom = random.choice(list(self.world["kingdoms"].keys()))
+            kingdom = rng.choice(list(self.world["kingdoms"].keys()))
             villages = self.world["kingdoms"][kingdom]["villages"]
             if villages:
-                self.current_location = random.choice(villages)
+                self.current_location = rng.choice(villages)
             else:
                 # Fallback to a city if needed
-                self.current_location = random.choice(self.world["kingdoms"][kingdom]["cities"])
+                self.current_location = rng.choice(self.world["kingdoms"][kingdom]["cities"])
     
     def show_game_interface(self):
         self.clear_screen()
@@ -511,23 +674,21 @@ class MedievalSimulator:
         # Update the event log
         self.update_event_log()
     
+    def get_location_registry(self):
+        """Return the location index for the current world, building it once per world"""
+        kingdoms = self.world["kingdoms"]
+        registry = getattr(self, "location_registry", None)
+        if registry is None or registry.source is not kingdoms:
+            registry = self.location_registry = LocationRegistry.from_kingdoms(kingdoms)
+        return registry
+    
     def get_location_type(self, location):
-        # Determine if location is a city, village, etc.
-        for kingdom in self.world["kingdoms"].values():
-            if location in kingdom["cities"]:
-                return "City"
-            elif location in kingdom["villages"]:
-                return "Village"
-            elif location == kingdom["capital"]:
-                return "Capital City"
-        return "Unknown"
+        # Determine if location is a capital, city, village, etc.
+        return self.get_location_registry().type_of(location)
     
     def get_kingdom_for_location(self, location):
         # Find which kingdom this location belongs to
-        for kingdom_name, kingdom in self.world["kingdoms"].items():
-            if location in kingdom["cities"] or location in kingdom["villages"] or location == kingdom["capital"]:
-                return kingdom_name
-        return "Unknown"
+        return self.get_location_registry().kingdom_of(location)
     
     def get_location_description(self):
         location_type = self.get_location_type(self.current_location)
@@ -623,6 +784,8 @@ class MedievalSimulator:
     
     def perform_action(self, action):
         """Handle player actions"""
+        rng = self.random_streams.stream("actions")
+        
         # Common actions
         if action == "Rest":
             self.add_event("You take some time to rest and recover.")
@@ -630,12 +793,12 @@ class MedievalSimulator:
             messagebox.showinfo("Rest", "You feel refreshed. Health increased by 10 points.")
             
         elif action == "Explore":
-            self.add_event(f"You explore the area around {self.current_location}.")
+            self.add_event("You explore the area around {}.", self.current_location)
             # Random chance to find something
-            if random.random() < 0.3:  # 30% chance
-                gold_found = random.randint(5, 20)
+            if rng.random() < 0.3:  # 30% chance
+                gold_found = rng.randint(5, 20)
                 self.player["wealth"] += gold_found
-                self.add_event(f"You found {gold_found} gold while exploring!")
+                self.add_event("You found {} gold while exploring!", gold_found)
                 messagebox.showinfo("Exploration", f"You explored the area and found {gold_found} gold!")
             else:
                 messagebox.showinfo("Exploration", "You explored the area but found nothing of interest.")
@@ -646,9 +809,9 @@ class MedievalSimulator:
             messagebox.showinfo("Hold Court", "You held court and made several important decisions.")
             
         elif action == "Collect Taxes":
-            tax_amount = random.randint(100, 300)
+            tax_amount = rng.randint(100, 300)
             self.player["wealth"] += tax_amount
-            self.add_event(f"You collected {tax_amount} gold in taxes.")
+            self.add_event("You collected {} gold in taxes.", tax_amount)
             messagebox.showinfo("Taxes", f"You collected {tax_amount} gold in taxes from your kingdom.")
             
         elif action == "Make Decree":
@@ -657,16 +820,16 @@ class MedievalSimulator:
         
         # Noble actions
         elif action == "Collect Rent":
-            rent_amount = random.randint(50, 150)
+            rent_amount = rng.randint(50, 150)
             self.player["wealth"] += rent_amount
-            self.add_event(f"You collected {rent_amount} gold in rent from your lands.")
+            self.add_event("You collected {} gold in rent from your lands.", rent_amount)
             messagebox.showinfo("Rent", f"You collected {rent_amount} gold in rent from your tenants.")
             
         elif action == "Host Feast":
-            cost = random.randint(30, 80)
+            cost = rng.randint(30, 80)
             if self.player["wealth"] >= cost:
                 self.player["wealth"] -= cost
-                self.add_event(f"You hosted a feast for {cost} gold. Your reputation has improved.")
+                self.add_event("You hosted a feast for {} gold. Your reputation has improved.", cost)
                 messagebox.showinfo("Feast", "Your feast was a success! Your reputation has improved.")
             else:
                 messagebox.showerror("Insufficient Funds", "You don't have enough gold to host a feast.")
@@ -684,7 +847,7 @@ class MedievalSimulator:
             
         elif action == "Patrol":
             self.add_event("You patrolled the area, keeping it safe.")
-            patrol_pay = random.randint(10, 30)
+            patrol_pay = rng.randint(10, 30)
             self.player["wealth"] += patrol_pay
             messagebox.showinfo("Patrol", f"You completed your patrol and earned {patrol_pay} gold.")
             
@@ -692,16 +855,16 @@ class MedievalSimulator:
             tournament_fee = 50
             if self.player["wealth"] >= tournament_fee:
                 self.player["wealth"] -= tournament_fee
-                self.add_event(f"You entered a tournament for {tournament_fee} gold.")
+                self.add_event("You entered a tournament for {} gold.", tournament_fee)
                 
                 # Determine outcome based on Combat skill
                 combat_skill = self.player["skills"].get("Combat", 0)
                 success_chance = 0.3 + (combat_skill * 0.05)  # Base 30% + 5% per skill level
                 
-                if random.random() < success_chance:
-                    prize = random.randint(80, 200)
+                if rng.random() < success_chance:
+                    prize = rng.randint(80, 200)
                     self.player["wealth"] += prize
-                    self.add_event(f"You won the tournament and earned {prize} gold!")
+                    self.add_event("You won the tournament and earned {} gold!", prize)
                     messagebox.showinfo("Tournament Victory", f"You won the tournament and earned {prize} gold!")
                 else:
                     self.add_event("You were defeated in the tournament.")
@@ -711,9 +874,9 @@ class MedievalSimulator:
         
         # Merchant actions
         elif action == "Trade":
-            trade_profit = random.randint(20, 60)
+            trade_profit = rng.randint(20, 60)
             self.player["wealth"] += trade_profit
-            self.add_event(f"You conducted trade and earned {trade_profit} gold.")
+            self.add_event("You conducted trade and earned {} gold.", trade_profit)
             messagebox.showinfo("Trade", f"Your trading was successful. You earned {trade_profit} gold.")
             
         elif action == "Negotiate":
@@ -728,29 +891,29 @@ class MedievalSimulator:
             if investment_amount:
                 if self.player["wealth"] >= investment_amount:
                     self.player["wealth"] -= investment_amount
-                    self.add_event(f"You invested {investment_amount} gold in a business venture.")
+                    self.add_event("You invested {} gold in a business venture.", investment_amount)
                     messagebox.showinfo("Investment", "Your investment will yield returns in the future.")
                 else:
                     messagebox.showerror("Insufficient Funds", "You don't have enough gold for this investment.")
         
         # Tavern Owner actions
         elif action == "Serve Drinks":
-            earnings = random.randint(15, 40)
+            earnings = rng.randint(15, 40)
             self.player["wealth"] += earnings
-            self.add_event(f"You served drinks at your tavern and earned {earnings} gold.")
+            self.add_event("You served drinks at your tavern and earned {} gold.", earnings)
             messagebox.showinfo("Tavern Business", f"You earned {earnings} gold from serving drinks.")
             
         elif action == "Hire Bard":
             bard_cost = 30
             if self.player["wealth"] >= bard_cost:
                 self.player["wealth"] -= bard_cost
-                self.add_event(f"You hired a bard for {bard_cost} gold to entertain your customers.")
+                self.add_event("You hired a bard for {} gold to entertain your customers.", bard_cost)
                 
                 # Chance for increased business
-                if random.random() < 0.7:  # 70% chance
-                    bonus = random.randint(40, 70)
+                if rng.random() < 0.7:  # 70% chance
+                    bonus = rng.randint(40, 70)
                     self.player["wealth"] += bonus
-                    self.add_event(f"The bard attracted more customers, earning you an extra {bonus} gold!")
+                    self.add_event("The bard attracted more customers, earning you an extra {} gold!", bonus)
                     messagebox.showinfo("Bard Performance", f"The bard's performance was a hit! You earned an extra {bonus} gold.")
                 else:
                     messagebox.showinfo("Bard Performance", "The bard's performance was average. Your customers were entertained.")
@@ -770,46 +933,46 @@ class MedievalSimulator:
             
         elif action == "Harvest":
             if self.current_season in ["Summer", "Fall"]:
-                harvest_amount = random.randint(20, 50)
+                harvest_amount = rng.randint(20, 50)
                 self.player["wealth"] += harvest_amount
-                self.add_event(f"You harvested your crops and earned {harvest_amount} gold at the market.")
+                self.add_event("You harvested your crops and earned {} gold at the market.", harvest_amount)
                 messagebox.showinfo("Harvest", f"Your harvest was successful! You earned {harvest_amount} gold.")
             else:
                 self.add_event("It's not the right season for harvesting.")
                 messagebox.showinfo("Harvest", "It's not the right season for harvesting. Try again in Summer or Fall.")
                 
         elif action == "Sell Produce":
-            earnings = random.randint(10, 30)
+            earnings = rng.randint(10, 30)
             self.player["wealth"] += earnings
-            self.add_event(f"You sold some of your produce at the market for {earnings} gold.")
+            self.add_event("You sold some of your produce at the market for {} gold.", earnings)
             messagebox.showinfo("Market", f"You sold your produce and earned {earnings} gold.")
         
         # Peasant actions
         elif action == "Work":
-            earnings = random.randint(5, 15)
+            earnings = rng.randint(5, 15)
             self.player["wealth"] += earnings
-            self.add_event(f"You worked hard and earned {earnings} gold.")
+            self.add_event("You worked hard and earned {} gold.", earnings)
             messagebox.showinfo("Work", f"You worked hard and earned {earnings} gold.")
             
         elif action == "Forage":
             self.add_event("You foraged in the nearby woods for food and resources.")
-            if random.random() < 0.4:  # 40% chance
-                forage_amount = random.randint(3, 10)
+            if rng.random() < 0.4:  # 40% chance
+                forage_amount = rng.randint(3, 10)
                 self.player["wealth"] += forage_amount
-                self.add_event(f"You found items worth {forage_amount} gold while foraging!")
+                self.add_event("You found items worth {} gold while foraging!", forage_amount)
                 messagebox.showinfo("Foraging", f"You found valuable herbs and mushrooms worth {forage_amount} gold!")
             else:
                 messagebox.showinfo("Foraging", "You found some food for yourself, but nothing of significant value.")
                 
         elif action == "Beg":
-            earnings = random.randint(1, 8)
+            earnings = rng.randint(1, 8)
             self.player["wealth"] += earnings
-            self.add_event(f"You begged on the streets and received {earnings} gold in charity.")
+            self.add_event("You begged on the streets and received {} gold in charity.", earnings)
             messagebox.showinfo("Begging", f"You received {earnings} gold in charity.")
         
         # Default case
         else:
-            self.add_event(f"You performed the action: {action}")
+            self.add_event("You performed the action: {}", action)
             messagebox.showinfo("Action", f"You performed: {action}")
         
         # Update player info display
@@ -872,37 +1035,16 @@ class MedievalSimulator:
         close_btn.pack(pady=20)
     
     def get_location_npcs(self):
-        """Generate NPCs based on current location"""
-        location_type = self.get_location_type(self.current_location)
-        npcs = []
-        
-        # Generate different NPCs based on location type
-        if location_type == "Capital City":
-            npcs = [
-                {"name": "Lord Harrington", "occupation": "Noble", "attitude": "formal"},
-                {"name": "Master Thomas", "occupation": "Royal Blacksmith", "attitude": "respectful"},
-                {"name": "Lady Elaine", "occupation": "Court Advisor", "attitude": "cautious"},
-                {"name": "Brother Michael", "occupation": "Cathedral Priest", "attitude": "kind"},
-                {"name": "Galen", "occupation": "Royal Guard Captain", "attitude": "stern"}
-            ]
-        elif location_type == "City":
-            npcs = [
-                {"name": "Alderman William", "occupation": "City Official", "attitude": "busy"},
-                {"name": "Goodwife Martha", "occupation": "Tavern Owner", "attitude": "friendly"},
-                {"name": "Master Edwin", "occupation": "Guild Master", "attitude": "proud"},
-                {"name": "Father Thomas", "occupation": "Priest", "attitude": "humble"},
-                {"name": "Sergeant Roderick", "occupation": "City Guard", "attitude": "suspicious"}
-            ]
-        elif location_type == "Village":
-            npcs = [
-                {"name": "Elder Tomas", "occupation": "Village Elder", "attitude": "wise"},
-                {"name": "Goodman John", "occupation": "Farmer", "attitude": "hardworking"},
-                {"name": "Goodwife Emma", "occupation": "Herbalist", "attitude": "caring"},
-                {"name": "Blacksmith Gareth", "occupation": "Blacksmith", "attitude": "strong"},
-                {"name": "Miller's Son Adam", "occupation": "Miller", "attitude": "cheerful"}
-            ]
-        
-        return npcs
+        """Return the residents of the current location, generating them on the first visit"""
+        return self.get_settlement_residents().residents(self.current_location)
+    
+    def get_settlement_residents(self):
+        """Return the lazy resident store for the current world, creating it once per world"""
+        registry = self.get_location_registry()
+        residents = getattr(self, "settlement_residents", None)
+        if residents is None or residents.registry is not registry:
+            residents = self.settlement_residents = SettlementResidents(self.world.get("seed"), registry)
+        return residents
     def interact_with_npc(self, npc, parent_dialog):
         """Handle interaction with an NPC"""
         # Close the NPC list dialog
@@ -990,14 +1132,15 @@ class MedievalSimulator:
     
     def get_dialogue_options(self, npc):
         """Generate dialogue options based on NPC and player"""
+        rng = self.random_streams.stream("dialogue")
         npc_occupation = npc["occupation"]
         player_occupation = self.player["occupation"]
         
         # Base options available to all player types
         options = [
-            ("Ask about local news", f'"Well, the weather has been {random.choice(["fair", "poor", "excellent"])} for the season. ' + 
-                                  f'The {random.choice(["harvest", "hunting", "fishing"])} has been ' + 
-                                  f'{random.choice(["good", "bad", "average"])} this year."'),
+            ("Ask about local news", f'"Well, the weather has been {rng.choice(["fair", "poor", "excellent"])} for the season. ' + 
+                                  f'The {rng.choice(["harvest", "hunting", "fishing"])} has been ' + 
+                                  f'{rng.choice(["good", "bad", "average"])} this year."'),
             
             ("Introduce yourself", f'"A {player_occupation}? Interesting. We don\'t get many of your kind around here."')
         ]
@@ -1005,20 +1148,20 @@ class MedievalSimulator:
         # Add occupation-specific options
         if "Guard" in npc_occupation:
             options.append(("Ask about safety in the area", 
-                         f'"It\'s been {random.choice(["quiet", "troubled", "peaceful"])} lately. ' + 
-                         f'A few reports of {random.choice(["bandits", "wolves", "thieves"])} to the ' + 
-                         f'{random.choice(["north", "south", "east", "west"])}, but nothing too concerning."'))
+                         f'"It\'s been {rng.choice(["quiet", "troubled", "peaceful"])} lately. ' + 
+                         f'A few reports of {rng.choice(["bandits", "wolves", "thieves"])} to the ' + 
+                         f'{rng.choice(["north", "south", "east", "west"])}, but nothing too concerning."'))
         
         elif "Merchant" in npc_occupation or "Blacksmith" in npc_occupation or npc_occupation == "Tavern Owner":
             options.append(("Ask about goods for sale", 
-                         f'"I have the finest {random.choice(["goods", "wares", "merchandise"])} in the area. ' + 
-                         f'My prices are {random.choice(["fair", "reasonable", "the best you will find"])}, ' + 
+                         f'"I have the finest {rng.choice(["goods", "wares", "merchandise"])} in the area. ' + 
+                         f'My prices are {rng.choice(["fair", "reasonable", "the best you will find"])}, ' + 
                          f'I assure you."'))
         
         elif "Priest" in npc_occupation:
             options.append(("Ask for a blessing", 
                          f'"May the heavens smile upon you and guide your path. ' + 
-                         f'These are {random.choice(["challenging", "blessed", "interesting"])} times we live in."'))
+                         f'These are {rng.choice(["challenging", "blessed", "interesting"])} times we live in."'))
         
         # Add special options based on player occupation
         if player_occupation == "King" or player_occupation == "Noble":
@@ -1028,8 +1171,8 @@ class MedievalSimulator:
         elif player_occupation == "Knight":
             options.append(("Ask about quests or missions", 
                           f'"A knight seeking glory? Well, there have been reports of ' + 
-                          f'{random.choice(["bandits", "a monster", "raiders"])} near the ' + 
-                          f'{random.choice(["forest", "hills", "old bridge"])}."'))
+                          f'{rng.choice(["bandits", "a monster", "raiders"])} near the ' + 
+                          f'{rng.choice(["forest", "hills", "old bridge"])}."'))
         
         return options
     
@@ -1049,6 +1192,7 @@ class MedievalSimulator:
     
     def show_family_screen(self):
         """Show the player's family information"""
+        rng = self.random_streams.stream("family")
         # Create dialog for family screen
         dialog = tk.Toplevel(self.root)
         dialog.title("Family")
@@ -1081,7 +1225,7 @@ class MedievalSimulator:
                 # Convert to new format
                 self.player["spouse"] = {
                     "name": spouse,
-                    "age": random.randint(16, 40),
+                    "age": rng.randint(16, 40),
                     "traits": self.generate_traits(),
                     "relationship": 75
                 }
@@ -1137,8 +1281,8 @@ class MedievalSimulator:
                     # Convert to new format
                     child = {
                         "name": child,
-                        "gender": random.choice(["male", "female"]),
-                        "age": random.randint(0, 10),
+                        "gender": rng.choice(["male", "female"]),
+                        "age": rng.randint(0, 10),
                         "traits": self.generate_traits(),
                         "relationship": 100
                     }
@@ -1178,6 +1322,7 @@ class MedievalSimulator:
     
     def find_spouse(self):
         """Find potential spouses based on player's status and location"""
+        rng = self.random_streams.stream("family")
         # Check if already married
         if self.player.get("spouse"):
             self.show_dialog("Marriage", "You are already married.")
@@ -1189,11 +1334,11 @@ class MedievalSimulator:
         # Number of potential spouses based on location type
         location_type = self.get_location_type(self.current_location)
         if location_type == "City" or location_type == "Capital City":
-            num_spouses = random.randint(3, 5)
+            num_spouses = rng.randint(3, 5)
         elif location_type == "Town":
-            num_spouses = random.randint(2, 4)
+            num_spouses = rng.randint(2, 4)
         else:  # Village
-            num_spouses = random.randint(1, 3)
+            num_spouses = rng.randint(1, 3)
             
         # Get player's gender (ensure it's lowercase for consistency)
         player_gender = self.player["gender"].lower() if isinstance(self.player["gender"], str) else "male"
@@ -1208,9 +1353,9 @@ class MedievalSimulator:
             
             # Age range (slightly younger for female spouses in medieval times)
             if gender == "female":
-                age = random.randint(16, self.player["age"])
+                age = rng.randint(16, self.player["age"])
             else:
-                age = random.randint(self.player["age"] - 5, self.player["age"] + 10)
+                age = rng.randint(self.player["age"] - 5, self.player["age"] + 10)
                 
             # Cap age
             age = max(16, min(age, 45))
@@ -1219,14 +1364,14 @@ class MedievalSimulator:
             traits = self.generate_traits()
             
             # Wealth based on traits and random factors
-            base_wealth = random.randint(10, 50)
+            base_wealth = rng.randint(10, 50)
             if "wealthy" in traits:
                 base_wealth *= 3
             elif "poor" in traits:
                 base_wealth = max(5, base_wealth // 2)
                 
             # Calculate dowry based on wealth
-            dowry = base_wealth * random.randint(1, 3)
+            dowry = base_wealth * rng.randint(1, 3)
             
             # Create spouse data
             spouse = {
@@ -1236,7 +1381,7 @@ class MedievalSimulator:
                 "traits": traits,
                 "wealth": base_wealth,
                 "dowry": dowry,  # Add dowry field
-                "relationship": random.randint(30, 70)  # Initial relationship score
+                "relationship": rng.randint(30, 70)  # Initial relationship score
             }
             
             potential_spouses.append(spouse)
@@ -1330,7 +1475,7 @@ class MedievalSimulator:
                        f"You have a lovely ceremony, and your new spouse moves into your home in {self.current_location}.")
         
         # Add event
-        self.add_event(f"You married {spouse['name']}.")
+        self.add_event("You married {}.", spouse['name'])
         
         # Update UI
         self.update_player_info()
@@ -1478,6 +1623,7 @@ class MedievalSimulator:
     
     def generate_market_items(self):
         """Generate items for the market"""
+        rng = self.random_streams.stream("market")
         # Create a list of market items
         market_items = []
         
@@ -1520,14 +1666,14 @@ class MedievalSimulator:
         ]
         
         # Add some random items from each category
-        market_items.extend(random.sample(food_items, min(3, len(food_items))))
-        market_items.extend(random.sample(potion_items, min(2, len(potion_items))))
-        market_items.extend(random.sample(book_items, min(1, len(book_items))))
-        market_items.extend(random.sample(weapon_items, min(2, len(weapon_items))))
-        market_items.extend(random.sample(armor_items, min(1, len(armor_items))))
+        market_items.extend(rng.sample(food_items, min(3, len(food_items))))
+        market_items.extend(rng.sample(potion_items, min(2, len(potion_items))))
+        market_items.extend(rng.sample(book_items, min(1, len(book_items))))
+        market_items.extend(rng.sample(weapon_items, min(2, len(weapon_items))))
+        market_items.extend(rng.sample(armor_items, min(1, len(armor_items))))
         
         # Shuffle the items
-        random.shuffle(market_items)
+        rng.shuffle(market_items)
         
         return market_items
     
@@ -1582,7 +1728,7 @@ class MedievalSimulator:
             gold_label.config(text=f"Your Gold: {self.player['wealth']}")
             
             # Add event
-            self.add_event(f"You purchased {item['name']} for {item['price']} gold.")
+            self.add_event("You purchased {} for {} gold.", item['name'], item['price'])
             
             # Update player info in main screen
             self.update_player_info()
@@ -1608,7 +1754,7 @@ class MedievalSimulator:
                 gold_label.config(text=f"Your Gold: {self.player['wealth']}")
             
             # Add event
-            self.add_event(f"You sold {item['name']} for {sell_value} gold.")
+            self.add_event("You sold {} for {} gold.", item['name'], sell_value)
             
             # Update player info
             self.update_player_info()
@@ -1788,7 +1934,7 @@ class MedievalSimulator:
             wealth_label.config(text=f"Gold: {self.player['wealth']}")
             
             # Add event
-            self.add_event(f"You sold {item['name']} for {sell_price} gold.")
+            self.add_event("You sold {} for {} gold.", item['name'], sell_price)
             
             # Update player info in main screen
             self.update_player_info()
@@ -1804,7 +1950,7 @@ class MedievalSimulator:
             # Food items restore health
             health_gain = item.get("health_value", 10)
             self.player["health"] = min(100, self.player["health"] + health_gain)
-            message = f"You consumed {item['name']} and gained {health_gain} health."
+            event = ("You consumed {} and gained {} health.", item['name'], health_gain)
             
         elif item["type"] == "Potion":
             # Potions have special effects
@@ -1812,7 +1958,7 @@ class MedievalSimulator:
             if effect == "health":
                 health_gain = item.get("health_value", 20)
                 self.player["health"] = min(100, self.player["health"] + health_gain)
-                message = f"You drank {item['name']} and gained {health_gain} health."
+                event = ("You drank {} and gained {} health.", item['name'], health_gain)
             elif effect == "skill":
                 skill = item.get("skill", "combat")
                 skill_gain = item.get("skill_value", 1)
@@ -1826,7 +1972,7 @@ class MedievalSimulator:
                     self.player["skills"][skill] = 0
                     
                 self.player["skills"][skill] += skill_gain
-                message = f"You drank {item['name']} and gained {skill_gain} {skill} skill."
+                event = ("You drank {} and gained {} {} skill.", item['name'], skill_gain, skill)
                 
         elif item["type"] == "Book":
             # Books improve skills
@@ -1842,17 +1988,17 @@ class MedievalSimulator:
                 self.player["skills"][skill] = 0
                 
             self.player["skills"][skill] += skill_gain
-            message = f"You read {item['name']} and gained {skill_gain} {skill} skill."
+            event = ("You read {} and gained {} {} skill.", item['name'], skill_gain, skill)
             
         else:
             # Generic usable item
-            message = f"You used {item['name']}."
+            event = ("You used {}.", item['name'])
         
         # Remove item from inventory
         self.player["inventory"].remove(item)
         
         # Add event
-        self.add_event(message)
+        message = self.add_event(*event)
         
         # Show result
         self.show_dialog("Item Used", message)
@@ -1866,6 +2012,7 @@ class MedievalSimulator:
     
     def generate_name(self, gender):
         """Generate a random medieval name based on gender"""
+        rng = self.random_streams.stream("characters")
         male_names = [
             "William", "Robert", "John", "Richard", "Thomas", "Henry", "Edward", "Walter",
             "Hugh", "Simon", "Geoffrey", "Adam", "Stephen", "Peter", "Nicholas", "Roger",
@@ -1879,9 +2026,9 @@ class MedievalSimulator:
         ]
         
         if gender == "male":
-            return random.choice(male_names)
+            return rng.choice(male_names)
         else:
-            return random.choice(female_names)
+            return rng.choice(female_names)
     
     def equip_item(self, item, dialog=None):
         """Equip a weapon or armor item"""
@@ -1901,8 +2048,7 @@ class MedievalSimulator:
         self.player["equipment"][slot] = item
         
         # Add event
-        message = f"You equipped {item['name']}."
-        self.add_event(message)
+        message = self.add_event("You equipped {}.", item['name'])
         
         # Show result
         self.show_dialog("Item Equipped", message)
@@ -1942,8 +2088,7 @@ class MedievalSimulator:
         del self.player["equipment"][slot]
         
         # Add event
-        message = f"You unequipped {item['name']}."
-        self.add_event(message)
+        message = self.add_event("You unequipped {}.", item['name'])
         
         # Show result
         self.show_dialog("Item Unequipped", message)
@@ -2094,8 +2239,77 @@ class MedievalSimulator:
     
     def show_travel_options(self):
         """Show available travel destinations"""
-        messagebox.showinfo("Travel", "Travel options will be implemented in a future update.")
-        # TODO: Implement travel functionality
+        routes = self.get_route_network()
+        
+        # Create a dialog window
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Travel")
+        dialog.geometry("450x500")
+        dialog.configure(bg="#f0e6d2")
+        
+        # Make dialog modal
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # Title
+        title = tk.Label(dialog, text=f"Where would you like to go from {self.current_location}?", 
+                       font=self.header_font, bg="#f0e6d2", fg="#5c4425", wraplength=400)
+        title.pack(pady=20)
+        
+        destinations_frame = tk.Frame(dialog, bg="#f0e6d2")
+        destinations_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        # Settlements one road away, others close by, then the capitals of every kingdom
+        destinations = [name for name, days in routes.neighbours(self.current_location)]
+        for name, miles in self.get_spatial_index().near(self.current_location, NEARBY_MILES):
+            if name not in destinations:
+                destinations.append(name)
+        for kingdom_data in self.world["kingdoms"].values():
+            capital = kingdom_data["capital"]
+            if capital != self.current_location and capital not in destinations:
+                destinations.append(capital)
+        
+        for destination in destinations:
+            days, path = routes.route(self.current_location, destination)
+            if days is None:
+                continue
+            via = f" via {', '.join(path[1:-1])}" if len(path) > 2 else ""
+            destination_btn = tk.Button(destinations_frame, 
+                                      text=f"{destination} ({self.get_location_type(destination)}) - {days} days{via}", 
+                                      command=lambda d=destination: self.travel_to(d, dialog),
+                                      font=self.text_font, bg="#e6d8bf", fg="#5c4425", 
+                                      anchor="w", justify=tk.LEFT, wraplength=380)
+            destination_btn.pack(fill=tk.X, pady=3)
+        
+        # Close button
+        close_btn = tk.Button(dialog, text="Stay", command=dialog.destroy, 
+                            **self.get_button_style("medium"))
+        close_btn.pack(pady=20)
+    
+    def get_route_network(self):
+        """Return the road network for the current world, building it once per world"""
+        registry = self.get_location_registry()
+        routes = getattr(self, "route_network", None)
+        if routes is None or routes.registry is not registry:
+            routes = self.route_network = RouteNetwork(registry, self.world["kingdoms"], self.world.get("seed"))
+        return routes
+    
+    def get_spatial_index(self):
+        """Return the map of settlement positions for the current world, building it once per world"""
+        kingdoms = self.world["kingdoms"]
+        spatial = getattr(self, "spatial_index", None)
+        if spatial is None or self.spatial_kingdoms is not kingdoms:
+            spatial = self.spatial_index = SpatialIndex(layout(kingdoms, self.world.get("seed")))
+            self.spatial_kingdoms = kingdoms
+        return spatial
+    
+    def travel_to(self, destination, dialog):
+        """Move the player to another settlement along the fastest road"""
+        dialog.destroy()
+        days, path = self.get_route_network().route(self.current_location, destination)
+        self.add_event("You travel from {} to {}, a journey of {} days.", self.current_location, destination, days)
+        self.current_location = destination
+        self.show_game_interface()
     
     def advance_season(self):
         """Advance the game by one season"""
@@ -2109,10 +2323,13 @@ class MedievalSimulator:
         if self.season_index == 0:  # Back to Spring
             self.current_year += 1
             self.player["age"] += 1
-            self.add_event(f"You are now {self.player['age']} years old.")
+            self.add_event("You are now {} years old.", self.player['age'])
         
         # Add season change event
-        self.add_event(f"The season has changed to {self.current_season}.")
+        self.add_event("The season has changed to {}.", self.current_season)
+        
+        # Autosave into the next slot of the ring; this thread only copies the state
+        self.get_autosave().save(self.save_state(), on_done=self.autosave_finished)
         
         # Update the game interface
         self.show_game_interface()
@@ -2230,11 +2447,12 @@ class MedievalSimulator:
     
     def talk_to_spouse(self, parent_dialog):
         """Talk to spouse to improve relationship"""
+        rng = self.random_streams.stream("family")
         spouse = self.player["spouse"]
-        relationship_increase = random.randint(1, 5)
+        relationship_increase = rng.randint(1, 5)
         spouse["relationship"] = min(100, spouse["relationship"] + relationship_increase)
         
-        self.add_event(f"You had a pleasant conversation with your spouse, {spouse['name']}.")
+        self.add_event("You had a pleasant conversation with your spouse, {}.", spouse['name'])
         messagebox.showinfo("Talk", f"You had a nice conversation with {spouse['name']}. Relationship improved by {relationship_increase} points.", parent=parent_dialog)
         
         # Refresh the dialog
@@ -2319,7 +2537,7 @@ class MedievalSimulator:
         spouse["relationship"] = min(100, spouse["relationship"] + relationship_increase)
         
         # Add event
-        self.add_event(f"You gave {item['name']} as a gift to your spouse, {spouse['name']}.")
+        self.add_event("You gave {} as a gift to your spouse, {}.", item['name'], spouse['name'])
         
         # Show message
         messagebox.showinfo("Gift Given", 
@@ -2334,8 +2552,9 @@ class MedievalSimulator:
     
     def go_on_outing_with_spouse(self, parent_dialog):
         """Go on an outing with spouse to improve relationship"""
+        rng = self.random_streams.stream("family")
         # Check if player has enough gold
-        outing_cost = random.randint(10, 30)
+        outing_cost = rng.randint(10, 30)
         if self.player["wealth"] < outing_cost:
             messagebox.showinfo("Insufficient Funds", 
                               f"You need {outing_cost} gold to go on an outing.", 
@@ -2346,7 +2565,7 @@ class MedievalSimulator:
         self.player["wealth"] -= outing_cost
         
         # Calculate relationship increase
-        relationship_increase = random.randint(5, 15)
+        relationship_increase = rng.randint(5, 15)
         
         # Update spouse relationship
         spouse = self.player["spouse"]
@@ -2360,10 +2579,10 @@ class MedievalSimulator:
             f"a visit to a nearby village",
             f"a picnic in the countryside"
         ]
-        outing = random.choice(outings)
+        outing = rng.choice(outings)
         
         # Add event
-        self.add_event(f"You took your spouse, {spouse['name']}, on {outing}.")
+        self.add_event("You took your spouse, {}, on {}.", spouse['name'], outing)
         
         # Show message
         messagebox.showinfo("Outing", 
@@ -2381,6 +2600,7 @@ class MedievalSimulator:
     
     def try_for_child(self, parent_dialog):
         """Try to have a child with spouse"""
+        rng = self.random_streams.stream("family")
         spouse = self.player["spouse"]
         
         # Check if relationship is good enough
@@ -2405,9 +2625,9 @@ class MedievalSimulator:
         success_chance += (spouse["relationship"] - 70) / 100
         
         # Try for child
-        if random.random() < success_chance:
+        if rng.random() < success_chance:
             # Success! Create child
-            child_gender = random.choice(["male", "female"])
+            child_gender = rng.choice(["male", "female"])
             child_name = self.generate_name(child_gender)
             
             # Create child data
@@ -2426,7 +2646,7 @@ class MedievalSimulator:
             self.player["children"].append(child)
             
             # Add event
-            self.add_event(f"Your spouse, {spouse['name']}, gave birth to a {child_gender} child named {child_name}.")
+            self.add_event("Your spouse, {}, gave birth to a {} child named {}.", spouse['name'], child_gender, child_name)
             
             # Show message
             messagebox.showinfo("Child Born", 
@@ -0,0 +1,129 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from headless_runner import build_world
+
+
+def summarize_world(seed, population, seasons):
+    """Simulate one world in this process and return only a small summary dict"""
+    world = build_world(population, seed)
+    
+    # Follow the oldest household head so there is a dynasty to continue
+    heads = [c for c in world.characters.values() if c.children]
+    world.player = max(heads, key=lambda c: c.age) if heads else None
+    if world.player is not None:
+        # Their home kingdom is the one simulated person by person
+        world.set_player_location(world.registry.names[world.player.location])
+    
+    seasons_run = 0
+    dynasty_ended = False
+    for _ in range(seasons):
+        if not world.advance_time():
+            dynasty_ended = True
+            break
+        seasons_run += 1
+    
+    # Per-occupation [deaths, total age at death, total wealth at death]
+    deaths = {}
+    for record in world.archive.records():
+        entry = deaths.setdefault(record["occupation"], [0, 0, 0])
+        entry[0] += 1
+        entry[1] += record["age"]
+        entry[2] += record["wealth"]
+    
+    return {
+        "seed": seed,
+        "seasons": seasons_run,
+        "dynasty_ended": dynasty_ended,
+        "deaths": deaths
+    }
+
+
+def summarize_chunk(seeds, population, seasons):
+    # One task per chunk of seeds keeps IPC overhead small relative to simulation work
+    return [summarize_world(seed, population, seasons) for seed in seeds]
+
+
+class Aggregate:
+    """Running totals merged from per-world summaries"""
+    
+    def __init__(self):
+        self.worlds = 0
+        self.dynasties_ended = 0
+        self.seasons = 0
+        self.deaths = {}
+    
+    def add(self, summary):
+        self.worlds += 1
+        self.seasons += summary["seasons"]
+        if summary["dynasty_ended"]:
+            self.dynasties_ended += 1
+        for occupation, (count, total_age, total_wealth) in summary["deaths"].items():
+            entry = self.deaths.setdefault(occupation, [0, 0, 0])
+            entry[0] += count
+            entry[1] += total_age
+            entry[2] += total_wealth
+    
+    def report(self):
+        by_occupation = {}
+        for occupation, (count, total_age, total_wealth) in sorted(self.deaths.items()):
+            by_occupation[occupation] = {
+                "deaths": count,
+                "life_expectancy": total_age / count,
+                "mean_wealth_at_death": total_wealth / count
+            }
+        return {
+            "worlds": self.worlds,
+            "dynasty_end_rate": self.dynasties_ended / self.worlds if self.worlds else 0.0,
+            "mean_seasons": self.seasons / self.worlds if self.worlds else 0.0,
+            "by_occupation": by_occupation
+        }
+
+
+def run_monte_carlo(worlds, population=500, seasons=200, base_seed=0, workers=None, chunk_size=None,
+                    on_summary=None):
+    """Run independent worlds across a process pool and merge their summaries as they arrive"""
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker balances load without flooding the pool with tiny tasks
+        chunk_size = max(1, worlds // (workers * 4))
+    
+    seeds = list(range(base_seed, base_seed + worlds))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, worlds, chunk_size)]
+    
+    aggregate = Aggregate()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(summarize_chunk, chunk, population, seasons) for chunk in chunks]
+        for future in as_completed(futures):
+            for summary in future.result():
+                aggregate.add(summary)
+                if on_summary:
+                    on_summary(summary)
+    return aggregate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many independent worlds and aggregate their outcomes")
+    parser.add_argument("-n", "--worlds", type=int, default=100, help="number of independent worlds")
+    parser.add_argument("-p", "--population", type=int, default=500, help="characters seeded per world")
+    parser.add_argument("-s", "--seasons", type=int, default=200, help="seasons simulated per world")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first world; world i uses seed + i")
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    aggregate = run_monte_carlo(args.worlds, args.population, args.seasons, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    report = aggregate.report()
+    
+    print(f"Simulated {report['worlds']} worlds in {elapsed:.2f}s ({report['worlds'] / elapsed:.1f} worlds/s)")
+    print(f"Dynasty ended without an heir in {report['dynasty_end_rate']:.1%} of worlds")
+    for occupation, stats in report["by_occupation"].items():
+        print(f"  {occupation:<13} life expectancy {stats['life_expectancy']:5.1f}  "
+              f"wealth at death {stats['mean_wealth_at_death']:7.1f}  ({stats['deaths']} deaths)")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import sys
+import tracemalloc
+from enum import IntEnum
+import numpy as np
+from relationships import RelationshipGraph
+from dynasty import DynastyIndex
+
+
+class Skill(IntEnum):
+    """Column index of each skill in PopulationStore.skills"""
+    COMBAT = 0
+    DIPLOMACY = 1
+    STEWARDSHIP = 2
+    FARMING = 3
+    CRAFTING = 4
+    MEDICINE = 5
+    TRADING = 6
+
+
+SKILLS = [skill.name.lower() for skill in Skill]
+SKILL_INDEX = {name: skill for name, skill in zip(SKILLS, Skill)}
+
+# The fixed trait vocabulary; a character's traits are a bitmask over this list
+TRAITS = ["brave", "cowardly", "ambitious", "content", "honest", "deceitful",
+          "loyal", "treacherous", "kind", "cruel", "pious", "cynical"]
+TRAIT_BITS = {trait: 1 << i for i, trait in enumerate(TRAITS)}
+
+
+def encode_traits(traits):
+    """Pack a list of trait names into a bitmask"""
+    mask = 0
+    for trait in traits:
+        mask |= TRAIT_BITS[trait]
+    return mask
+
+
+def decode_traits(mask):
+    """Unpack a trait bitmask into names, in vocabulary order"""
+    return [trait for trait, bit in TRAIT_BITS.items() if mask & bit]
+
+
+class PopulationStore:
+    """Columnar storage for every character's numeric state, one array per field"""
+    
+    # Per-character scalar columns and their dtypes
+    COLUMNS = {
+        "age": np.int16,
+        "health": np.int16,
+        "wealth": np.int64,
+        "reputation": np.int16,
+        "alive": np.bool_,
+        "traits": np.uint16,
+        "location": np.int32,  # Registry id of the character's home settlement, -1 if none
+        "updated": np.int16  # Year the row was last aged to; behind only while its kingdom is out of focus
+    }
+    
+    def __init__(self, capacity=1024):
+        self.size = 0  # Rows handed out so far; row index == character id
+        self.capacity = max(1, capacity)
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        self.skills = np.zeros((self.capacity, len(Skill)), dtype=np.int16)
+        
+        # Compact index of living ids, so per-season passes cost O(living) rather than O(everyone ever born).
+        # Births and deaths are buffered and folded in the next time the index is read.
+        self._living = np.empty(0, dtype=np.int64)
+        self._born = []
+        self._died = []
+        
+        # Who thinks what of whom, keyed by the same ids
+        self.relationships = RelationshipGraph()
+        # Family trees and cached lines of succession
+        self.dynasty = DynastyIndex(self)
+    
+    @classmethod
+    def from_columns(cls, columns, relationships=None):
+        """Rebuild a store from saved column() arrays, e.g. World.save_state's "population" section"""
+        size = len(columns["age"])
+        store = cls(capacity=size)
+        for name in [*cls.COLUMNS, "skills"]:
+            getattr(store, name)[:size] = columns[name]
+        store.size = size
+        store._living = np.flatnonzero(store.alive[:size])
+        if relationships is not None:
+            store.relationships = relationships
+        return store
+    
+    def __len__(self):
+        return self.size
+    
+    def allocate(self):
+        """Reserve a row for a new character and return its id"""
+        if self.size == self.capacity:
+            self.grow(self.capacity * 2)
+        row = self.size
+        self.size += 1
+        self.alive[row] = True
+        self.location[row] = -1
+        self._born.append(row)
+        return row
+    
+    def grow(self, capacity):
+        # Reallocate every column; Person views hold the store, not the arrays, so they stay valid
+        for name in list(self.COLUMNS) + ["skills"]:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+        self.capacity = capacity
+    
+    def column(self, name):
+        """Return the live slice of a column covering all allocated rows"""
+        return getattr(self, name)[:self.size]
+    
+    def living_ids(self):
+        """Ids of every character still alive"""
+        if self._born:
+            self._living = np.concatenate([self._living, np.asarray(self._born, dtype=np.int64)])
+            self._born = []
+        if self._died:
+            self._living = self._living[self.alive[self._living]]
+            self._died = []
+        return self._living
+    
+    def set_alive(self, row, alive):
+        """Mark a character alive or dead, keeping the living index in step"""
+        if bool(self.alive[row]) == bool(alive):
+            return
+        self.alive[row] = alive
+        if alive:
+            self._born.append(row)
+        else:
+            self._died.append(row)
+        if row in self.dynasty.members:
+            self.dynasty.invalidate(row)
+    
+    def age_up(self, rng, ids=None):
+        """Age every living character (or just ids) a year and roll natural death for all of them at once
+        
+        Mirrors Person.age_up: past 40 the death chance is (age - 40) * 2 percent, plus 10
+        for poor health. Returns the ids that failed their roll; the caller kills them.
+        """
+        ids = self.living_ids() if ids is None else ids
+        return ids[self.age_rows(ids, rng)]
+    
+    def catch_up(self, ids, year, rng):
+        """Bring rows last aged in an earlier year up to year, one age_up roll per missed year
+        
+        Returns the ids that died on the way and the year each of them died in.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        start = self.updated[ids].astype(np.int64)
+        dead = np.zeros(len(ids), dtype=np.bool_)
+        died = np.zeros(len(ids), dtype=np.int64)
+        for missed in range(1, int((year - start).max(initial=0)) + 1):
+            active = np.flatnonzero(~dead & (start + missed <= year))
+            failed = active[self.age_rows(ids[active], rng)]
+            dead[failed] = True
+            died[failed] = start[failed] + missed
+        self.updated[ids] = year
+        return ids[dead], died[dead]
+    
+    def age_rows(self, ids, rng):
+        # One year older, and a mask of who failed their death roll
+        ages = self.age[ids] + 1
+        self.age[ids] = ages
+        
+        ages = ages.astype(np.int32)
+        death_chance = (ages - 40) * 2 + np.where(self.health[ids] < 50, 10, 0)
+        death_chance = np.where(ages > 40, death_chance, 0)
+        
+        rolls = rng.integers(1, 101, size=len(ids))
+        return rolls <= death_chance
+    
+    def copy_row(self, row, other):
+        """Copy one character's row into another store and return the new id"""
+        new_row = other.allocate()
+        for name in list(self.COLUMNS) + ["skills"]:
+            if name != "alive":
+                getattr(other, name)[new_row] = getattr(self, name)[row]
+        other.set_alive(new_row, self.alive[row])
+        return new_row
+
+
+class SkillsView:
+    """Dict-like view of one character's skills row"""
+    
+    __slots__ = ("_store", "_row")
+    
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+    
+    def __getitem__(self, skill):
+        return int(self._store.skills[self._row, skill_index(skill)])
+    
+    def __setitem__(self, skill, value):
+        self._store.skills[self._row, skill_index(skill)] = value
+    
+    def __contains__(self, skill):
+        return skill in SKILL_INDEX or isinstance(skill, Skill)
+    
+    def __iter__(self):
+        return iter(SKILLS)
+    
+    def __len__(self):
+        return len(SKILLS)
+    
+    def get(self, skill, default=None):
+        if skill in SKILL_INDEX:
+            return self[skill]
+        return default
+    
+    def keys(self):
+        return list(SKILLS)
+    
+    def values(self):
+        return [int(v) for v in self._store.skills[self._row]]
+    
+    def items(self):
+        return list(zip(SKILLS, self.values()))
+    
+    def __eq__(self, other):
+        return dict(self.items()) == dict(other.items()) if hasattr(other, "items") else NotImplemented
+    
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def skill_index(skill):
+    # Accept either a Skill member or its lowercase name
+    if isinstance(skill, Skill):
+        return skill
+    return SKILL_INDEX[skill]
+
+
+def column_property(name):
+    """Expose a PopulationStore column as a plain attribute of a row view"""
+    def get(self):
+        return getattr(self._store, name)[self.id].item()
+    
+    def set(self, value):
+        getattr(self._store, name)[self.id] = value
+    
+    return property(get, set)
+
+
+# Characters created without an explicit store (e.g. before a World exists) live here
+default_population = PopulationStore()
+
+
+def measure_bytes_per_person(count=100000):
+    """Create count characters in a fresh store and return the traced bytes each one costs"""
+    from game_logic import Person
+    
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    store = PopulationStore(capacity=count)
+    people = [Person("John", 30, "male", "Farmer", population=store) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list used to hold the people, which a World's character dict replaces
+    total -= sys.getsizeof(people)
+    return total / count
+
+
+if __name__ == "__main__":
+    print(f"{measure_bytes_per_person():.1f} bytes per resident character")
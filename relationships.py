@@ -0,0 +1,297 @@
+import numpy as np
+
+# Relationship scores run from -100 (enemy) to 100 (best friend)
+MIN_SCORE = -100
+MAX_SCORE = 100
+
+
+class RelationshipGraph:
+    """Sparse, world-wide relationship scores stored CSR-style (one row of edges per character)
+    
+    Single writes go to a small overlay of changed scores that reads consult alongside the
+    compressed arrays, so one Person.relations write or lookup costs a dict access, not a pass
+    over every edge. Bulk update_many arrays and node removals are buffered as well; everything
+    is merged in one pass once the overlay outgrows buffer_limit or a whole-graph read needs it.
+    """
+    
+    buffer_limit = 1 << 16  # Pending single-pair changes kept before they are merged
+    
+    def __init__(self):
+        self.num_nodes = 0
+        self.indptr = np.zeros(1, dtype=np.int64)  # Row i's edges are indices/weights[indptr[i]:indptr[i + 1]]
+        self.indices = np.empty(0, dtype=np.int32)
+        self.weights = np.empty(0, dtype=np.float32)
+        self._overlay = {}  # source -> {target: score}, written since the last merge
+        self._buffered = 0  # Pairs in the overlay
+        self._removed = set()  # Nodes whose stored edges are dropped on the next merge
+        self._bulk = []  # Buffered update_many (sources, targets, deltas) arrays; always the latest changes
+    
+    @classmethod
+    def from_arrays(cls, indptr, indices, weights):
+        """Rebuild a compacted graph from its saved CSR arrays"""
+        graph = cls()
+        graph.num_nodes = len(indptr) - 1
+        graph.indptr = np.array(indptr, dtype=np.int64)
+        graph.indices = np.array(indices, dtype=np.int32)
+        graph.weights = np.array(weights, dtype=np.float32)
+        return graph
+    
+    def __len__(self):
+        self.compact()
+        return len(self.indices)
+    
+    def add(self, source, target, delta):
+        """Change one relationship score by delta"""
+        self.set(source, target, self.get(source, target) + delta)
+    
+    def update_many(self, sources, targets, deltas):
+        """Change many relationship scores at once; repeated pairs accumulate"""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        deltas = np.broadcast_to(np.asarray(deltas, dtype=np.float32), sources.shape)
+        if len(sources):
+            self._bulk.append((sources, targets, deltas))
+    
+    def set(self, source, target, score):
+        """Overwrite one relationship score"""
+        # Bulk arrays are merged first, so the overlay only ever holds the latest changes
+        if self._bulk:
+            self.compact()
+        changes = self._overlay.setdefault(source, {})
+        if target not in changes:
+            self._buffered += 1
+        changes[target] = float(np.float32(min(max(score, MIN_SCORE), MAX_SCORE)))  # As stored
+        if self._buffered > self.buffer_limit:
+            self.compact()
+    
+    def get(self, source, target, default=0):
+        if self._bulk:
+            self.compact()
+        changes = self._overlay.get(source)
+        score = changes[target] if changes and target in changes else self._stored(source, target)
+        return score if score != 0 else default
+    
+    def _stored(self, source, target):
+        # Score in the compressed arrays, or 0 if there is none (or one of the pair was removed)
+        if source >= self.num_nodes or source in self._removed or target in self._removed:
+            return 0.0
+        start, end = self.indptr[source], self.indptr[source + 1]
+        pos = start + np.searchsorted(self.indices[start:end], target)
+        if pos < end and self.indices[pos] == target:
+            return float(self.weights[pos])
+        return 0.0
+    
+    def remove(self, source, target):
+        self.set(source, target, 0)
+    
+    def neighbors(self, source):
+        """Ids and scores of everyone this character has an opinion of"""
+        if self._bulk:
+            self.compact()
+        if source >= self.num_nodes or source in self._removed:
+            ids, scores = self.indices[:0], self.weights[:0]
+        else:
+            start, end = self.indptr[source], self.indptr[source + 1]
+            ids, scores = self.indices[start:end], self.weights[start:end]
+            if self._removed:
+                keep = [target not in self._removed for target in ids.tolist()]
+                ids, scores = ids[keep], scores[keep]
+        changes = self._overlay.get(source)
+        if not changes:
+            return ids, scores
+        # This row with its pending changes, as the next merge will store it
+        row = dict(zip(ids.tolist(), scores.tolist()))
+        row.update(changes)
+        ids = np.array(sorted(target for target, score in row.items() if score != 0), dtype=np.int32)
+        return ids, np.array([row[target] for target in ids.tolist()], dtype=np.float32)
+    
+    def relations_of(self, source):
+        """One character's relationships as a plain {person_id: score} dict"""
+        ids, scores = self.neighbors(source)
+        return dict(zip(ids.tolist(), scores.tolist()))
+    
+    def top_k(self, source, k=5, enemies=False):
+        """The k strongest friends (or enemies) of a character as (id, score) pairs, best first"""
+        ids, scores = self.neighbors(source)
+        if enemies:
+            mask = scores < 0
+            order = np.argsort(scores[mask], kind="stable")
+        else:
+            mask = scores > 0
+            order = np.argsort(-scores[mask], kind="stable")
+        order = order[:k]
+        return list(zip(ids[mask][order].tolist(), scores[mask][order].tolist()))
+    
+    def decay(self, factor, threshold=1.0):
+        """Fade every relationship toward neutral at once, dropping edges that fall below threshold
+        
+        Pending removals are dropped in the same pass; the overlay fades in place and stays pending.
+        """
+        if self._bulk:
+            self.compact()
+        factor = np.float32(factor)
+        self.weights *= factor
+        for changes in self._overlay.values():
+            for target, score in changes.items():
+                score = float(np.float32(score) * factor)
+                changes[target] = score if abs(score) >= threshold else 0.0
+        keep = np.abs(self.weights) >= threshold
+        rows = None
+        if self._removed:
+            rows = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+            keep &= self._kept(rows, self.indices)
+            self._removed = set()
+        if not keep.all():
+            if rows is None:
+                rows = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+            self._rebuild(rows[keep], self.indices[keep], self.weights[keep])
+    
+    def degrees(self):
+        """Number of relationships each character has, indexed by id"""
+        self.compact()
+        return np.diff(self.indptr)
+    
+    def degree_stats(self):
+        degrees = self.degrees()
+        if not len(degrees):
+            return {"nodes": 0, "edges": 0, "mean": 0.0, "max": 0, "isolated": 0}
+        return {
+            "nodes": int(self.num_nodes),
+            "edges": int(degrees.sum()),
+            "mean": float(degrees.mean()),
+            "max": int(degrees.max()),
+            "isolated": int((degrees == 0).sum())
+        }
+    
+    def remove_nodes(self, nodes):
+        """Drop every relationship to and from the given characters (e.g. when they are archived)
+        
+        The stored edges go at the next merge; pending changes touching the nodes go now.
+        """
+        nodes = set(np.asarray(nodes, dtype=np.int64).tolist())
+        if not nodes:
+            return
+        if self._bulk:
+            self.compact()
+        for node in nodes:
+            self._buffered -= len(self._overlay.pop(node, ()))
+        for changes in self._overlay.values():
+            for target in nodes.intersection(changes):
+                del changes[target]
+                self._buffered -= 1
+        self._removed |= nodes
+    
+    def compact(self):
+        """Merge removals and buffered updates into the compressed arrays"""
+        if not (self._overlay or self._bulk or self._removed):
+            return
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+        cols = self.indices.astype(np.int64)
+        weights = self.weights.astype(np.float64)
+        if self._removed:
+            keep = self._kept(rows, cols)
+            rows, cols, weights = rows[keep], cols[keep], weights[keep]
+        # (row, col) as one sorted int64 key; the stored arrays are already in this order
+        keys = (rows << 32) | cols
+        num_nodes = self.num_nodes
+        
+        if self._overlay:
+            pairs = [(source, target, score) for source, changes in self._overlay.items()
+                     for target, score in changes.items()]
+            if pairs:
+                sources, targets, scores = (np.array(column) for column in zip(*pairs))
+                pair_keys = (sources.astype(np.int64) << 32) | targets
+                order = np.argsort(pair_keys)
+                keys, weights = merge(keys, weights, pair_keys[order], True, scores[order].astype(np.float64))
+                num_nodes = max(num_nodes, int(sources.max()) + 1, int(targets.max()) + 1)
+        if self._bulk:
+            sources = np.concatenate([p[0] for p in self._bulk])
+            targets = np.concatenate([p[1] for p in self._bulk])
+            deltas = np.concatenate([p[2] for p in self._bulk])
+            # Sum duplicate pairs first; the result is sorted, ready to merge
+            bulk_keys, inverse = np.unique((sources << 32) | targets, return_inverse=True)
+            keys, weights = merge(keys, weights, bulk_keys, False, np.bincount(inverse, weights=deltas))
+            num_nodes = max(num_nodes, int(sources.max()) + 1, int(targets.max()) + 1)
+        self._overlay, self._buffered, self._removed, self._bulk = {}, 0, set(), []
+        
+        np.clip(weights, MIN_SCORE, MAX_SCORE, out=weights)
+        weights = weights.astype(np.float32)
+        keep = weights != 0
+        self.num_nodes = num_nodes
+        self._rebuild(keys[keep] >> 32, keys[keep] & 0xFFFFFFFF, weights[keep])
+    
+    def _kept(self, rows, cols):
+        # Mask of the stored edges that touch no removed node
+        removed = np.zeros(self.num_nodes, dtype=bool)
+        removed[[node for node in self._removed if node < self.num_nodes]] = True
+        return ~(removed[rows] | removed[cols])
+    
+    def _rebuild(self, rows, cols, weights):
+        # rows must already be sorted
+        counts = np.bincount(rows, minlength=self.num_nodes)
+        self.indptr = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self.indices = np.asarray(cols, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+
+
+def merge(keys, weights, new_keys, overwrite, values):
+    """Apply values for sorted, unique new_keys to sorted keys and their weights
+    
+    Existing keys take the value (overwrite) or add it; new keys are inserted in order. Costs one
+    pass over the stored edges rather than a sort of all of them.
+    """
+    pos = np.searchsorted(keys, new_keys)
+    found = pos < len(keys)
+    found[found] = keys[pos[found]] == new_keys[found]
+    hit = pos[found]
+    weights = weights.copy()
+    weights[hit] = values[found] if overwrite else weights[hit] + values[found]
+    fresh = ~found
+    return np.insert(keys, pos[fresh], new_keys[fresh]), np.insert(weights, pos[fresh], values[fresh])
+
+
+class RelationsView:
+    """Dict-like view of one character's row in a RelationshipGraph"""
+    
+    __slots__ = ("_graph", "_source")
+    
+    def __init__(self, graph, source):
+        self._graph = graph
+        self._source = source
+    
+    def __getitem__(self, target):
+        score = self._graph.get(self._source, target, None)
+        if score is None:
+            raise KeyError(target)
+        return score
+    
+    def __setitem__(self, target, score):
+        self._graph.set(self._source, target, score)
+    
+    def __delitem__(self, target):
+        self._graph.remove(self._source, target)
+    
+    def __contains__(self, target):
+        try:
+            self[target]
+        except KeyError:
+            return False
+        return True
+    
+    def __iter__(self):
+        return iter(self._graph.neighbors(self._source)[0].tolist())
+    
+    def __len__(self):
+        return len(self._graph.neighbors(self._source)[0])
+    
+    def get(self, target, default=None):
+        return self._graph.get(self._source, target, default)
+    
+    def keys(self):
+        return list(self)
+    
+    def items(self):
+        return self._graph.relations_of(self._source).items()
+    
+    def __repr__(self):
+        return repr(self._graph.relations_of(self._source))
@@ -0,0 +1,89 @@
+from game_logic import FEMALE_NAMES, MALE_NAMES
+from world_rng import RandomStreams
+
+BYNAMES = ["Smith", "Miller", "Baker", "Fletcher", "Cooper", "Thatcher", "Carter", "Webb",
+           "Fisher", "Mason", "Tanner", "Shepherd", "Wright", "Hayward", "Reeve", "Turner"]
+
+# Who can be met in each kind of settlement, with their usual attitude; World and GUI type names both work
+RESIDENT_ROLES = {
+    "capital": [("Noble", "formal"), ("Royal Blacksmith", "respectful"), ("Court Advisor", "cautious"),
+                ("Cathedral Priest", "kind"), ("Royal Guard Captain", "stern"), ("Merchant", "friendly")],
+    "city": [("City Official", "busy"), ("Tavern Owner", "friendly"), ("Guild Master", "proud"),
+             ("Priest", "humble"), ("City Guard", "suspicious"), ("Merchant", "respectful")],
+    "village": [("Village Elder", "wise"), ("Farmer", "hardworking"), ("Herbalist", "caring"),
+                ("Blacksmith", "strong"), ("Miller", "cheerful"), ("Shepherd", "friendly")]
+}
+SETTLEMENT_KINDS = {"Capital City": "capital", "City": "city", "Village": "village",
+                    "city": "city", "village": "village"}
+
+# Typical head counts when a settlement has no recorded population
+DEFAULT_POPULATION = {"capital": 10000, "city": 5000, "village": 500}
+
+
+class SettlementResidents:
+    """Residents of every settlement, generated only when a settlement is first touched
+    
+    Untouched settlements are just an aggregate head count. Touching one generates its notable
+    residents from the world seed and the settlement's registry id, so the same settlement always
+    produces the same people and a released settlement can be regenerated identically.
+    """
+    
+    def __init__(self, seed, registry, locations=None):
+        self.random = RandomStreams(seed)
+        self.registry = registry
+        self.locations = locations  # World.locations, when settlements carry population figures
+        self.materialized = {}  # settlement name -> resident dicts, for touched settlements only
+    
+    def kind(self, settlement):
+        kind = SETTLEMENT_KINDS.get(self.registry.type_of(settlement))
+        if kind == "city" and self.locations is not None:
+            kingdom = self.locations.get(self.registry.kingdom_of(settlement), {})
+            if kingdom.get("capital") == settlement:
+                kind = "capital"
+        return kind
+    
+    def count(self, settlement):
+        """Aggregate head count, answered without materializing anyone"""
+        if self.locations is not None and settlement in self.locations:
+            return self.locations[settlement].get("population", 0)
+        return DEFAULT_POPULATION.get(self.kind(settlement), 0)
+    
+    def notable_count(self, settlement):
+        # Enough people to meet, growing slowly with the settlement's size
+        return max(5, min(12, self.count(settlement) // 1000 + 5))
+    
+    def is_materialized(self, settlement):
+        return settlement in self.materialized
+    
+    def residents(self, settlement):
+        """The settlement's notable residents, generating them on first access"""
+        residents = self.materialized.get(settlement)
+        if residents is None:
+            residents = self.materialized[settlement] = self.generate(settlement)
+        return residents
+    
+    def generate(self, settlement):
+        kind = self.kind(settlement)
+        if kind is None:
+            return []
+        rng = self.random.spawn(f"residents/{self.registry.ids[settlement]}")
+        roles = RESIDENT_ROLES[kind]
+        residents = []
+        for i in range(self.notable_count(settlement)):
+            # Every role is filled once before any repeats
+            occupation, attitude = roles[i] if i < len(roles) else rng.choice(roles)
+            gender = rng.choice(["male", "female"])
+            first = rng.choice(MALE_NAMES if gender == "male" else FEMALE_NAMES)
+            residents.append({
+                "name": f"{first} {rng.choice(BYNAMES)}",
+                "gender": gender,
+                "age": rng.randint(16, 65),
+                "occupation": occupation,
+                "attitude": attitude,
+                "home": settlement
+            })
+        return residents
+    
+    def release(self, settlement):
+        """Drop a settlement's residents; they will be regenerated unchanged if touched again"""
+        self.materialized.pop(settlement, None)
@@ -0,0 +1,280 @@
+import argparse
+import heapq
+import time
+from collections import OrderedDict
+import numpy as np
+from world_rng import RandomStreams
+
+INFINITY = float("inf")
+UNREACHED = 1 << 40  # Stands in for infinity in the integer arrays used while labelling
+
+
+class RouteNetwork:
+    """Road graph between settlements, answering travel times in days
+    
+    Roads follow the realm's structure: villages hang off a city, cities of a kingdom connect to
+    their capital and to each other, and capitals and a few border cities link the kingdoms.
+    Distances come from hub labels precomputed in two levels. Every settlement knows its distance
+    to the border settlements of its kingdom (those with a road abroad), and every border
+    settlement keeps a short label of distances to hubs, so the fastest route between any two
+    places is the best hub their labels share. Recent routes are kept in an LRU cache, since
+    travel menus, caravans and armies ask for the same routes over and over.
+    """
+    
+    def __init__(self, registry, kingdoms, seed=None, cache_size=4096):
+        self.registry = registry
+        self.adjacency = [[] for _ in range(len(registry))]  # id -> [(neighbour id, days)]
+        self.kingdom_of = [-1] * len(registry)  # id -> index of the kingdom it belongs to, -1 off the road map
+        self.cache = OrderedDict()  # (start id, goal id) -> (days, path ids)
+        self.cache_size = cache_size
+        self.build_roads(kingdoms, RandomStreams(seed).spawn("routes"))
+        self.borders = []  # Border settlement ids, most important hub first
+        self.exits = [[] for _ in range(len(registry))]  # id -> [(border index, days)] within its kingdom
+        self.toward = []  # Border index -> {id: next id on the way to that border} within the kingdom
+        self.labels = []  # Border index -> {hub border index: days}
+        self.label_parents = []  # Border index -> {hub: previous border on the way from the hub}
+        self.build_labels()
+    
+    @classmethod
+    def from_locations(cls, registry, locations, seed=None, **options):
+        """Build from World.locations, using its kingdom entries"""
+        kingdoms = {name: locations[name] for name in registry.names_of_type("kingdom")}
+        return cls(registry, kingdoms, seed, **options)
+    
+    def connect(self, a, b, days):
+        a, b = self.registry.ids[a], self.registry.ids[b]
+        self.adjacency[a].append((b, days))
+        self.adjacency[b].append((a, days))
+    
+    def build_roads(self, kingdoms, rng):
+        capitals = []
+        for index, data in enumerate(kingdoms.values()):
+            cities = data["cities"]
+            if not cities:
+                continue
+            for settlement in [*cities, *data["villages"]]:
+                self.kingdom_of[self.registry.ids[settlement]] = index
+            capital = data.get("capital") or cities[0]
+            capitals.append(capital)
+            for i, city in enumerate(cities):
+                if city != capital:
+                    self.connect(city, capital, rng.randint(2, 6))
+                if i and rng.random() < 0.5:
+                    self.connect(city, cities[i - 1], rng.randint(2, 5))
+            for i, village in enumerate(data["villages"]):
+                self.connect(village, cities[i % len(cities)], rng.randint(1, 3))
+                if i and rng.random() < 0.3:
+                    self.connect(village, data["villages"][i - 1], rng.randint(1, 3))
+            # A road between neighbouring capitals, and sometimes a border road to an older kingdom
+            if len(capitals) > 1:
+                self.connect(capitals[-1], capitals[-2], rng.randint(5, 12))
+            if len(capitals) > 2 and rng.random() < 0.5:
+                self.connect(rng.choice(cities), capitals[rng.randrange(len(capitals) - 2)], rng.randint(6, 14))
+    
+    def local_tree(self, source):
+        """Dijkstra from one settlement over its own kingdom's roads: (days, previous) dicts by id"""
+        kingdom = self.kingdom_of[source]
+        distances = {source: 0}
+        previous = {source: source}
+        heap = [(0, source)]
+        while heap:
+            days, node = heapq.heappop(heap)
+            if days > distances[node]:
+                continue
+            for neighbour, step in self.adjacency[node]:
+                total = days + step
+                if self.kingdom_of[neighbour] == kingdom and total < distances.get(neighbour, INFINITY):
+                    distances[neighbour] = total
+                    previous[neighbour] = node
+                    heapq.heappush(heap, (total, neighbour))
+        return distances, previous
+    
+    def build_labels(self):
+        # Level one: each border settlement's tree over its kingdom gives every settlement there
+        # its distance to that border, and the border graph its within-kingdom shortcuts
+        borders = [node for node, roads in enumerate(self.adjacency)
+                   if any(self.kingdom_of[neighbour] != self.kingdom_of[node] for neighbour, _ in roads)]
+        trees = {border: self.local_tree(border) for border in borders}
+        roads = {border: [(other, days) for other, days in trees[border][0].items() if other != border and other in trees]
+                 + [(neighbour, days) for neighbour, days in self.adjacency[border]
+                    if self.kingdom_of[neighbour] != self.kingdom_of[border]]
+                 for border in borders}
+        # Well-connected borders make the best hubs; labelling them first keeps every label short
+        self.borders = sorted(borders, key=lambda border: -len(roads[border]))
+        index = {border: i for i, border in enumerate(self.borders)}
+        for i, border in enumerate(self.borders):
+            distances, previous = trees[border]
+            for node, days in distances.items():
+                self.exits[node].append((i, days))
+            self.toward.append(previous)
+        graph = [[(index[other], days) for other, days in roads[border]] for border in self.borders]
+        
+        # Level two: pruned landmark labelling of the border graph. Each hub in turn runs Dijkstra,
+        # skipping every border whose distance the earlier hubs' labels already give
+        count = len(graph)
+        self.labels = [{} for _ in range(count)]
+        self.label_parents = [{} for _ in range(count)]
+        hubs = np.zeros((count, 32), dtype=np.int32)  # Each border's label as arrays, for the pruning test
+        hub_days = np.zeros((count, 32), dtype=np.int64)
+        sizes = [0] * count
+        current = np.full(count, UNREACHED, dtype=np.int64)  # The running hub's own label, by hub
+        for hub in range(count):
+            size = sizes[hub]
+            current[hubs[hub, :size]] = hub_days[hub, :size]
+            distances = {hub: 0}
+            previous = {hub: hub}
+            settled = set()
+            heap = [(0, hub)]
+            while heap:
+                days, node = heapq.heappop(heap)
+                if node in settled:
+                    continue
+                settled.add(node)
+                size = sizes[node]
+                if size and (current[hubs[node, :size]] + hub_days[node, :size]).min() <= days:
+                    continue  # An earlier hub already covers this pair
+                if size == hubs.shape[1]:
+                    hubs = np.hstack([hubs, np.zeros_like(hubs)])
+                    hub_days = np.hstack([hub_days, np.zeros_like(hub_days)])
+                hubs[node, size], hub_days[node, size] = hub, days
+                sizes[node] = size + 1
+                self.labels[node][hub] = days
+                self.label_parents[node][hub] = previous[node]
+                for neighbour, step in graph[node]:
+                    total = days + step
+                    if total < distances.get(neighbour, INFINITY):
+                        distances[neighbour] = total
+                        previous[neighbour] = node
+                        heapq.heappush(heap, (total, neighbour))
+            current[hubs[hub, :sizes[hub]]] = UNREACHED
+    
+    def meet(self, start, goal):
+        """(days, start's border, hub, goal's border) of the best route through the border graph"""
+        best = (INFINITY, None, None, None)
+        for start_border, start_days in self.exits[start]:
+            start_label = self.labels[start_border]
+            for goal_border, goal_days in self.exits[goal]:
+                goal_label = self.labels[goal_border]
+                offset = start_days + goal_days
+                if offset >= best[0]:
+                    continue
+                # Walk the shorter label and look hubs up in the longer one
+                small, large = (start_label, goal_label) if len(start_label) <= len(goal_label) else (goal_label, start_label)
+                for hub, days in small.items():
+                    other = large.get(hub)
+                    if other is not None and offset + days + other < best[0]:
+                        best = (offset + days + other, start_border, hub, goal_border)
+        return best
+    
+    def distance(self, start, goal):
+        # Days between two ids: the border graph, or a road that stays inside one kingdom
+        if start == goal:
+            return 0
+        days = self.meet(start, goal)[0]
+        if self.kingdom_of[start] == self.kingdom_of[goal] != -1:
+            days = min(days, self.local_tree(start)[0].get(goal, INFINITY))
+        return None if days == INFINITY else days
+    
+    def route(self, start, goal):
+        """(days, [settlement names]) of the fastest route, or (None, []) when there is no road"""
+        key = (self.registry.ids[start], self.registry.ids[goal])
+        result = self.cache.get(key)
+        if result is None:
+            result = self.search(*key)
+            self.cache[key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        days, path = result
+        return days, [self.registry.names[node] for node in path]
+    
+    def travel_time(self, start, goal):
+        """Days on the fastest route, or None when there is no road; no path is built"""
+        key = (self.registry.ids[start], self.registry.ids[goal])
+        if key in self.cache:
+            return self.cache[key][0]
+        return self.distance(*key)
+    
+    def search(self, start, goal):
+        # Fastest route as (days, path ids): the labels' best hub, unless a road inside the kingdom wins
+        if start == goal:
+            return 0, (start,)
+        days, start_border, hub, goal_border = self.meet(start, goal)
+        if self.kingdom_of[start] == self.kingdom_of[goal] != -1:
+            distances, previous = self.local_tree(start)
+            if distances.get(goal, INFINITY) <= days:
+                path = [goal]
+                while path[-1] != start:
+                    path.append(previous[path[-1]])
+                return distances[goal], tuple(reversed(path))
+        if hub is None:
+            return None, ()
+        # Borders from start's exit up to the hub, then down to goal's exit
+        climb = self.climb(start_border, hub)
+        borders = climb + self.climb(goal_border, hub)[-2::-1]
+        path = self.to_border(start, start_border)
+        for a, b in zip(borders, borders[1:]):
+            if self.kingdom_of[self.borders[a]] == self.kingdom_of[self.borders[b]]:
+                path.extend(self.to_border(self.borders[a], b)[1:])  # A shortcut through the kingdom
+            else:
+                path.append(self.borders[b])  # A road abroad
+        path.extend(reversed(self.to_border(goal, goal_border)[:-1]))
+        return days, tuple(path)
+    
+    def climb(self, border, hub):
+        # Border indices from border to hub along the hub's labelling tree
+        borders = [border]
+        while borders[-1] != hub:
+            borders.append(self.label_parents[borders[-1]][hub])
+        return borders
+    
+    def to_border(self, node, border):
+        # Ids from node to a border settlement of its kingdom, along that border's tree
+        toward = self.toward[border]
+        path = [node]
+        while path[-1] != self.borders[border]:
+            path.append(toward[path[-1]])
+        return path
+    
+    def neighbours(self, settlement):
+        """Settlements one road away, with the days to each, nearest first"""
+        roads = self.adjacency[self.registry.ids[settlement]]
+        return sorted(((self.registry.names[node], days) for node, days in roads), key=lambda road: road[1])
+
+
+def measure(network, queries, rng):
+    """Average seconds per cold travel time, cold route and cached route over random pairs"""
+    settlements = [name for name in network.registry.names if network.adjacency[network.registry.ids[name]]]
+    pairs = [(rng.choice(settlements), rng.choice(settlements)) for _ in range(queries)]
+    timings = []
+    for query in (network.travel_time, network.route, network.route):
+        start = time.perf_counter()
+        for a, b in pairs:
+            query(a, b)
+        timings.append((time.perf_counter() - start) / queries)
+    return timings
+
+
+def main(argv=None):
+    from locations import LocationRegistry
+    from world_generator import WorldGenerator
+    parser = argparse.ArgumentParser(description="Time route queries on generated worlds")
+    parser.add_argument("-k", "--kingdoms", type=int, default=2000)
+    parser.add_argument("-q", "--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    locations = dict(WorldGenerator(args.seed, args.kingdoms).generate())
+    registry = LocationRegistry.from_locations(locations)
+    start = time.perf_counter()
+    network = RouteNetwork.from_locations(registry, locations, args.seed, cache_size=args.queries)
+    labels = sum(len(label) for label in network.labels)
+    print(f"{len(registry)} locations, roads and hub labels for {len(network.borders)} border settlements "
+          f"({labels / max(len(network.borders), 1):.1f} hubs each) built in {time.perf_counter() - start:.2f}s")
+    travel, cold, cached = measure(network, args.queries, RandomStreams(args.seed).spawn("queries"))
+    print(f"travel time {travel * 1e6:.1f}us, route {cold * 1e6:.1f}us, cached route {cached * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
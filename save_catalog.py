@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+import time
+from save_format import SAVE_EXTENSION, SaveFile
+from save_journal import JOURNAL_SUFFIX
+from save_writer import atomic_write
+
+CATALOG_FILE = "catalog.json"  # Kept in the saves directory next to the saves it lists
+SUMMARY_SECTION = "summary"  # Save section repeating the catalog entry, to rebuild a lost catalog
+# Held for each read-modify-write of a catalog: the load menu lists on the UI thread while the
+# save writer thread records, and either could otherwise overwrite the other's changes
+CATALOG_LOCK = threading.Lock()
+
+
+def summary(kind, name, occupation, year, season, play_time):
+    """What the load menu shows for a save, stored in the save itself and in the catalog
+    
+    kind tells apart the layouts sharing a saves directory: "world" for Game's World.save_state
+    files, "journal" for MedievalSimulator's journaled saves.
+    """
+    return {"kind": kind, "name": name, "occupation": occupation, "year": year, "season": season,
+            "play_time": round(play_time)}
+
+
+def save_size(path):
+    # The snapshot plus the journal of changes since it, if the save has one
+    size = os.path.getsize(path)
+    if os.path.exists(path + JOURNAL_SUFFIX):
+        size += os.path.getsize(path + JOURNAL_SUFFIX)
+    return size
+
+
+def format_play_time(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}"
+
+
+def format_size(size):
+    return f"{size / 1024:.0f} KB" if size < 1024 * 1024 else f"{size / (1024 * 1024):.1f} MB"
+
+
+class SaveCatalog:
+    """Index of the saves in one directory, so the load menu can list them without opening any
+    
+    Each save is recorded as it is written. Listing compares the index with the directory's
+    file names alone; only saves the index has never seen (older saves, or a deleted index)
+    are opened, and then only for their small summary section.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, CATALOG_FILE)
+    
+    def read(self):
+        """{file name: entry} as last written; empty if there is no readable catalog"""
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def write(self, entries):
+        data = json.dumps(entries, separators=(",", ":")).encode()
+        atomic_write(self.path, lambda f: f.write(data))
+    
+    def record(self, path, entry):
+        """Add or refresh one save's entry (a summary()) once the save is on disk"""
+        with CATALOG_LOCK:
+            entries = self.read()
+            entries[os.path.basename(path)] = {**entry, "size": save_size(path), "saved": time.time()}
+            self.write(entries)
+    
+    def listing(self, kind=None):
+        """Entries for every save in the directory (of one kind, if given), newest first, with "path" added"""
+        with CATALOG_LOCK:
+            entries = self.read()
+            try:
+                files = {name for name in os.listdir(self.directory) if name.endswith(SAVE_EXTENSION)}
+            except OSError:
+                files = set()
+            changed = False
+            for name in entries.keys() - files:
+                del entries[name]  # Deleted by hand
+                changed = True
+            for name in files - entries.keys():
+                entry = self.read_summary(os.path.join(self.directory, name))
+                if entry is not None:
+                    entries[name] = entry
+                    changed = True
+            if changed:
+                self.write(entries)
+        listing = [{**entry, "path": os.path.join(self.directory, name)} for name, entry in entries.items()
+                   if kind is None or entry["kind"] == kind]
+        return sorted(listing, key=lambda entry: entry["saved"], reverse=True)
+    
+    def read_summary(self, path):
+        # Catalog entry from a save's own summary section, or None for files without one
+        try:
+            with SaveFile(path) as save:
+                if SUMMARY_SECTION not in save:
+                    return None
+                entry = save.read(SUMMARY_SECTION)
+            return {**entry, "size": save_size(path), "saved": os.path.getmtime(path)}
+        except (OSError, ValueError):
+            return None
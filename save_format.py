@@ -0,0 +1,521 @@
+import argparse
+import gc
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from functools import partial
+from itertools import accumulate
+from operator import itemgetter
+import numpy as np
+from life_events import EventRecord
+
+# File layout: header, then length-prefixed sections, each holding one top-level value of the
+# saved state behind its own string table, so any section can be decoded without the others.
+MAGIC = b"MSAV"
+SAVE_EXTENSION = ".sav"
+VERSION = 3
+HEADER = struct.Struct("<4sHI")  # magic, version, section count
+SECTION = struct.Struct("<HQ")  # name length, payload length; the name's UTF-8 bytes follow
+VALUE = struct.Struct("<cQ")  # kind, payload length
+COUNT = struct.Struct("<I")
+TABLE = struct.Struct("<II")  # rows, columns
+
+TABLE_MIN_ROWS = 8  # Shorter lists of records are cheaper as plain JSON
+INT_DTYPES = [np.int8, np.int16, np.int32, np.int64]
+ID_DTYPES = [np.uint8, np.uint16, np.uint32]
+MISSING = object()
+
+
+class StringTable:
+    """Every distinct string in a section, stored once; its values refer to strings by id"""
+    
+    def __init__(self, strings=()):
+        self.strings = list(strings)
+        self.ids = None  # text -> id, built on the first intern; decoding never needs it
+    
+    def intern(self, text):
+        if self.ids is None:
+            self.ids = {text: i for i, text in enumerate(self.strings)}
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+    
+    def lookup(self, ids):
+        # Many ids to strings in one C-level call
+        return Decoder.lookup(self.strings, ids)
+    
+    def encode(self):
+        # Lengths (in characters) up front, then all the text, so any string, NULs included, comes
+        # back exactly and decoding is one UTF-8 pass plus slicing
+        return (COUNT.pack(len(self.strings)) + pack_ints([len(text) for text in self.strings], ID_DTYPES) +
+                "".join(self.strings).encode())
+    
+    @classmethod
+    def decode(cls, payload):
+        count, = COUNT.unpack_from(payload)
+        lengths, offset = unpack_ints(payload, COUNT.size, count)
+        text = bytes(payload[offset:]).decode()
+        ends = list(accumulate(lengths))
+        return cls(map(text.__getitem__, map(slice, [0] + ends[:-1], ends)))
+
+
+def smallest_dtype(array, dtypes):
+    # The narrowest dtype that holds every value, so columns take 1-2 bytes per value where they can
+    if not len(array):
+        return dtypes[0]
+    low, high = int(array.min()), int(array.max())
+    for dtype in dtypes:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return dtypes[-1]
+
+
+def pack_ints(values, dtypes=INT_DTYPES):
+    array = np.asarray(values, dtype=np.int64)
+    array = array.astype(smallest_dtype(array, dtypes))
+    return array.dtype.char.encode() + array.tobytes()
+
+
+def unpack_ints(payload, offset, count):
+    dtype = np.dtype(chr(payload[offset]))
+    end = offset + 1 + dtype.itemsize * count
+    return np.frombuffer(payload, dtype, count, offset + 1).tolist(), end
+
+
+class Encoder:
+    """Packs nested save state into bytes, interning strings into one table
+    
+    Dicts and lists keep their structure item by item; long lists of dict or tuple records become columnar
+    tables of packed integers, floats and string ids; NumPy arrays are stored raw; anything else
+    is compact JSON. Small dicts with nothing tabular inside collapse into a single JSON value.
+    """
+    
+    def __init__(self):
+        self.strings = StringTable()
+    
+    def encode(self, value):
+        """Encoded bytes of one value: kind, payload length, payload"""
+        kind, payload = self.encode_payload(value)
+        return VALUE.pack(kind, len(payload)) + payload
+    
+    def encode_payload(self, value):
+        if isinstance(value, np.ndarray):
+            return b"A", self.encode_array(value)
+        if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+            items = [(key, self.encode(item)) for key, item in value.items()]
+            if any(encoded[:1] != b"J" for _, encoded in items):
+                return b"D", COUNT.pack(len(items)) + b"".join(COUNT.pack(self.strings.intern(key)) + encoded
+                                                               for key, encoded in items)
+        elif isinstance(value, list) and value and all(type(row) is EventRecord for row in value):
+            return b"R", self.encode_rows(value)  # At any length, so records come back as EventRecords
+        elif isinstance(value, list) and len(value) >= TABLE_MIN_ROWS:
+            if all(type(row) is dict for row in value):
+                return b"T", self.encode_table(value)
+            if all(isinstance(row, tuple) for row in value) and len({len(row) for row in value}) == 1:
+                return b"R", self.encode_rows(value)
+        if isinstance(value, list) and any(isinstance(item, (list, dict)) for item in value):
+            # Lists holding something tabular keep it, like dicts do
+            items = [self.encode(item) for item in value]
+            if any(encoded[:1] != b"J" for encoded in items):
+                return b"L", COUNT.pack(len(items)) + b"".join(items)
+        return b"J", json.dumps(value, separators=(",", ":")).encode()
+    
+    def encode_array(self, array):
+        array = np.ascontiguousarray(array)
+        dtype = array.dtype.str.encode()
+        return (bytes([len(dtype)]) + dtype + bytes([array.ndim]) +
+                struct.pack(f"<{array.ndim}Q", *array.shape) + array.tobytes())
+    
+    def encode_table(self, rows):
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        out = [TABLE.pack(len(rows), len(keys))]
+        for key in keys:
+            out.append(COUNT.pack(self.strings.intern(key)))
+            out.append(self.encode_column([row.get(key, MISSING) for row in rows]))
+        return b"".join(out)
+    
+    def encode_rows(self, rows):
+        # Tuples, e.g. EventRecords; the flag restores the namedtuple type on load
+        flag = 1 if all(type(row) is EventRecord for row in rows) else 0
+        columns = list(zip(*rows))
+        return (bytes([flag]) + TABLE.pack(len(rows), len(columns)) +
+                b"".join(self.encode_column(list(column)) for column in columns))
+    
+    def encode_column(self, values):
+        # Absent keys are recorded in a mask and filled so the rest of the column packs normally
+        present = [value is not MISSING for value in values]
+        mask = b""
+        if not all(present):
+            mask = np.packbits(present).tobytes()
+            values = [value for value in values if value is not MISSING]
+        types = set(map(type, values))
+        if types == {bool}:
+            kind, payload = b"b", np.array(values, dtype=np.uint8).tobytes()
+        elif types == {int}:
+            kind, payload = b"i", pack_ints(values)
+        elif types == {float}:
+            kind, payload = b"f", np.array(values, dtype=np.float64).tobytes()
+        elif types == {str}:
+            kind, payload = b"s", pack_ints([self.strings.intern(value) for value in values], ID_DTYPES)
+        elif types == {list} and self.ragged_kind(values):
+            kind, payload = b"l", self.encode_ragged(values)
+        else:
+            # Anything else is per-value JSON, interned so repeated lists (buildings, args) are stored once
+            texts = [json.dumps(value, separators=(",", ":")) for value in values]
+            kind, payload = b"j", pack_ints([self.strings.intern(text) for text in texts], ID_DTYPES)
+        return bytes([bool(mask)]) + mask + kind + COUNT.pack(len(values)) + payload
+    
+    def ragged_kind(self, values):
+        # Lists holding only ints, or only strings, pack as one flat column plus lengths
+        item_types = {type(item) for value in values for item in value}
+        if item_types <= {int}:
+            return b"i"
+        if item_types == {str}:
+            return b"s"
+        return None
+    
+    def encode_ragged(self, values):
+        element = self.ragged_kind(values)
+        items = [item for value in values for item in value]
+        if element == b"s":
+            items = [self.strings.intern(item) for item in items]
+        return (element + pack_ints([len(value) for value in values], ID_DTYPES) +
+                COUNT.pack(len(items)) + pack_ints(items, ID_DTYPES if element == b"s" else INT_DTYPES))
+
+
+class Decoder:
+    """Inverse of Encoder, given the encoder's string table
+    
+    With columnar=True, tables of dict records decode to {key: [values]} instead of a list of
+    dicts (None where a row lacked the key), which skips building a dict per row.
+    """
+    
+    def __init__(self, strings, columnar=False):
+        self.strings = strings
+        self.columnar = columnar
+    
+    def decode(self, payload, offset=0):
+        """(value, end offset) of the encoded value starting at offset"""
+        kind, length = VALUE.unpack_from(payload, offset)
+        start = offset + VALUE.size
+        end = start + length
+        if kind == b"J":
+            return json.loads(bytes(payload[start:end])), end
+        if kind == b"A":
+            return self.decode_array(payload, start), end
+        if kind == b"D":
+            return self.decode_dict(payload, start), end
+        if kind == b"L":
+            return self.decode_list(payload, start), end
+        if kind == b"T":
+            return self.decode_table(payload, start), end
+        if kind == b"R":
+            return self.decode_rows(payload, start), end
+        raise ValueError(f"Unknown value kind {kind!r} in save file")
+    
+    def decode_array(self, payload, offset):
+        # A read-only view straight onto the payload; callers copy what they need to modify
+        size = payload[offset]
+        dtype = np.dtype(bytes(payload[offset + 1:offset + 1 + size]).decode())
+        offset += 1 + size
+        ndim = payload[offset]
+        shape = struct.unpack_from(f"<{ndim}Q", payload, offset + 1)
+        offset += 1 + 8 * ndim
+        return np.frombuffer(payload, dtype, int(np.prod(shape)), offset).reshape(shape)
+    
+    def decode_dict(self, payload, offset):
+        count, = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        result = {}
+        for _ in range(count):
+            key_id, = COUNT.unpack_from(payload, offset)
+            result[self.strings.strings[key_id]], offset = self.decode(payload, offset + COUNT.size)
+        return result
+    
+    def decode_list(self, payload, offset):
+        count, = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        result = []
+        for _ in range(count):
+            item, offset = self.decode(payload, offset)
+            result.append(item)
+        return result
+    
+    def decode_table(self, payload, offset):
+        rows, count = TABLE.unpack_from(payload, offset)
+        offset += TABLE.size
+        keys, columns, masks = [], [], []
+        for _ in range(count):
+            key_id, = COUNT.unpack_from(payload, offset)
+            keys.append(self.strings.strings[key_id])
+            column, mask, offset = self.decode_column(payload, offset + COUNT.size, rows)
+            columns.append(column)
+            masks.append(mask)
+        if self.columnar:
+            return {key: column if mask is None else self.spread(column, mask)
+                    for key, column, mask in zip(keys, columns, masks)}
+        if not any(mask is not None for mask in masks):
+            return [dict(zip(keys, row)) for row in zip(*columns)]
+        # Some rows lack some keys: spread each column back over the rows that had it
+        result = [{} for _ in range(rows)]
+        for key, column, mask in zip(keys, columns, masks):
+            targets = result if mask is None else [result[i] for i in np.flatnonzero(mask).tolist()]
+            for row, value in zip(targets, column):
+                row[key] = value
+        return result
+    
+    @staticmethod
+    def spread(column, mask):
+        values = [None] * len(mask)
+        for i, value in zip(np.flatnonzero(mask).tolist(), column):
+            values[i] = value
+        return values
+    
+    def decode_rows(self, payload, offset):
+        flag = payload[offset]
+        rows, count = TABLE.unpack_from(payload, offset + 1)
+        offset += 1 + TABLE.size
+        columns = []
+        for _ in range(count):
+            column, _, offset = self.decode_column(payload, offset, rows, tuples=True)
+            columns.append(column)
+        # tuple.__new__ builds each record straight from its row, skipping the namedtuple's Python __new__
+        return list(map(partial(tuple.__new__, EventRecord), zip(*columns))) if flag else list(zip(*columns))
+    
+    def decode_column(self, payload, offset, rows, tuples=False):
+        # (values, presence mask or None, end offset)
+        mask = None
+        if payload[offset]:
+            size = (rows + 7) // 8
+            mask = np.unpackbits(np.frombuffer(payload, np.uint8, size, offset + 1))[:rows].astype(bool)
+            offset += size
+        kind = payload[offset + 1:offset + 2]
+        count, = COUNT.unpack_from(payload, offset + 2)
+        offset += 2 + COUNT.size
+        if kind == b"b":
+            return [bool(value) for value in payload[offset:offset + count]], mask, offset + count
+        if kind == b"i":
+            values, offset = unpack_ints(payload, offset, count)
+            return values, mask, offset
+        if kind == b"f":
+            return np.frombuffer(payload, np.float64, count, offset).tolist(), mask, offset + 8 * count
+        if kind == b"l":
+            values, offset = self.decode_ragged(payload, offset, count)
+            return ([tuple(value) for value in values] if tuples else values), mask, offset
+        ids, offset = unpack_ints(payload, offset, count)
+        if kind == b"s":
+            return self.strings.lookup(ids), mask, offset
+        if not tuples:
+            # One json.loads for the whole column, giving every row its own lists and dicts
+            return json.loads("[" + ",".join(self.strings.lookup(ids)) + "]"), mask, offset
+        # Values inside tuples are never mutated in place, so each distinct one is decoded once and
+        # shared; lists in them went through JSON and become tuples again
+        unique, inverse = np.unique(np.asarray(ids, dtype=np.int64), return_inverse=True)
+        decoded = json.loads("[" + ",".join(self.strings.lookup(unique.tolist())) + "]")
+        decoded = [tuple(value) if type(value) is list else value for value in decoded]
+        return self.lookup(decoded, inverse.tolist()), mask, offset
+    
+    def decode_ragged(self, payload, offset, count):
+        # Slices of one flat column, so every row still gets a list of its own
+        element = payload[offset:offset + 1]
+        lengths, offset = unpack_ints(payload, offset + 1, count)
+        total, = COUNT.unpack_from(payload, offset)
+        items, offset = unpack_ints(payload, offset + COUNT.size, total)
+        if element == b"s":
+            items = self.strings.lookup(items)
+        ends = list(accumulate(lengths))
+        return [items[start:end] for start, end in zip([0] + ends[:-1], ends)], offset
+    
+    @staticmethod
+    def lookup(values, indices):
+        if len(indices) == 1:
+            return [values[indices[0]]]
+        return list(itemgetter(*indices)(values)) if indices else []
+
+
+def write_save(f, sections):
+    """Write {name: value} sections to a binary file object; return the bytes written"""
+    written = f.write(HEADER.pack(MAGIC, VERSION, len(sections)))
+    for name, value in sections.items():
+        payload = pack_value(value)
+        encoded_name = name.encode()
+        written += f.write(SECTION.pack(len(encoded_name), len(payload)) + encoded_name)
+        written += f.write(payload)
+    return written
+
+
+def read_header(data):
+    magic, version, count = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Not a save file")
+    if version != VERSION:
+        raise ValueError(f"Save file version {version} is not supported (this game reads version {VERSION})")
+    return count
+
+
+def without_gc(decode, *args):
+    # Decoding creates many objects and no cycles; pausing the collector avoids repeated full passes
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return decode(*args)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+class SaveReader:
+    """Streams a save file one section at a time, so a big world is never parsed as a whole"""
+    
+    def __init__(self, f, columnar=False):
+        self.f = f
+        self.count = read_header(f.read(HEADER.size))
+        self.columnar = columnar
+    
+    def next_header(self):
+        name_length, length = SECTION.unpack(self.f.read(SECTION.size))
+        return self.f.read(name_length).decode(), length
+    
+    def sections(self, names=None):
+        """Yield (name, value) for each remaining section, skipping unwanted ones unread"""
+        for _ in range(self.count):
+            name, length = self.next_header()
+            if names is not None and name not in names:
+                self.f.seek(length, 1)
+                continue
+            yield name, without_gc(unpack_value, self.f.read(length), self.columnar)
+
+
+class SaveFile:
+    """A save file mapped into memory, decoding each section only when it is asked for
+    
+    Opening reads the section headers alone, so the cost of getting at one section does not grow
+    with the rest of the file, and the OS pages in only the bytes that are actually decoded.
+    Arrays come back as read-only views of the mapping; copy them before changing them.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self.mapping)
+        count = read_header(self.data[:HEADER.size])
+        self.offsets = {}  # name -> (payload offset, length)
+        offset = HEADER.size
+        for _ in range(count):
+            name_length, length = SECTION.unpack_from(self.data, offset)
+            offset += SECTION.size
+            name = bytes(self.data[offset:offset + name_length]).decode()
+            self.offsets[name] = (offset + name_length, length)
+            offset += name_length + length
+    
+    def __contains__(self, name):
+        return name in self.offsets
+    
+    def names(self):
+        return list(self.offsets)
+    
+    def read(self, name, columnar=False):
+        """Decode one section's value"""
+        offset, length = self.offsets[name]
+        return without_gc(unpack_value, self.data[offset:offset + length], columnar)
+    
+    def close(self):
+        self.data.release()
+        try:
+            self.mapping.close()
+        except BufferError:
+            pass  # Arrays still view the mapping; it is unmapped once the last of them is freed
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def pack_value(value):
+    """One value with its own string table, for records smaller than a whole save file"""
+    encoder = Encoder()
+    encoded = encoder.encode(value)
+    strings = encoder.strings.encode()
+    return COUNT.pack(len(strings)) + strings + encoded
+
+
+def unpack_value(data, columnar=False):
+    size, = COUNT.unpack_from(data)
+    strings = StringTable.decode(data[COUNT.size:COUNT.size + size])
+    return Decoder(strings, columnar).decode(data, COUNT.size + size)[0]
+
+
+def read_save(path, names=None, columnar=False):
+    """Load a save file's sections (all, or just the named ones) into a {name: value} dict"""
+    with open(path, "rb") as f:
+        return dict(SaveReader(f, columnar).sections(names))
+
+
+def measure(world, directory, repeats=3):
+    """Sizes and best-of-repeats load seconds for a world saved in this format and as indent=4 JSON"""
+    from game_logic import World
+    state = world.save_state()
+    path, json_path = os.path.join(directory, "world" + SAVE_EXTENSION), os.path.join(directory, "world.json")
+    with open(path, "wb") as f:
+        write_save(f, state)
+    with open(json_path, "w") as f:
+        json.dump(state, f, indent=4, default=lambda array: array.tolist())
+    
+    def opened():
+        return World(save=SaveFile(path), announce=world.announce)
+    
+    def everything():
+        # Every section decoded and every character and location object built
+        loaded = opened()
+        loaded.characters, loaded.archive, loaded.history, loaded.locations.load_all()
+    
+    def parsed():
+        with open(json_path) as f:
+            json.load(f)
+    
+    def best(load):
+        timings = []
+        for _ in range(repeats):
+            gc.collect()
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    return {"bytes": os.path.getsize(path), "json_bytes": os.path.getsize(json_path), "opened": best(opened),
+            "everything": best(everything), "sections": best(lambda: read_save(path)), "json": best(parsed)}
+
+
+def main(argv=None):
+    from headless_runner import build_world, run_seasons
+    parser = argparse.ArgumentParser(description="Compare save size and load time against indent=4 JSON")
+    parser.add_argument("-p", "--population", type=int, default=20000)
+    parser.add_argument("-k", "--kingdoms", type=int, default=100)
+    parser.add_argument("-s", "--seasons", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    world = build_world(args.population, args.seed, args.kingdoms)
+    run_seasons(world, args.seasons)
+    with tempfile.TemporaryDirectory() as directory:
+        stats = measure(world, directory)
+    print(f"{stats['bytes'] / 1e6:.2f} MB vs {stats['json_bytes'] / 1e6:.2f} MB of JSON "
+          f"({stats['json_bytes'] / stats['bytes']:.1f}x smaller)")
+    for key, label in (("opened", "open to first frame"), ("sections", "decode every section"),
+                       ("everything", "build every object")):
+        print(f"{label:22s} {stats[key] * 1000:8.1f} ms  ({stats['json'] / stats[key]:.1f}x json.load's "
+              f"{stats['json'] * 1000:.0f} ms)")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import os
+from save_format import COUNT, pack_value, read_save, unpack_value, write_save
+from save_writer import atomic_write
+
+JOURNAL_SUFFIX = ".journal"  # Sits next to the snapshot file it belongs to
+JOURNAL_SECTION = "journal"  # Snapshot section naming the generation its journal entries must carry
+
+
+def clone(value):
+    # Private copy of the dicts and lists in a state tree; immutable leaves (strings, tuples) are shared
+    if isinstance(value, dict):
+        return {key: clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone(item) for item in value]
+    return value
+
+
+def diff(old, new, path=(), ops=None):
+    """List the operations that turn old into new: ["set", path, value], ["del", path], ["extend", path, items]
+    
+    Dicts are compared key by key and lists that only grew become an "extend" of their new tail,
+    so an event log gaining one entry costs one short operation rather than the whole log.
+    """
+    ops = [] if ops is None else ops
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            ops.append(["del", [*path, key]])
+        for key, value in new.items():
+            if key in old:
+                diff(old[key], value, (*path, key), ops)
+            else:
+                ops.append(["set", [*path, key], value])
+    elif isinstance(old, list) and isinstance(new, list) and len(new) >= len(old):
+        if len(new) == len(old):
+            for index, (before, after) in enumerate(zip(old, new)):
+                diff(before, after, (*path, index), ops)
+        elif new[:len(old)] == old:
+            ops.append(["extend", list(path), new[len(old):]])
+        else:
+            ops.append(["set", list(path), new])
+    elif old != new or type(old) is not type(new):
+        ops.append(["set", list(path), new])
+    return ops
+
+
+def apply_delta(state, ops):
+    """Replay diff() operations onto state in place"""
+    for op in ops:
+        kind, path = op[0], op[1]
+        target = state
+        for key in path[:-1]:
+            target = target[key]
+        if kind == "set":
+            target[path[-1]] = op[2]
+        elif kind == "del":
+            del target[path[-1]]
+        elif kind == "extend":
+            (target[path[-1]] if path else target).extend(op[2])
+    return state
+
+
+def load_save(path):
+    """Read a journaled save: the snapshot, then every journal entry written since it"""
+    return read_journaled(path)[0]
+
+
+def read_journaled(path):
+    # (state, snapshot generation) of a journaled save
+    state = read_save(path)
+    generation = state.pop(JOURNAL_SECTION)["generation"]
+    if os.path.exists(path + JOURNAL_SUFFIX):
+        with open(path + JOURNAL_SUFFIX, "rb") as f:
+            while True:
+                header = f.read(COUNT.size)
+                size = COUNT.unpack(header)[0] if len(header) == COUNT.size else 0
+                data = f.read(size)
+                if not size or len(data) < size:
+                    break  # The end, or a write torn by a crash; everything before it is intact
+                entry = unpack_value(data)
+                # Entries left over from before the last compaction belong to an older snapshot
+                if entry["generation"] == generation:
+                    apply_delta(state, entry["ops"])
+    return state, generation
+
+
+class SaveJournal:
+    """One save game as a base snapshot plus an append-only journal of changes since it
+    
+    A save only appends the operations that changed since the previous save, so late in a long
+    game it costs about as much as the last few seasons did rather than the whole history. Once
+    the journal outgrows a share of the snapshot, the next save writes a fresh snapshot instead.
+    """
+    
+    def __init__(self, path, compact_ratio=0.5, min_journal_bytes=64 * 1024):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.compact_ratio = compact_ratio
+        self.min_journal_bytes = min_journal_bytes
+        self.shadow = None  # Our own copy of the state as of the last save
+        self.generation = 0  # Bumped by every snapshot; journal entries carry the one they apply to
+        self.snapshot_bytes = 0
+        self.journal_bytes = 0
+    
+    @classmethod
+    def open(cls, path, **options):
+        """Resume an existing save: (journal that appends to it, its current state as load_save reads it)"""
+        journal = cls(path, **options)
+        state, journal.generation = read_journaled(path)
+        journal.shadow = clone(state)
+        journal.snapshot_bytes = os.path.getsize(path)
+        if os.path.exists(journal.journal_path):
+            journal.journal_bytes = os.path.getsize(journal.journal_path)
+        return journal, state
+    
+    def needs_snapshot(self):
+        return (self.shadow is None or
+                self.journal_bytes > max(self.min_journal_bytes, self.snapshot_bytes * self.compact_ratio))
+    
+    def save(self, state):
+        """Record state, as a journal entry or a new snapshot; return the bytes written"""
+        if self.needs_snapshot():
+            return self.write_snapshot(state)
+        ops = diff(self.shadow, state)
+        if not ops:
+            return 0
+        data = pack_value({"generation": self.generation, "ops": ops})
+        with open(self.journal_path, "ab") as f:
+            f.write(COUNT.pack(len(data)) + data)
+            f.flush()
+            os.fsync(f.fileno())
+        apply_delta(self.shadow, clone(ops))
+        self.journal_bytes += COUNT.size + len(data)
+        return COUNT.size + len(data)
+    
+    def write_snapshot(self, state):
+        # Replace the snapshot (a save_format file) atomically, then start an empty journal for it
+        self.generation += 1
+        sections = {JOURNAL_SECTION: {"generation": self.generation}, **state}
+        written = atomic_write(self.path, lambda f: write_save(f, sections))
+        open(self.journal_path, "w").close()
+        self.shadow = clone(state)
+        self.snapshot_bytes = written
+        self.journal_bytes = 0
+        return written
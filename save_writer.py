@@ -0,0 +1,114 @@
+import os
+import threading
+from collections import deque
+
+
+def fsync_directory(path):
+    # Makes a rename durable on POSIX; directories cannot be opened this way on Windows
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, write):
+    """Call write(f) on a temp file, fsync it and rename it over path; return write's result
+    
+    A crash leaves either the old file or the new one, never a partial save.
+    """
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        result = write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+    fsync_directory(path)
+    return result
+
+
+class BackgroundSaver:
+    """Runs save jobs on one worker thread so the Tk main loop never waits on serialization or disk
+    
+    Callers snapshot their state cheaply on the UI thread and submit a job that writes it. While a
+    job is running, a newer submission for the same key (the same save file) replaces one still
+    waiting, so a burst of saves costs one write of the latest state; different keys run in the
+    order they were first submitted. Completions are handed back on the Tk thread by polling
+    with after().
+    """
+    
+    def __init__(self, root=None, poll_ms=50):
+        self.root = root  # Tk root to deliver completions on; without one they run on the worker
+        self.poll_ms = poll_ms
+        self.condition = threading.Condition()
+        self.pending = {}  # key -> (job, on_done) waiting to run; a newer submit for a key replaces it
+        self.running = False
+        self.finished = deque()  # (on_done, result, error) for the UI thread to deliver
+        self.polling = False
+        self.thread = None
+    
+    def submit(self, job, on_done=None, key=None):
+        """Queue job() to run in the background; on_done(result, error) follows on the UI thread
+        
+        If this request is superseded by a newer one with the same key before it starts, its
+        on_done is not called.
+        """
+        with self.condition:
+            self.pending[key] = (job, on_done)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.work, name="save-writer", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        if self.root is not None and not self.polling:
+            self.polling = True
+            self.root.after(self.poll_ms, self.poll)
+    
+    @property
+    def busy(self):
+        with self.condition:
+            return self.running or bool(self.pending)
+    
+    def work(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                job, on_done = self.pending.pop(next(iter(self.pending)))
+                self.running = True
+            result = error = None
+            try:
+                result = job()
+            except Exception as exc:
+                error = exc
+            completion = (on_done, result, error)
+            if self.root is None:
+                self.deliver(completion)
+            with self.condition:
+                self.running = False
+                if self.root is not None:
+                    self.finished.append(completion)
+                self.condition.notify_all()
+    
+    def poll(self):
+        # Runs on the Tk thread: hand over finished saves, keep polling while any are outstanding
+        while self.finished:
+            self.deliver(self.finished.popleft())
+        if self.busy or self.finished:
+            self.root.after(self.poll_ms, self.poll)
+        else:
+            self.polling = False
+    
+    def deliver(self, completion):
+        on_done, result, error = completion
+        if on_done is not None:
+            on_done(result, error)
+    
+    def flush(self, timeout=None):
+        """Block until every submitted save is on disk (e.g. before the window closes)"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.running and not self.pending, timeout)
@@ -0,0 +1,167 @@
+import argparse
+import math
+import time
+import numpy as np
+from world_rng import RandomStreams
+
+# Map layout, in miles
+KINGDOM_SPACING = 120  # Between neighbouring kingdoms' centres, which sit on a jittered square grid
+CITY_SPREAD = 40  # Cities lie within this distance of their kingdom's capital
+VILLAGE_SPREAD = 10  # Villages lie within this distance of their city
+
+
+def kingdom_center(index, count, rng):
+    # Kingdoms fill a square grid row by row, each nudged off its grid point
+    side = math.ceil(math.sqrt(count))
+    row, column = divmod(index, side)
+    return ((column + 0.5 + rng.uniform(-0.2, 0.2)) * KINGDOM_SPACING,
+            (row + 0.5 + rng.uniform(-0.2, 0.2)) * KINGDOM_SPACING)
+
+
+def scatter(rng, center, spread):
+    # Uniform over a disc around the centre
+    angle = rng.uniform(0, 2 * math.pi)
+    distance = spread * math.sqrt(rng.random())
+    return (round(center[0] + distance * math.cos(angle), 1), round(center[1] + distance * math.sin(angle), 1))
+
+
+def layout_kingdom(rng, center, capital, cities, villages):
+    """Positions for one kingdom's settlements: the capital at the centre, villages around their city"""
+    positions = {capital: (round(center[0], 1), round(center[1], 1))}
+    for city in cities:
+        if city != capital:
+            positions[city] = scatter(rng, center, CITY_SPREAD)
+    # Villages belong to cities in turn, the same way the road network connects them
+    for i, village in enumerate(villages):
+        positions[village] = scatter(rng, positions[cities[i % len(cities)]], VILLAGE_SPREAD)
+    return positions
+
+
+def layout(kingdoms, seed=None):
+    """Positions for every settlement of a kingdom -> {"capital", "cities", "villages"} dict"""
+    rng = RandomStreams(seed).spawn("map")
+    positions = {}
+    for index, data in enumerate(kingdoms.values()):
+        if data["cities"]:
+            center = kingdom_center(index, len(kingdoms), rng)
+            capital = data.get("capital") or data["cities"][0]
+            positions.update(layout_kingdom(rng, center, capital, data["cities"], data["villages"]))
+    return positions
+
+
+class SpatialIndex:
+    """Uniform grid over settlement positions for radius and nearest-neighbour queries
+    
+    Settlement ids are sorted by grid cell, so the settlements of one row of cells form a single
+    contiguous slice; a query gathers the few slices its bounding box covers and filters them
+    by distance in one vectorized step.
+    """
+    
+    def __init__(self, positions, cell_size=10.0):
+        self.names = list(positions)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.positions = np.array(list(positions.values()), dtype=float).reshape(-1, 2)
+        self.cell_size = cell_size
+        
+        cells = np.floor(self.positions / cell_size).astype(np.int64)
+        self.origin = cells.min(axis=0) if len(cells) else np.zeros(2, dtype=np.int64)
+        cells -= self.origin
+        self.width, self.height = (cells.max(axis=0) + 1) if len(cells) else (0, 0)
+        keys = cells[:, 1] * self.width + cells[:, 0]
+        self.order = np.argsort(keys, kind="stable")
+        # cell key -> start of its ids in self.order; one extra entry closes the last cell
+        self.cell_start = np.searchsorted(keys[self.order], np.arange(self.width * self.height + 1))
+    
+    @classmethod
+    def from_locations(cls, locations, cell_size=10.0):
+        """Index the settlements of World.locations that have a position"""
+        return cls({name: data["position"] for name, data in locations.items() if "position" in data}, cell_size)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def position(self, name):
+        return tuple(self.positions[self.ids[name]])
+    
+    def candidates(self, point, radius):
+        # Ids in every grid cell the query's bounding box touches
+        low = np.floor((np.asarray(point) - radius) / self.cell_size).astype(np.int64) - self.origin
+        high = np.floor((np.asarray(point) + radius) / self.cell_size).astype(np.int64) - self.origin
+        x0, y0 = np.maximum(low, 0)
+        x1, y1 = np.minimum(high, (self.width - 1, self.height - 1))
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+        rows = np.arange(y0, y1 + 1) * self.width
+        starts = self.cell_start[rows + x0]
+        ends = self.cell_start[rows + x1 + 1]
+        return np.concatenate([self.order[start:end] for start, end in zip(starts, ends)])
+    
+    def within_ids(self, point, radius):
+        """(ids, distances) of settlements within radius of point, nearest first"""
+        ids = self.candidates(point, radius)
+        distances = np.hypot(*(self.positions[ids] - point).T)
+        keep = distances <= radius
+        ids, distances = ids[keep], distances[keep]
+        nearest = np.argsort(distances, kind="stable")
+        return ids[nearest], distances[nearest]
+    
+    def within(self, point, radius):
+        """[(name, distance)] of settlements within radius of point, nearest first"""
+        ids, distances = self.within_ids(point, radius)
+        return [(self.names[i], d) for i, d in zip(ids.tolist(), distances.tolist())]
+    
+    def nearest(self, point, k=1, exclude=()):
+        """[(name, distance)] of the k settlements closest to point, skipping names in exclude"""
+        if len(self.names) <= len(exclude):
+            return []
+        # Widen the search until it holds k settlements; anything outside it is farther away
+        radius = self.cell_size
+        span = self.cell_size * math.hypot(self.width, self.height)
+        while True:
+            found = [(name, d) for name, d in self.within(point, radius) if name not in exclude]
+            if len(found) >= k or radius > span + self.distance_to_grid(point):
+                return found[:k]
+            radius *= 2
+    
+    def near(self, name, radius):
+        """Other settlements within radius of a settlement, nearest first"""
+        return [(other, d) for other, d in self.within(self.position(name), radius) if other != name]
+    
+    def distance_to_grid(self, point):
+        # How far a point lies outside the indexed area, so far-off queries still terminate
+        low = self.origin * self.cell_size
+        high = (self.origin + (self.width, self.height)) * self.cell_size
+        return float(np.hypot(*np.maximum(np.maximum(low - point, np.asarray(point) - high), 0)))
+
+
+def measure(index, queries, radius, rng):
+    """Average seconds per radius query and per nearest-neighbour query at random settlements"""
+    points = [index.positions[rng.randrange(len(index))] for _ in range(queries)]
+    timings = []
+    for query in (lambda p: index.within_ids(p, radius), lambda p: index.nearest(p, 5)):
+        start = time.perf_counter()
+        for point in points:
+            query(point)
+        timings.append((time.perf_counter() - start) / queries)
+    return timings
+
+
+def main(argv=None):
+    from world_generator import WorldGenerator
+    parser = argparse.ArgumentParser(description="Time spatial queries on generated worlds")
+    parser.add_argument("-k", "--kingdoms", type=int, default=7000)
+    parser.add_argument("-q", "--queries", type=int, default=1000)
+    parser.add_argument("-r", "--radius", type=float, default=25.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    locations = dict(WorldGenerator(args.seed, args.kingdoms).generate())
+    start = time.perf_counter()
+    index = SpatialIndex.from_locations(locations)
+    print(f"{len(index)} settlements indexed in {time.perf_counter() - start:.3f}s")
+    within, nearest = measure(index, args.queries, args.radius, RandomStreams(args.seed).spawn("queries"))
+    print(f"radius {args.radius:g}: {within * 1e6:.0f}us, nearest 5: {nearest * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import gc
+
+from game_logic import Person
+from headless_runner import build_world
+
+
+def test_archived_characters_are_freed_and_keep_their_family():
+    world = build_world(1500, seed=2)
+    for _ in range(240):
+        world.advance_time()
+    assert len(world.archive) > 500
+    
+    gc.collect()
+    people = [obj for obj in gc.get_objects() if type(obj) is Person]
+    assert len(people) == len(world.characters)
+    dynasty = world.population.dynasty
+    assert all(member.alive for member in dynasty.members.values())
+    
+    # Genealogy still reaches the dead through the archive and the dynasty's ids
+    child = next(record for record in world.archive.records() if record["parents"])
+    parent = world.get_character(child["parents"][0])
+    parent_id = parent["id"] if isinstance(parent, dict) else parent.id
+    assert child["id"] in dynasty.children[parent_id]
+    if isinstance(parent, dict):
+        assert child["id"] in parent["children"]
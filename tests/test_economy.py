@@ -0,0 +1,16 @@
+import numpy as np
+
+from economy import STABILITY_TARGET
+from headless_runner import build_world
+
+
+def test_kingdom_stability_settles_on_the_target_in_a_quiet_world():
+    world = build_world(500, seed=3, kingdoms=4)
+    economy = world.economy
+    kingdoms = world.registry.names_of_type("kingdom")
+    assert any(world.locations[name]["stability"] != STABILITY_TARGET for name in kingdoms)
+    world.current_events.clear()
+    for _ in range(200):
+        economy.step()
+    assert np.allclose(economy.stability[economy.kingdoms], STABILITY_TARGET, atol=0.01)
+    assert all(world.locations[name]["stability"] == STABILITY_TARGET for name in kingdoms)
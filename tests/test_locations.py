@@ -0,0 +1,11 @@
+from locations import LocationRegistry
+from world_generator import WorldGenerator
+
+
+def test_registry_built_from_the_stream_matches_one_built_from_the_dict():
+    locations = {}
+    streamed = LocationRegistry.from_stream(WorldGenerator(7, 12).generate(), locations)
+    built = LocationRegistry.from_locations(dict(WorldGenerator(7, 12).generate()))
+    assert locations == built.source
+    assert streamed.columns() == built.columns()
+    assert streamed.ids == built.ids
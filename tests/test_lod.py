@@ -0,0 +1,96 @@
+import numpy as np
+
+from game_logic import World
+from headless_runner import build_world
+from save_format import SaveFile, write_save
+from save_writer import atomic_write
+
+
+def quiet(message):
+    pass
+
+
+def kingdom_ids(world):
+    return [world.registry.ids[name] for name in world.registry.names_of_type("kingdom")]
+
+
+def test_far_characters_age_by_the_years_missed_when_the_player_arrives():
+    world = build_world(3000, seed=4, kingdoms=8)
+    population = world.population
+    assert (population.column("location") >= 0).all()
+    near = world.lod.homed_in(world.lod.focus_kingdom)
+    far_kingdom = kingdom_ids(world)[-1]
+    far = world.lod.homed_in(far_kingdom)
+    assert len(near) and len(far)
+    near_ages, far_ages = population.age[near].copy(), population.age[far].copy()
+    
+    for _ in range(12):
+        world.advance_time()
+    assert (population.age[far] == far_ages).all() and population.alive[far].all()
+    living = population.alive[near]
+    assert (population.age[near][living] == near_ages[living] + 3).all()
+    
+    world.set_player_location(world.registry.settlements_of(world.registry.names[far_kingdom])[0])
+    living = population.alive[far]
+    assert (population.age[far][living] == far_ages[living] + 3).all()
+    assert not living.all()
+    for char_id in far[~living].tolist():
+        assert char_id not in world.characters and world.archive.get(char_id) is not None
+
+
+def test_revisited_settlement_brings_back_the_same_residents_older():
+    world = build_world(200, seed=4, kingdoms=3)
+    home = world.player_location
+    away = world.registry.settlements_of(world.registry.kingdom_of(home))[1]
+    rows = list(world.lod.resident_rows)
+    ages = world.population.age[rows].copy()
+    assert all(row in world.characters for row in rows)
+    
+    world.set_player_location(away)
+    assert not any(row in world.characters for row in rows)
+    for _ in range(8):
+        world.advance_time()
+    world.set_player_location(home)
+    size = len(world.population)
+    for _ in range(3):
+        world.set_player_location(away)
+        world.set_player_location(home)
+    assert len(world.population) == size  # No new rows for either settlement's residents
+    assert world.lod.resident_rows == rows
+    living = world.population.alive[rows]
+    assert (world.population.age[rows][living] == ages[living] + 2).all()
+    assert all(row in world.characters for row in np.array(rows)[living].tolist())
+
+
+def test_loaded_world_keeps_dormant_residents_and_deferred_kingdoms(tmp_path):
+    world = build_world(2000, seed=9, kingdoms=5)
+    registry = world.registry
+    home = world.player_location
+    for kingdom in kingdom_ids(world)[1:3]:
+        world.set_player_location(registry.settlements_of(registry.names[kingdom])[0])
+        for _ in range(5):
+            world.advance_time()
+    path = str(tmp_path / "world.sav")
+    atomic_write(path, lambda f: write_save(f, world.save_state()))
+    loaded = World(save=SaveFile(path), announce=quiet)
+    
+    for target in (world, loaded):
+        for _ in range(6):
+            target.advance_time()
+        target.set_player_location(home)
+        for _ in range(6):
+            target.advance_time()
+    for name in ("age", "alive", "location", "updated"):
+        assert np.array_equal(world.population.column(name), loaded.population.column(name))
+    assert world.lod.resident_rows == loaded.lod.resident_rows
+    assert sorted(world.characters) == sorted(loaded.characters)
+
+
+def test_focusing_a_kingdom_name_leaves_the_tiers_alone():
+    world = build_world(200, seed=4, kingdoms=3)
+    kingdom = world.registry.names_of_type("kingdom")[-1]
+    tiers = world.lod.tier.copy()
+    world.set_player_location(kingdom)
+    world.lod.sync()
+    assert np.array_equal(world.lod.tier, tiers)
+    assert "population" not in world.locations[kingdom]
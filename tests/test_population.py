@@ -0,0 +1,17 @@
+import random
+
+from game_logic import Person
+from population import PopulationStore, Skill
+
+
+def test_skills_grow_past_the_int8_range_without_wrapping():
+    store = PopulationStore()
+    person = Person("Ada", 30, "female", "Craftsman", population=store, rng=random.Random(1))
+    person.skills["crafting"] = 120
+    person.skills["crafting"] += 60
+    person.skills[Skill.COMBAT] = 1000
+    assert person.skills["crafting"] == 180
+    assert person.skills.get("combat") == 1000
+    
+    loaded = PopulationStore.from_columns({name: store.column(name) for name in [*store.COLUMNS, "skills"]})
+    assert loaded.skills[person.id, Skill.CRAFTING] == 180
@@ -0,0 +1,88 @@
+import random
+
+import numpy as np
+
+from relationships import MAX_SCORE, MIN_SCORE, RelationshipGraph
+
+
+def clip(score):
+    return float(np.float32(min(max(score, MIN_SCORE), MAX_SCORE)))
+
+
+class Model:
+    """Plain dict of scores with the graph's semantics (clipped and stored as float32 on merge)"""
+    
+    def __init__(self):
+        self.scores = {}
+    
+    def value(self, source, target):
+        return clip(self.scores.get((source, target), 0.0))
+    
+    def rows(self, source):
+        row = {target: self.value(source, target) for (s, target) in self.scores if s == source}
+        return {target: score for target, score in row.items() if score != 0}
+
+
+def check(graph, model, nodes):
+    for source in range(nodes):
+        for target in range(nodes):
+            assert graph.get(source, target) == model.value(source, target)
+        assert graph.relations_of(source) == model.rows(source)
+
+
+def test_graph_matches_a_dict_through_buffered_writes_removals_and_merges():
+    rng = random.Random(5)
+    nodes = 12
+    for limit in (4, 1 << 16):
+        graph = RelationshipGraph()
+        graph.buffer_limit = limit
+        model = Model()
+        for step in range(600):
+            source, target = rng.randrange(nodes), rng.randrange(nodes)
+            kind = rng.random()
+            if kind < 0.35:
+                delta = rng.uniform(-60, 60)
+                graph.add(source, target, delta)
+                model.scores[source, target] = model.value(source, target) + delta
+            elif kind < 0.6:
+                score = rng.choice([0, rng.uniform(-150, 150)])
+                graph.set(source, target, score)
+                model.scores[source, target] = score
+            elif kind < 0.7:
+                sources = [rng.randrange(nodes) for _ in range(5)]
+                targets = [rng.randrange(nodes) for _ in range(5)]
+                graph.update_many(sources, targets, 10)
+                for pair in zip(sources, targets):
+                    model.scores[pair] = model.value(*pair) + 10
+            elif kind < 0.75:
+                removed = rng.sample(range(nodes), 2)
+                graph.remove_nodes(removed)
+                model.scores = {pair: score for pair, score in model.scores.items()
+                                if pair[0] not in removed and pair[1] not in removed}
+            elif kind < 0.78:
+                graph.compact()
+            elif kind < 0.82:
+                graph.decay(0.9, threshold=5)
+                faded = {pair: float(np.float32(model.value(*pair)) * np.float32(0.9)) for pair in model.scores}
+                model.scores = {pair: score for pair, score in faded.items() if abs(score) >= 5}
+            # The graph stores every score clipped, so later adds start from the clipped score
+            model.scores = {pair: model.value(*pair) for pair in model.scores}
+            if step % 50 == 0:
+                check(graph, model, nodes)
+        check(graph, model, nodes)
+        graph.compact()
+        check(graph, model, nodes)
+        assert len(graph) == sum(len(model.rows(source)) for source in range(nodes))
+
+
+def test_single_writes_do_not_merge_until_the_buffer_fills():
+    graph = RelationshipGraph()
+    graph.update_many(np.arange(1000), np.arange(1000)[::-1], 5)
+    graph.compact()
+    indices = graph.indices
+    graph.set(3, 7, 40)
+    graph.add(3, 7, 2)
+    assert graph.get(3, 7) == 42
+    graph.remove_nodes([10])
+    assert graph.get(10, 989) == 0
+    assert graph.indices is indices  # Still the same compressed arrays
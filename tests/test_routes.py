@@ -0,0 +1,48 @@
+import heapq
+import random
+
+from locations import LocationRegistry
+from routes import INFINITY, RouteNetwork
+from world_generator import WorldGenerator
+
+
+def dijkstra(network, source):
+    distances = [INFINITY] * len(network.adjacency)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        days, node = heapq.heappop(heap)
+        if days > distances[node]:
+            continue
+        for neighbour, step in network.adjacency[node]:
+            if days + step < distances[neighbour]:
+                distances[neighbour] = days + step
+                heapq.heappush(heap, (days + step, neighbour))
+    return distances
+
+
+def road(network, a, b):
+    return min(days for neighbour, days in network.adjacency[a] if neighbour == b)
+
+
+def test_routes_match_dijkstra_and_follow_roads():
+    for seed, kingdoms in ((1, 40), (2, 3), (3, 1)):
+        locations = dict(WorldGenerator(seed, kingdoms).generate())
+        registry = LocationRegistry.from_locations(locations)
+        network = RouteNetwork.from_locations(registry, locations, seed)
+        rng = random.Random(seed)
+        names = registry.names
+        for start in rng.sample(names, min(len(names), 25)):
+            distances = dijkstra(network, registry.ids[start])
+            for goal in rng.sample(names, min(len(names), 60)):
+                expected = distances[registry.ids[goal]]
+                expected = None if expected == INFINITY else expected
+                assert network.travel_time(start, goal) == expected
+                days, path = network.route(start, goal)
+                assert days == expected
+                if days is None:
+                    assert path == []
+                    continue
+                assert path[0] == start and path[-1] == goal
+                ids = [registry.ids[name] for name in path]
+                assert sum(road(network, a, b) for a, b in zip(ids, ids[1:])) == days
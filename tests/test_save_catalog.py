@@ -0,0 +1,24 @@
+import os
+import threading
+
+from save_catalog import SaveCatalog, summary
+
+
+def test_concurrent_records_and_listings_lose_no_entries(tmp_path):
+    directory = str(tmp_path)
+    names = [f"save_{i}.sav" for i in range(120)]
+    for name in names:
+        open(os.path.join(directory, name), "wb").close()
+    entry = summary("journal", "Ada", "Merchant", 1200, "Spring", 0)
+    
+    def record(chunk):
+        for name in chunk:
+            SaveCatalog(directory).record(os.path.join(directory, name), entry)
+    
+    threads = [threading.Thread(target=record, args=(names[i::6],)) for i in range(6)]
+    threads.append(threading.Thread(target=lambda: [SaveCatalog(directory).listing() for _ in range(40)]))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(SaveCatalog(directory).read()) == sorted(names)
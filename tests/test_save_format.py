@@ -0,0 +1,17 @@
+from life_events import EventRecord
+from save_format import pack_value, unpack_value
+
+
+def test_any_string_round_trips():
+    strings = ["a\0b", "", "\0", "\0\0", "Æthelred", "trailing\0", "plain"]
+    value = {"names": strings, "rows": [{"name": text, "index": i} for i, text in enumerate(strings * 2)],
+             "\0key": "value\0"}
+    assert unpack_value(pack_value(value)) == value
+    assert unpack_value(pack_value(value), columnar=True)["rows"]["name"] == strings * 2
+
+
+def test_event_records_come_back_as_event_records():
+    records = [EventRecord(i % 3, 4800 + i, ("Crown\0haven", i)) for i in range(20)]
+    loaded = unpack_value(pack_value(records))
+    assert loaded == records
+    assert all(type(record) is EventRecord for record in loaded)
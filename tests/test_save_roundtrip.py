@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+import pytest
+
+from game_logic import World
+from headless_runner import build_world
+from save_format import SaveFile, write_save
+from save_writer import atomic_write
+from world_events import EVENT_HANDLERS
+
+
+def quiet(message):
+    pass
+
+
+def plain(value):
+    # Location dicts and event lists as JSON would see them (tuples and lists compare equal)
+    return json.loads(json.dumps(value))
+
+
+def assert_same(world, loaded):
+    assert (world.year, world.season) == (loaded.year, loaded.season)
+    assert plain(world.current_events) == plain(loaded.current_events)
+    assert np.array_equal(world.economy.prosperity, loaded.economy.prosperity)
+    assert np.array_equal(world.economy.stability, loaded.economy.stability)
+    assert plain(dict(world.locations)) == plain(dict(loaded.locations))
+    for name in ("age", "alive"):
+        assert np.array_equal(world.population.column(name), loaded.population.column(name))
+    assert world.history == loaded.history
+
+
+def save_and_load(world, path):
+    atomic_write(path, lambda f: write_save(f, world.save_state()))
+    return World(save=SaveFile(path), announce=quiet)
+
+
+@pytest.mark.parametrize("event_type", ["trade_boom", "plague"])
+@pytest.mark.parametrize("seasons_after_start", [1, 2])
+def test_loaded_world_continues_an_active_event_identically(tmp_path, monkeypatch, event_type, seasons_after_start):
+    handler = EVENT_HANDLERS[event_type]
+    monkeypatch.setattr(type(handler), "duration", (5, 5))  # Still ticking well after the save
+    world = build_world(300, seed=11, kingdoms=6)
+    for _ in range(14):
+        world.advance_time()
+    event = world.event_engine.start(world, handler, [world.registry.names_of_type("kingdom")[0]])
+    for _ in range(seasons_after_start):
+        world.advance_time()
+    
+    loaded = save_and_load(world, str(tmp_path / "world.sav"))
+    assert_same(world, loaded)
+    for _ in range(8):
+        world.advance_time()
+        loaded.advance_time()
+        assert_same(world, loaded)
+    assert event not in world.current_events
@@ -0,0 +1,70 @@
+from game_logic import World
+from timeline import Timeline
+from world_events import EventHandler, WorldEventEngine
+
+
+def quiet(message):
+    pass
+
+
+def test_event_ticks_once_per_season():
+    for duration in range(1, 7):
+        timeline = Timeline()
+        log = []
+        for season in range(20):
+            # Due entries first, then new events start, as in World.advance_time
+            timeline.run_due(season)
+            if season == 6:
+                timeline.schedule_event("event", season, duration,
+                                        on_tick=lambda event: log.append(("tick", season)),
+                                        on_expire=lambda event: log.append(("expire", season)))
+        ticks = [("tick", later) for later in range(7, 6 + duration)]
+        assert log == [*ticks, ("expire", 6 + duration)]
+
+
+def test_run_due_leaves_rescheduled_entries_for_the_next_call():
+    timeline = Timeline()
+    calls = []
+    
+    def repeat(season):
+        calls.append(season)
+        timeline.schedule(season, repeat, season + 1)
+    
+    timeline.schedule(0, repeat, 0)
+    for season in range(5):
+        timeline.run_due(season)
+    assert calls == [0, 1, 2, 3, 4]
+
+
+def test_run_due_skips_entries_cancelled_during_the_run():
+    timeline = Timeline()
+    calls = []
+    later = timeline.schedule(3, calls.append, "later")
+    timeline.schedule(2, timeline.cancel, later)
+    timeline.schedule(1, calls.append, "earlier")
+    assert timeline.run_due(3) == 2
+    assert calls == ["earlier"]
+
+
+class Counter(EventHandler):
+    name = "counter"
+    duration = (4, 4)
+    
+    def __init__(self):
+        self.ticks = []
+    
+    def on_tick(self, world, event):
+        self.ticks.append(world.season)
+
+
+def test_world_event_ticks_once_per_season():
+    world = World(seed=3, announce=quiet)
+    handler = Counter()
+    world.event_engine = WorldEventEngine({handler.name: handler})
+    for _ in range(6):
+        world.advance_time()
+    world.event_engine.start(world, handler, ["Kingdom of Westoria"])
+    for _ in range(10):
+        world.advance_time()
+    assert handler.ticks == [7, 8, 9]
+    assert world.current_events == []
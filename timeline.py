@@ -0,0 +1,97 @@
+import heapq
+import itertools
+
+
+class Timeline:
+    """Priority queue of scheduled callbacks keyed by season
+    
+    Each season only the entries that are due are popped, so the cost of a season does not
+    depend on how many events are active or scheduled for later.
+    """
+    
+    def __init__(self):
+        self._queue = []  # [season, sequence, callback, args, active] entries
+        self._sequence = itertools.count()  # Breaks ties so same-season entries run in schedule order
+    
+    def __len__(self):
+        return sum(1 for entry in self._queue if entry[4])
+    
+    def schedule(self, season, callback, *args):
+        """Run callback(*args) when the timeline reaches season; returns a handle for cancel()"""
+        entry = [season, next(self._sequence), callback, args, True]
+        heapq.heappush(self._queue, entry)
+        return entry
+    
+    def cancel(self, handle):
+        # Lazy deletion: the entry stays in the heap but is skipped when popped
+        handle[4] = False
+    
+    def next_due(self):
+        """Season of the earliest pending entry, or None"""
+        while self._queue and not self._queue[0][4]:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+    
+    def run_due(self, season):
+        """Run every entry scheduled at or before season; returns how many ran
+        
+        Only entries already due when called are run: anything a callback schedules for season
+        or earlier waits for the next call, so a repeating callback runs once per season.
+        """
+        due = []
+        while self._queue and self._queue[0][0] <= season:
+            due.append(heapq.heappop(self._queue))
+        ran = 0
+        for entry in due:
+            # Checked now rather than when popped, as an earlier callback may have cancelled it
+            if entry[4]:
+                entry[2](*entry[3])
+                ran += 1
+        return ran
+    
+    def schedule_event(self, event, start, duration, on_start=None, on_tick=None, on_expire=None, first_tick=None):
+        """Schedule an event's lifecycle: on_start at start, on_tick every later season while it
+        lasts (from first_tick, start + 1 by default), and on_expire at start + duration. Each
+        callback receives the event."""
+        timeline_event = TimelineEvent(self, event, start + duration, on_tick, on_expire)
+        if on_start:
+            self.schedule(start, on_start, event)
+        first_tick = start + 1 if first_tick is None else first_tick
+        if on_tick and first_tick < timeline_event.end:
+            timeline_event.tick_handle = self.schedule(first_tick, timeline_event.tick, first_tick)
+        timeline_event.expire_handle = self.schedule(start + duration, timeline_event.expire)
+        return timeline_event
+
+
+class TimelineEvent:
+    """Handles for one scheduled event, so it can be ended early"""
+    
+    def __init__(self, timeline, event, end, on_tick, on_expire):
+        self.timeline = timeline
+        self.event = event
+        self.end = end
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.tick_handle = None
+        self.expire_handle = None
+    
+    def tick(self, season):
+        self.on_tick(self.event)
+        if season + 1 < self.end:
+            self.tick_handle = self.timeline.schedule(season + 1, self.tick, season + 1)
+        else:
+            self.tick_handle = None
+    
+    def expire(self):
+        if self.tick_handle:
+            self.timeline.cancel(self.tick_handle)
+        if self.on_expire:
+            self.on_expire(self.event)
+    
+    def cancel(self, expire=True):
+        """End the event now, running its expiry callback unless expire is False"""
+        self.timeline.cancel(self.expire_handle)
+        if expire:
+            self.expire()
+        elif self.tick_handle:
+            self.timeline.cancel(self.tick_handle)
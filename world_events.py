@@ -0,0 +1,206 @@
+import numpy as np
+from life_events import EVENT_TEMPLATES
+
+# Registered world event handlers, by event type
+EVENT_HANDLERS = {}
+
+
+def register_event(handler_class):
+    """Class decorator adding a handler to the table the engine draws from"""
+    EVENT_HANDLERS[handler_class.name] = handler_class()
+    return handler_class
+
+
+class KingdomTable:
+    """Per-season snapshot of every kingdom as arrays, so handlers test eligibility in one pass"""
+    
+    def __init__(self, world):
+        self.names = np.array(world.registry.names_of_type("kingdom"))
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.prosperity = np.array([world.locations[k]["prosperity"] for k in self.names], dtype=np.int32)
+        self.stability = np.array([world.locations[k]["stability"] for k in self.names], dtype=np.int32)
+        
+        # active[type] marks the kingdoms already caught up in an event of that type
+        self.active = {name: np.zeros(len(self.names), dtype=bool) for name in EVENT_HANDLERS}
+        for event in world.current_events:
+            mask = self.active.setdefault(event["type"], np.zeros(len(self.names), dtype=bool))
+            for kingdom in event["participants"]:
+                if kingdom in self.index:
+                    mask[self.index[kingdom]] = True
+    
+    def __len__(self):
+        return len(self.names)
+
+
+class EventHandler:
+    """One world event type: eligibility, probability and effects on World.locations"""
+    
+    name = None
+    probability = 0.0  # Chance per season that this event type breaks out somewhere
+    participants = 1  # Kingdoms drawn from the eligible set
+    duration = (1, 4)  # Seasons, inclusive range
+    history = None  # Template logged to World.history when the event starts
+    
+    def eligible(self, table):
+        """Boolean mask over table.names of kingdoms this event can strike"""
+        return ~self.active_mask(table)
+    
+    def active_mask(self, table):
+        return table.active.get(self.name, np.zeros(len(table), dtype=bool))
+    
+    def on_start(self, world, event):
+        pass
+    
+    def on_tick(self, world, event):
+        pass
+    
+    def on_expire(self, world, event):
+        pass
+
+
+@register_event
+class War(EventHandler):
+    name = "war"
+    probability = 0.2 / 6
+    participants = 2
+    duration = (1, 8)
+    history = "War erupted between {} and {} in {}"
+    # While it lasts, SettlementEconomy drains both sides' stability and prosperity by intensity
+
+
+@register_event
+class Plague(EventHandler):
+    name = "plague"
+    probability = 0.2 / 6
+    duration = (2, 6)
+    history = "Plague broke out in {} in {}"
+    
+    def on_start(self, world, event):
+        # Intensity is the share of each settlement (in percent) the plague carries off
+        kingdom = event["participants"][0]
+        world.lod.scale_settlements(world.registry.settlements_of(kingdom), 1 - event["intensity"] / 100)
+    
+    def on_tick(self, world, event):
+        world.economy.adjust_prosperity(world.registry.settlements_of(event["participants"][0]), -1)
+
+
+@register_event
+class Festival(EventHandler):
+    name = "festival"
+    probability = 0.2 / 6
+    duration = (1, 1)
+    history = "A great festival was held in {} in {}"
+    
+    def eligible(self, table):
+        # Only prosperous kingdoms at peace celebrate
+        return super().eligible(table) & (table.prosperity >= 50) & ~table.active["war"]
+    
+    def on_start(self, world, event):
+        world.economy.adjust_stability(event["participants"][0], 3)
+
+
+@register_event
+class TradeBoom(EventHandler):
+    name = "trade_boom"
+    probability = 0.2 / 6
+    duration = (2, 6)
+    history = "Trade boomed in {} in {}"
+    
+    def eligible(self, table):
+        return super().eligible(table) & (table.stability >= 50) & ~table.active["war"]
+    
+    def on_tick(self, world, event):
+        world.economy.adjust_prosperity(world.locations[event["participants"][0]]["cities"], 2)
+
+
+@register_event
+class Famine(EventHandler):
+    name = "famine"
+    probability = 0.2 / 6
+    duration = (2, 4)
+    history = "Famine struck {} in {}"
+    
+    def eligible(self, table):
+        # Bountiful kingdoms have granaries to fall back on
+        return super().eligible(table) & (table.prosperity < 85)
+    
+    def on_start(self, world, event):
+        world.lod.scale_settlements(world.locations[event["participants"][0]]["villages"], 0.9)
+        # Ongoing stability and village losses are applied by SettlementEconomy while it lasts
+
+
+@register_event
+class ReligiousEvent(EventHandler):
+    name = "religious_event"
+    probability = 0.2 / 6
+    duration = (1, 2)
+    history = "A religious movement swept through {} in {}"
+    
+    def on_start(self, world, event):
+        # A revival can unite or divide the realm; intensity above 5 means unrest
+        world.economy.adjust_stability(event["participants"][0], 5 - event["intensity"])
+
+
+class WorldEventEngine:
+    """Rolls every registered event type each season against one shared kingdom table"""
+    
+    def __init__(self, handlers=None):
+        self.handlers = list((handlers or EVENT_HANDLERS).values())
+    
+    def step(self, world):
+        rng = world.event_rng
+        # One draw per handler decides which event types fire this season
+        firing = [handler for handler in self.handlers if rng.random() < handler.probability]
+        if not firing:
+            return []
+        
+        table = KingdomTable(world)
+        started = []
+        for handler in firing:
+            candidates = table.names[handler.eligible(table)].tolist()
+            if len(candidates) < handler.participants:
+                continue
+            event = self.start(world, handler, rng.sample(candidates, handler.participants))
+            # Later handlers this season see the kingdoms this one just claimed
+            for kingdom in event["participants"]:
+                table.active.setdefault(handler.name, np.zeros(len(table), dtype=bool))[table.index[kingdom]] = True
+            started.append(event)
+        return started
+    
+    def start(self, world, handler, participants):
+        rng = world.event_rng
+        event = {
+            "type": handler.name,
+            "participants": participants,
+            "duration": rng.randint(*handler.duration),  # Seasons
+            "intensity": rng.randint(1, 10),
+            "started": world.year,
+            "season": world.season,  # Lets a loaded save put the event back on the timeline
+            "next_tick": world.season + 1  # Season of its next on_tick, kept current by tick()
+        }
+        world.current_events.append(event)
+        self.schedule(world, handler, event, world.season, event["duration"])
+        handler.on_start(world, event)
+        if handler.history:
+            world.history.append(EVENT_TEMPLATES.record(handler.history, world.timestamp(),
+                                                        *participants, world.year))
+        return event
+    
+    def schedule(self, world, handler, event, start, duration, first_tick=None):
+        world.timeline.schedule_event(
+            event, start, duration,
+            on_tick=lambda e: self.tick(world, handler, e),
+            on_expire=lambda e: (handler.on_expire(world, e), world.end_event(e)),
+            first_tick=first_tick
+        )
+    
+    def tick(self, world, handler, event):
+        handler.on_tick(world, event)
+        event["next_tick"] = world.season + 1
+    
+    def resume(self, world, event):
+        """Schedule an event restored from a save for the seasons it has left, without restarting it"""
+        handler = next(handler for handler in self.handlers if handler.name == event["type"])
+        remaining = max(event["season"] + event["duration"] - world.season, 0)
+        # Ticks pick up at the season the saved world would have run next, not one after loading
+        self.schedule(world, handler, event, world.season, remaining, first_tick=event["next_tick"])
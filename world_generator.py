@@ -0,0 +1,138 @@
+import argparse
+import random
+import time
+import tracemalloc
+from spatial import kingdom_center, layout_kingdom
+from world_rng import RandomStreams
+
+SYLLABLES = ["ash", "bel", "bran", "cal", "dun", "el", "fen", "gar", "hal", "ith", "kel", "lor",
+             "mar", "nor", "oak", "pen", "quen", "ros", "sal", "tor", "ul", "val", "wen", "yar",
+             "bry", "cor", "dal", "eld", "fal", "grim", "hart", "iron"]
+KINGDOM_SUFFIXES = ["ia", "mark", "land", "reach", "moor", "shire"]
+CITY_SUFFIXES = ["haven", "port", "keep", "burg", "ford", "gate", "mouth", "stead"]
+VILLAGE_SUFFIXES = ["vale", "ton", "wick", "by", "ham", "dale", "field", "hill", "mere", "thorpe"]
+
+
+class NameSource:
+    """Unique place names from a counter, so huge worlds need no set of names already used
+    
+    Each number maps to exactly one syllable stem plus suffix; the seed only shuffles the
+    syllable and suffix order, which keeps names distinct while varying them between worlds.
+    """
+    
+    def __init__(self, rng, suffixes):
+        self.syllables = rng.sample(SYLLABLES, len(SYLLABLES))
+        self.suffixes = rng.sample(suffixes, len(suffixes))
+        self.count = 0
+    
+    def next(self):
+        number = self.count
+        self.count += 1
+        # Bijective base-N numeral, least significant syllable first so neighbours differ up front
+        base = len(self.syllables)
+        stem = self.syllables[number % base]
+        rest = number // base
+        # Offsetting the suffix by the first syllable keeps the mapping one-to-one but mixes suffixes
+        suffix = self.suffixes[(rest + number % base) % len(self.suffixes)]
+        number = rest // len(self.suffixes)
+        while number:
+            number -= 1
+            stem += self.syllables[number % base]
+            number //= base
+        return (stem + suffix).capitalize()
+
+
+class WorldGenerator:
+    """Seeded generator for worlds of any size, yielding World.locations entries one at a time"""
+    
+    def __init__(self, seed=None, kingdoms=2, cities_per_kingdom=(2, 5), villages_per_city=(1, 3)):
+        self.seed = seed
+        self.kingdoms = kingdoms
+        self.cities_per_kingdom = cities_per_kingdom  # Inclusive range per kingdom
+        self.villages_per_city = villages_per_city  # Inclusive range per city; sets rural density
+    
+    def generate(self):
+        """Yield (name, data) pairs: each kingdom, followed by its cities and villages"""
+        rng = random.Random(self.seed)
+        kingdom_names = NameSource(rng, KINGDOM_SUFFIXES)
+        city_names = NameSource(rng, CITY_SUFFIXES)
+        village_names = NameSource(rng, VILLAGE_SUFFIXES)
+        map_rng = RandomStreams(self.seed).spawn("map")  # Separate stream, so positions leave names unchanged
+        
+        for index in range(self.kingdoms):
+            kingdom = f"Kingdom of {kingdom_names.next()}"
+            cities = [city_names.next() for _ in range(rng.randint(*self.cities_per_kingdom))]
+            villages = [village_names.next()
+                        for _ in range(sum(rng.randint(*self.villages_per_city) for _ in cities))]
+            positions = {}
+            if cities:
+                positions = layout_kingdom(map_rng, kingdom_center(index, self.kingdoms, map_rng),
+                                           cities[0], cities, villages)
+            
+            yield kingdom, {
+                "type": "kingdom",
+                "ruler": None,
+                "capital": cities[0] if cities else None,
+                "cities": cities,
+                "villages": villages,
+                "prosperity": rng.randint(40, 80),
+                "stability": rng.randint(40, 85)
+            }
+            for city in cities:
+                yield city, {
+                    "type": "city",
+                    "kingdom": kingdom,
+                    "buildings": ["Castle", "Market", "Cathedral", "Blacksmith"],
+                    "population": rng.randint(2000, 8000),
+                    "prosperity": rng.randint(50, 90),
+                    "position": positions[city]
+                }
+            for village in villages:
+                yield village, {
+                    "type": "village",
+                    "kingdom": kingdom,
+                    "buildings": ["Tavern", "Mill", "Church", "Farms"],
+                    "population": rng.randint(100, 1000),
+                    "prosperity": rng.randint(30, 70),
+                    "position": positions[village]
+                }
+
+
+def measure(generator, materialize=False):
+    """Run a generator and return its size, elapsed time and peak traced memory"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    locations = {} if materialize else None
+    settlements = 0
+    for name, data in generator.generate():
+        if data["type"] != "kingdom":
+            settlements += 1
+        if materialize:
+            locations[name] = data
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"kingdoms": generator.kingdoms, "settlements": settlements, "elapsed": elapsed, "peak_bytes": peak}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate worlds of several sizes and report time and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 20, 200, 800], help="kingdom counts to generate")
+    parser.add_argument("--cities", type=int, nargs=2, default=[10, 30], help="cities per kingdom (min max)")
+    parser.add_argument("--villages", type=int, nargs=2, default=[2, 6], help="villages per city (min max)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--materialize", action="store_true", help="also keep every entry in a locations dict")
+    args = parser.parse_args(argv)
+    
+    results = []
+    for size in args.sizes:
+        generator = WorldGenerator(args.seed, size, tuple(args.cities), tuple(args.villages))
+        stats = measure(generator, args.materialize)
+        results.append(stats)
+        print(f"{stats['kingdoms']:>5} kingdoms  {stats['settlements']:>8} settlements  "
+              f"{stats['elapsed']:7.3f}s  peak {stats['peak_bytes'] / 1024 / 1024:8.2f} MiB")
+    return results
+
+
+if __name__ == "__main__":
+    main()
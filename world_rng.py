@@ -0,0 +1,47 @@
+import random
+import zlib
+import numpy as np
+
+
+class RandomStreams:
+    """Seedable root RNG for one world that hands out an independent stream per subsystem"""
+    
+    def __init__(self, seed=None):
+        # With no seed, fresh OS entropy is drawn; it is kept in self.seed so the run can be replayed
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.seed = self.seed_sequence.entropy
+        self._streams = {}
+        self._generators = {}
+    
+    def child_sequence(self, name):
+        # Keyed by a hash of the name, so adding a subsystem never shifts the others' streams
+        return np.random.SeedSequence(self.seed, spawn_key=(zlib.crc32(name.encode("utf-8")),))
+    
+    def stream(self, name):
+        """A random.Random for the named subsystem (same API as the random module)"""
+        if name not in self._streams:
+            self._streams[name] = self.spawn(name)
+        return self._streams[name]
+    
+    def spawn(self, name):
+        """A new, uncached random.Random that always starts from the same state for a given name"""
+        state = self.child_sequence(name).generate_state(4)
+        return random.Random(int.from_bytes(state.tobytes(), "little"))
+    
+    def generator(self, name):
+        """A NumPy Generator for the named subsystem's batched draws"""
+        if name not in self._generators:
+            self._generators[name] = np.random.default_rng(self.child_sequence(name))
+        return self._generators[name]
+    
+    def state(self):
+        """Positions of every stream handed out so far, for saving alongside the seed"""
+        return {"streams": {name: rng.getstate() for name, rng in self._streams.items()},
+                "generators": {name: rng.bit_generator.state for name, rng in self._generators.items()}}
+    
+    def restore(self, state):
+        # Inverse of state(); tuples in random.Random's state may have come back from the save as lists
+        for name, (version, internal, gauss) in state["streams"].items():
+            self.stream(name).setstate((version, tuple(internal), gauss))
+        for name, bit_state in state["generators"].items():
+            self.generator(name).bit_generator.state = bit_state